@@ -35,27 +35,17 @@ export function AdminDashboard({ user }: AdminDashboardProps) {
       setIsLoadingStats(true)
       setStatsError(null)
 
-      // Fetch all stats in parallel
-      const [usersResponse, playersResponse, staffResponse] = await Promise.all([
-        fetch('http://localhost:8000/total_users'),
-        fetch('http://localhost:8000/total_staff'),
-        fetch('http://localhost:8000/total_players')
-      ])
-
-      // Check if all requests succeeded
-      if (!usersResponse.ok || !playersResponse.ok || !staffResponse.ok) {
+      const response = await fetch('http://localhost:8000/dashboard/summary')
+      if (!response.ok) {
         throw new Error('Failed to fetch dashboard statistics')
       }
 
-      // Parse responses
-      const usersData = await usersResponse.json()
-      const playersData = await playersResponse.json()
-      const staffData = await staffResponse.json()
+      const { data } = await response.json()
 
       setStats({
-        totalUsers: usersData.total_count || usersData.data?.total_count || 0,
-        totalPlayers: playersData.total_staff || playersData.data?.total_staff || 0,
-        totalStaff: staffData.total_players || staffData.data?.total_players || 0
+        totalUsers: data?.total_users || 0,
+        totalPlayers: data?.players?.total || 0,
+        totalStaff: data?.staff?.total || 0
       })
     } catch (err) {
       console.error('[admin-dashboard] Error fetching stats:', err)
@@ -49,7 +49,7 @@ export function CoachDashboard({ user }: CoachDashboardProps) {
           setNextMatch(matchesRes.data[0] as Match)
         }
 
-        const playersRes = await apiGetAllPlayers()
+        const playersRes = await apiGetAllPlayers(['player_id', 'first_name', 'last_name', 'is_active', 'is_injured'])
         if (playersRes.data) {
           const players = playersRes.data as Player[]
           const available = players.filter(p => p.is_active && !p.is_injured).length
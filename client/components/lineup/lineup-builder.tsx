@@ -9,7 +9,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { SoccerPitch } from '@/components/lineup/soccer-pitch'
 import { PlayerList } from '@/components/lineup/player-list'
 import { Save, Download, RotateCcw, Loader2 } from 'lucide-react'
-import { apiGetAllPlayers, apiGetUpcomingFixtures, apiGetAllFormations, apiCreateLineup, apiGetAllLineups, apiGetLineupById } from '@/lib/api'
+import { apiGetAllPlayers, apiGetUpcomingFixtures, apiGetAllFormations, apiCreateLineup, apiGetAllLineups, apiGetLineupById, apiPhotoUrl } from '@/lib/api'
 import { Card } from '@/components/ui/card'
 import { useToast } from '@/components/ui/use-toast'
 
@@ -22,7 +22,7 @@ export interface Player {
   position: string
   availability: 'available' | 'doubtful' | 'injured'
   number: number
-  photo?: string
+  photo_url?: string
   photo_content_type?: string
 }
 
@@ -35,7 +35,7 @@ interface ApiPlayer {
   positions?: string
   is_active: boolean
   is_injured: boolean
-  photo?: string
+  photo_url?: string
   photo_content_type?: string
   photo_filename?: string
 }
@@ -168,7 +168,7 @@ export function LineupBuilder({ user }: { user: User }) {
             position: p.positions || 'N/A',
             availability: p.is_injured ? 'injured' : (p.is_active ? 'available' : 'doubtful'),
             number: p.player_id,
-            photo: p.photo,
+            photo_url: p.photo_url,
             photo_content_type: p.photo_content_type
           }))
           setPlayers(transformedPlayers)
@@ -517,9 +517,9 @@ export function LineupBuilder({ user }: { user: User }) {
                   onDragStart={(e) => handleDragStart(e, player)}
                   className="flex items-center gap-2 px-3 py-2 bg-secondary rounded-lg text-sm font-medium text-secondary-foreground cursor-move hover:bg-secondary/80 transition-colors"
                 >
-                  {player.photo ? (
+                  {player.photo_url ? (
                     <img
-                      src={`data:${player.photo_content_type};base64,${player.photo}`}
+                      src={apiPhotoUrl(player.photo_url, 'thumb')}
                       alt={player.name}
                       className="size-6 rounded object-cover"
                     />
@@ -1,6 +1,7 @@
 'use client'
 
 import { Player } from './lineup-builder'
+import { apiPhotoUrl } from '@/lib/api'
 
 interface PlayerListProps {
   players: Player[]
@@ -31,9 +32,9 @@ export function PlayerList({ players, onDragStart }: PlayerListProps) {
           <div className="flex items-center justify-between mb-2">
             <div className="flex items-center gap-2">
               <div className="size-8 rounded-lg bg-primary/10 flex items-center justify-center overflow-hidden">
-                {player.photo ? (
+                {player.photo_url ? (
                   <img
-                    src={`data:${player.photo_content_type};base64,${player.photo}`}
+                    src={apiPhotoUrl(player.photo_url, 'thumb')}
                     alt={player.name}
                     className="size-full object-cover object-top"
                   />
@@ -2,6 +2,7 @@
 
 import { PitchSlot, Player } from './lineup-builder'
 import { X } from 'lucide-react'
+import { apiPhotoUrl } from '@/lib/api'
 
 interface SoccerPitchProps {
   slots: PitchSlot[]
@@ -59,10 +60,10 @@ export function SoccerPitch({ slots, onDropOnSlot, onRemoveFromSlot, pitchBgClas
             {slot.player ? (
               <div className="relative group">
                 <div className="size-16 sm:size-20 bg-primary text-primary-foreground rounded-2xl border-2 border-white shadow-lg flex flex-col items-center justify-center cursor-move overflow-hidden relative">
-                  {slot.player.photo ? (
+                  {slot.player.photo_url ? (
                     <>
                       <img
-                        src={`data:${slot.player.photo_content_type};base64,${slot.player.photo}`}
+                        src={apiPhotoUrl(slot.player.photo_url, 'small')}
                         alt={slot.player.name}
                         className="size-full object-cover rounded-2xl object-top"
                       />
@@ -9,6 +9,7 @@ import { Card } from '@/components/ui/card'
 import { Search, Loader2, UserCircle2 } from 'lucide-react'
 import { UserRole } from '@/lib/auth'
 import { CreatePlayerDialog } from '@/components/players/create-player-dialog'
+import { apiGetAllPlayers, apiPhotoUrl } from '@/lib/api'
 
 interface Player {
   player_id: number
@@ -22,7 +23,7 @@ interface Player {
   transfer_value?: number
   contract_end_date?: string
   scouted_player: boolean
-  photo?: string
+  photo_url?: string
   photo_content_type?: string
 }
 
@@ -45,13 +46,9 @@ export function PlayerGrid({ userRole }: PlayerGridProps) {
   async function fetchPlayers() {
     try {
       setIsLoading(true)
-      const response = await fetch('http://localhost:8000/players')
-      if (!response.ok) {
-        throw new Error('Failed to fetch players')
-      }
-      const data = await response.json()
-      if (data.data) {
-        setPlayers(data.data)
+      const response = await apiGetAllPlayers(['player_id', 'first_name', 'middle_name', 'last_name', 'positions', 'is_active', 'is_injured', 'photo_url'])
+      if (response.data) {
+        setPlayers(response.data)
       }
     } catch (err) {
       console.error('[player-grid] Error fetching players:', err)
@@ -162,9 +159,9 @@ export function PlayerGrid({ userRole }: PlayerGridProps) {
               <Card className="p-6 hover:border-primary transition-colors cursor-pointer">
                 <div className="flex flex-col items-center text-center space-y-3">
                   <div className="size-20 bg-primary/10 flex items-center justify-center overflow-hidden rounded-lg">
-                    {player.photo ? (
+                    {player.photo_url ? (
                       <img
-                        src={`data:${player.photo_content_type};base64,${player.photo}`}
+                        src={apiPhotoUrl(player.photo_url, 'small')}
                         alt={`${player.first_name} ${player.last_name}`}
                         className="size-full object-cover object-top rounded-lg"
                       />
@@ -8,6 +8,7 @@ import { Card } from '@/components/ui/card'
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
 import { ArrowLeft, Loader2, Trash2 } from 'lucide-react'
 import { UserRole } from '@/lib/auth'
+import { apiPhotoUrl } from '@/lib/api'
 import {
   AlertDialog,
   AlertDialogAction,
@@ -42,6 +43,27 @@ interface PlayerStats {
   passing_accuracy: number
 }
 
+interface MatchTotals {
+  appearances: number
+  starts: number
+  minutes: number
+  goals: number
+  assists: number
+  shots_total: number
+  tackles: number
+  dribbles_attempted: number
+  fouls_committed: number
+  offsides: number
+  yellow_cards: number
+  red_cards: number
+  avg_passing_accuracy: number | null
+}
+
+interface SeasonTotals {
+  season: string | null
+  totals: MatchTotals
+}
+
 interface MedicalReport {
   med_report_id: number
   summary: string
@@ -64,7 +86,9 @@ interface Player {
   scouted_player: boolean
   medical_reports: MedicalReport[]
   match_stats: PlayerStats[]
-  photo?: string
+  season_totals: SeasonTotals[]
+  career_totals: MatchTotals | null
+  photo_url?: string
   photo_content_type?: string
   photo_filename?: string
   photo_size?: number
@@ -164,14 +188,13 @@ export function PlayerProfile({ playerId, userRole }: PlayerProfileProps) {
 
   const fullName = `${player.first_name} ${player.middle_name ? player.middle_name + ' ' : ''}${player.last_name}`
 
-  // Calculate stats
-  const totalAppearances = player.match_stats?.length || 0
-  const totalGoals = player.match_stats?.reduce((sum, s) => sum + (s.goals || 0), 0) || 0
-  const totalAssists = player.match_stats?.reduce((sum, s) => sum + (s.assists || 0), 0) || 0
-  const totalMinutes = player.match_stats?.reduce((sum, s) => sum + (s.minutes || 0), 0) || 0
-  const avgRating = totalAppearances > 0 ? 
-    (player.match_stats.reduce((sum, s) => sum + (s.passing_accuracy || 0), 0) / totalAppearances).toFixed(1) : 
-    'N/A'
+  // Totals are computed by the server (career_totals / season_totals)
+  const career = player.career_totals
+  const totalAppearances = career?.appearances || 0
+  const totalGoals = career?.goals || 0
+  const totalAssists = career?.assists || 0
+  const totalMinutes = career?.minutes || 0
+  const avgRating = career?.avg_passing_accuracy != null ? Number(career.avg_passing_accuracy).toFixed(1) : 'N/A'
 
   return (
     <div className="p-6 lg:p-8 space-y-6">
@@ -344,13 +367,13 @@ export function PlayerProfile({ playerId, userRole }: PlayerProfileProps) {
                 <div>
                   <p className="text-sm text-muted-foreground mb-2">Total Shots</p>
                   <p className="text-2xl font-bold text-foreground">
-                    {player.match_stats.reduce((sum, s) => sum + (s.shots_total || 0), 0)}
+                    {career?.shots_total || 0}
                   </p>
                 </div>
                 <div>
                   <p className="text-sm text-muted-foreground mb-2">Total Tackles</p>
                   <p className="text-2xl font-bold text-foreground">
-                    {player.match_stats.reduce((sum, s) => sum + (s.tackles || 0), 0)}
+                    {career?.tackles || 0}
                   </p>
                 </div>
               </div>
@@ -429,11 +452,11 @@ export function PlayerProfile({ playerId, userRole }: PlayerProfileProps) {
         <TabsContent value="photos">
           <Card className="p-6">
             <h3 className="font-semibold text-foreground mb-4">Player Photos</h3>
-            {player.photo ? (
+            {player.photo_url ? (
               <div className="space-y-4">
                 <div className="flex justify-center">
                   <img
-                    src={`data:${player.photo_content_type};base64,${player.photo}`}
+                    src={apiPhotoUrl(player.photo_url, 'medium')}
                     alt={player.photo_filename || 'Player photo'}
                     className="max-w-full h-auto rounded-lg shadow-md object-top"
                   />
@@ -36,7 +36,7 @@ export function RosterTable({ userRole }: RosterTableProps) {
     async function fetchPlayers() {
       try {
         setIsLoading(true)
-        const response = await apiGetAllPlayers()
+        const response = await apiGetAllPlayers(['player_id', 'first_name', 'middle_name', 'last_name', 'positions', 'is_active', 'is_injured'])
         if (response.data) {
           setPlayers(response.data)
         }
@@ -4,6 +4,7 @@ interface ApiResponse<T = any> {
   status: string
   data?: T
   count?: number
+  next_cursor?: string | null
   error?: string
 }
 
@@ -32,12 +33,27 @@ async function apiFetch<T = any>(
   }
 }
 
+// List endpoints are keyset-paginated; follow next_cursor until the last page
+async function apiFetchAllPages<T = any>(endpoint: string): Promise<ApiResponse<T[]>> {
+  const sep = endpoint.includes('?') ? '&' : '?'
+  const data: T[] = []
+  let cursor: string | null | undefined = null
+  let page: ApiResponse<T[]>
+  do {
+    const query = cursor ? `${sep}limit=1000&cursor=${encodeURIComponent(cursor)}` : `${sep}limit=1000`
+    page = await apiFetch<T[]>(`${endpoint}${query}`)
+    data.push(...(page.data || []))
+    cursor = page.next_cursor
+  } while (cursor)
+  return { ...page, data, count: data.length, next_cursor: null }
+}
+
 // ============================================================================
 // STAFF ENDPOINTS
 // ============================================================================
 
 export async function apiGetAllStaff() {
-  return apiFetch('/staff')
+  return apiFetchAllPages('/staff')
 }
 
 export async function apiGetStaffById(staffId: number) {
@@ -62,8 +78,9 @@ export async function apiUpdateStaff(staffId: number, data: any) {
 // PLAYER ENDPOINTS
 // ============================================================================
 
-export async function apiGetAllPlayers() {
-  return apiFetch('/players')
+// `fields` limits the columns the server selects and returns (see ?fields= on /players)
+export async function apiGetAllPlayers(fields?: string[]) {
+  return apiFetchAllPages(fields?.length ? `/players?fields=${fields.join(',')}` : '/players')
 }
 
 export async function apiGetPlayerById(playerId: number) {
@@ -81,6 +98,15 @@ export async function apiCreatePlayer(data: any) {
   })
 }
 
+// Player photos are served as binary from /player/{id}/photo; list endpoints only return the path
+export type PhotoSize = 'thumb' | 'small' | 'medium' | 'original'
+
+export function apiPhotoUrl(photoUrl: string, size?: PhotoSize) {
+  if (!size || size === 'original') return `${API_BASE_URL}${photoUrl}`
+  const sep = photoUrl.includes('?') ? '&' : '?'
+  return `${API_BASE_URL}${photoUrl}${sep}size=${size}`
+}
+
 export async function apiCreatePlayerWithPhoto(formData: FormData) {
   // Special case: multipart/form-data
   const response = await fetch(`${API_BASE_URL}/player/create-with-photo`, {
@@ -126,7 +152,7 @@ export async function apiSetPlayerHealed(playerId: number) {
 // ============================================================================
 
 export async function apiGetAllMatches() {
-  return apiFetch('/matches')
+  return apiFetchAllPages('/matches')
 }
 
 export async function apiGetMatchById(matchId: number) {
@@ -134,7 +160,7 @@ export async function apiGetMatchById(matchId: number) {
 }
 
 export async function apiGetFixtures() {
-  return apiFetch('/fixtures')
+  return apiFetchAllPages('/fixtures')
 }
 
 export async function apiGetUpcomingFixtures() {
@@ -176,7 +202,7 @@ export async function apiDeleteMatch(matchId: number) {
 // ============================================================================
 
 export async function apiGetAllCoaches() {
-  return apiFetch('/coaches')
+  return apiFetchAllPages('/coaches')
 }
 
 export async function apiCreateCoach(data: any) {
@@ -191,7 +217,7 @@ export async function apiCreateCoach(data: any) {
 // ============================================================================
 
 export async function apiGetAllScouts() {
-  return apiFetch('/scouts')
+  return apiFetchAllPages('/scouts')
 }
 
 export async function apiCreateScout(data: any) {
@@ -217,7 +243,7 @@ export async function apiCreateMedicalStaff(data: any) {
 }
 
 export async function apiGetAllMedicalReports() {
-  return apiFetch('/medical_reports')
+  return apiFetchAllPages('/medical_reports')
 }
 
 export async function apiGetMedicalReportsByPlayer(playerId: number) {
@@ -247,7 +273,7 @@ export async function apiCreateFormation(data: any) {
 }
 
 export async function apiGetAllLineups() {
-  return apiFetch('/lineups')
+  return apiFetchAllPages('/lineups')
 }
 
 export async function apiGetLineupById(lineupId: number) {
@@ -19,7 +19,8 @@ CREATE TABLE IF NOT EXISTS staff (
   salary DECIMAL(10,2) NOT NULL,
   age INT NOT NULL,
   date_hired DATE NOT NULL DEFAULT (CURDATE()),
-  staff_type VARCHAR(50) NOT NULL
+  staff_type VARCHAR(50) NOT NULL,
+  INDEX idx_staff_name (last_name, first_name, staff_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS coach (
@@ -58,12 +59,27 @@ CREATE TABLE IF NOT EXISTS player (
   transfer_value DECIMAL(10,2),
   contract_end_date DATE NOT NULL,
   scouted_player BOOLEAN DEFAULT FALSE,
-  photo LONGBLOB,
   photo_content_type VARCHAR(100),
   photo_filename VARCHAR(255),
   photo_size BIGINT,
   photo_uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-  UNIQUE KEY uq_player_identity (first_name, last_name, contract_end_date)
+  photo_sha256 CHAR(64),
+  UNIQUE KEY uq_player_identity (first_name, last_name, contract_end_date),
+  INDEX idx_player_name (last_name, first_name, player_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS player_photo_variant (
+  player_id INT NOT NULL,
+  variant VARCHAR(16) NOT NULL,
+  format VARCHAR(8) NOT NULL,
+  content_type VARCHAR(100) NOT NULL,
+  width INT NOT NULL,
+  height INT NOT NULL,
+  byte_size INT NOT NULL,
+  sha256 CHAR(64) NOT NULL,
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (player_id, variant, format),
+  CONSTRAINT fk_photo_variant_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS medical_report (
@@ -74,7 +90,8 @@ CREATE TABLE IF NOT EXISTS medical_report (
   treatment TEXT,
   severity_of_injury VARCHAR(50),
   CONSTRAINT fk_med_report_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE,
-  INDEX idx_medrep_player (player_id)
+  INDEX idx_medrep_player (player_id),
+  INDEX idx_medrep_date (report_date, med_report_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS medical_condition (
@@ -94,7 +111,8 @@ CREATE TABLE IF NOT EXISTS match_table (
   match_time TIME,
   opponent_team VARCHAR(100),
   match_date DATE,
-  result VARCHAR(50)
+  result VARCHAR(50),
+  INDEX idx_match_date_time (match_date, match_time, match_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 CREATE TABLE IF NOT EXISTS scouting_report (
@@ -137,11 +155,40 @@ CREATE TABLE IF NOT EXISTS player_match_stats (
   assists INT DEFAULT 0,
   goals INT DEFAULT 0,
   passing_accuracy DECIMAL(5,2) DEFAULT 0,
+  INDEX idx_pms_player_match (player_id, match_id),
   CONSTRAINT fk_pms_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE,
   CONSTRAINT fk_pms_match FOREIGN KEY (match_id) REFERENCES match_table(match_id) ON DELETE CASCADE,
   CONSTRAINT fk_pms_team FOREIGN KEY (team_id) REFERENCES team(team_id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+CREATE TABLE IF NOT EXISTS player_season_stats (
+  player_id INT NOT NULL,
+  season_start_year SMALLINT NOT NULL,
+  appearances INT NOT NULL DEFAULT 0,
+  starts INT NOT NULL DEFAULT 0,
+  minutes INT NOT NULL DEFAULT 0,
+  goals INT NOT NULL DEFAULT 0,
+  assists INT NOT NULL DEFAULT 0,
+  shots_total INT NOT NULL DEFAULT 0,
+  tackles INT NOT NULL DEFAULT 0,
+  dribbles_attempted INT NOT NULL DEFAULT 0,
+  fouls_committed INT NOT NULL DEFAULT 0,
+  offsides INT NOT NULL DEFAULT 0,
+  yellow_cards INT NOT NULL DEFAULT 0,
+  red_cards INT NOT NULL DEFAULT 0,
+  passing_accuracy_sum DECIMAL(12,2) NOT NULL DEFAULT 0,
+  passing_accuracy_count INT NOT NULL DEFAULT 0,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (player_id, season_start_year),
+  CONSTRAINT fk_pss_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS dashboard_counter (
+  name VARCHAR(100) PRIMARY KEY,
+  value BIGINT NOT NULL DEFAULT 0,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- View
 CREATE OR REPLACE VIEW vw_player_medical_summary AS
 SELECT
@@ -290,35 +337,35 @@ VALUES (@med_id, 'Head of Medical', 'UEFA Certified', 25)
 
 -- 23 Manchester United players (2024-2025 squad, sample salaries/values)
 INSERT INTO player (first_name, middle_name, last_name, salary, positions, is_active, is_injured, transfer_value, contract_end_date, scouted_player,
-    photo, photo_content_type, photo_filename, photo_size, photo_uploaded_at
+    photo_content_type, photo_filename, photo_size, photo_uploaded_at
 ) VALUES
-('Andre', NULL, 'Onana', 7000000.00, 'GK', 1, 0, 35000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Onana.png', NULL, CURRENT_TIMESTAMP),
-('Altay', NULL, 'Bayindir', 3000000.00, 'GK', 1, 0, 8000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Bayindir.png', NULL, CURRENT_TIMESTAMP),
-('Tom', NULL, 'Heaton', 1500000.00, 'GK', 1, 0, 1000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Heaton.png', NULL, CURRENT_TIMESTAMP),
-
-('Diogo', NULL, 'Dalot', 4000000.00, 'RB', 1, 0, 25000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Dalot.png', NULL, CURRENT_TIMESTAMP),
-('Aaron', NULL, 'Wan-Bissaka', 4000000.00, 'RB', 1, 0, 20000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Wan-Bissaka.png', NULL, CURRENT_TIMESTAMP),
-('Raphael', NULL, 'Varane', 10000000.00, 'CB', 1, 0, 25000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Varane.png', NULL, CURRENT_TIMESTAMP),
-('Lisandro', NULL, 'Martinez', 8000000.00, 'CB', 1, 0, 40000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Martinez.png', NULL, CURRENT_TIMESTAMP),
-('Leny', NULL, 'Yoro', 6000000.00, 'CB', 1, 0, 35000000.00, '2029-06-30', 0, NULL, 'image/png', 'player_images/Yoro.png', NULL, CURRENT_TIMESTAMP),
-('Harry', NULL, 'Maguire', 9000000.00, 'CB', 1, 0, 15000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Maguire.png', NULL, CURRENT_TIMESTAMP),
-('Jonny', NULL, 'Evans', 2000000.00, 'CB', 1, 0, 1000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Evans.png', NULL, CURRENT_TIMESTAMP),
-('Luke', NULL, 'Shaw', 7000000.00, 'LB', 1, 1, 25000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Shaw.png', NULL, CURRENT_TIMESTAMP),
-('Noussair', NULL, 'Mazraoui', 4000000.00, 'LB,RB', 1, 0, 25000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Mazraoui.png', NULL, CURRENT_TIMESTAMP),
-
-('Casemiro', NULL, 'Casemiro', 12000000.00, 'CDM', 1, 0, 30000000.00, '2026-06-30', 0, NULL, 'image/png', 'player_images/Casemiro.png', NULL, CURRENT_TIMESTAMP),
-('Kobbie', NULL, 'Mainoo', 1000000.00, 'CM', 1, 0, 25000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Mainoo.png', NULL, CURRENT_TIMESTAMP),
-('Scott', NULL, 'McTominay', 4000000.00, 'CM', 1, 0, 18000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/McTominay.png', NULL, CURRENT_TIMESTAMP),
-('Christian', NULL, 'Eriksen', 6000000.00, 'CM', 1, 0, 8000000.00, '2025-06-30', 0, NULL, 'image/png', 'player_images/Eriksen.png', NULL, CURRENT_TIMESTAMP),
-('Bruno', NULL, 'Fernandes', 12000000.00, 'CAM', 1, 0, 70000000.00, '2026-06-30', 0, NULL, 'image/png', 'player_images/Fernandes.png', NULL, CURRENT_TIMESTAMP),
-('Mason', NULL, 'Mount', 7000000.00, 'CM', 1, 0, 50000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Mount.png', NULL, CURRENT_TIMESTAMP),
-
-('Marcus', NULL, 'Rashford', 10000000.00, 'LW', 1, 0, 80000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Rashford.png', NULL, CURRENT_TIMESTAMP),
-('Alejandro', NULL, 'Garnacho', 2000000.00, 'LW', 1, 0, 60000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Garnacho.png', NULL, CURRENT_TIMESTAMP),
-('Antony', NULL, 'Antony', 8000000.00, 'RW', 1, 0, 40000000.00, '2027-06-30', 0, NULL, 'image/png', 'player_images/Antony.png', NULL, CURRENT_TIMESTAMP),
-('Jadon', NULL, 'Sancho', 8000000.00, 'RW', 1, 0, 35000000.00, '2026-06-30', 0, NULL, 'image/png', 'player_images/Sancho.png', NULL, CURRENT_TIMESTAMP),
-('Rasmus', NULL, 'Hojlund', 6000000.00, 'ST', 1, 0, 50000000.00, '2028-06-30', 0, NULL, 'image/png', 'player_images/Hojlund.png', NULL, CURRENT_TIMESTAMP),
-('Anthony', NULL, 'Martial', 8000000.00, 'ST', 1, 0, 12000000.00, '2024-06-30', 0, NULL, 'image/png', 'player_images/Martial.png', NULL, CURRENT_TIMESTAMP);
+('Andre', NULL, 'Onana', 7000000.00, 'GK', 1, 0, 35000000.00, '2028-06-30', 0, 'image/png', 'player_images/Onana.png', NULL, CURRENT_TIMESTAMP),
+('Altay', NULL, 'Bayindir', 3000000.00, 'GK', 1, 0, 8000000.00, '2027-06-30', 0, 'image/png', 'player_images/Bayindir.png', NULL, CURRENT_TIMESTAMP),
+('Tom', NULL, 'Heaton', 1500000.00, 'GK', 1, 0, 1000000.00, '2025-06-30', 0, 'image/png', 'player_images/Heaton.png', NULL, CURRENT_TIMESTAMP),
+
+('Diogo', NULL, 'Dalot', 4000000.00, 'RB', 1, 0, 25000000.00, '2028-06-30', 0, 'image/png', 'player_images/Dalot.png', NULL, CURRENT_TIMESTAMP),
+('Aaron', NULL, 'Wan-Bissaka', 4000000.00, 'RB', 1, 0, 20000000.00, '2025-06-30', 0, 'image/png', 'player_images/Wan-Bissaka.png', NULL, CURRENT_TIMESTAMP),
+('Raphael', NULL, 'Varane', 10000000.00, 'CB', 1, 0, 25000000.00, '2025-06-30', 0, 'image/png', 'player_images/Varane.png', NULL, CURRENT_TIMESTAMP),
+('Lisandro', NULL, 'Martinez', 8000000.00, 'CB', 1, 0, 40000000.00, '2027-06-30', 0, 'image/png', 'player_images/Martinez.png', NULL, CURRENT_TIMESTAMP),
+('Leny', NULL, 'Yoro', 6000000.00, 'CB', 1, 0, 35000000.00, '2029-06-30', 0, 'image/png', 'player_images/Yoro.png', NULL, CURRENT_TIMESTAMP),
+('Harry', NULL, 'Maguire', 9000000.00, 'CB', 1, 0, 15000000.00, '2025-06-30', 0, 'image/png', 'player_images/Maguire.png', NULL, CURRENT_TIMESTAMP),
+('Jonny', NULL, 'Evans', 2000000.00, 'CB', 1, 0, 1000000.00, '2025-06-30', 0, 'image/png', 'player_images/Evans.png', NULL, CURRENT_TIMESTAMP),
+('Luke', NULL, 'Shaw', 7000000.00, 'LB', 1, 1, 25000000.00, '2027-06-30', 0, 'image/png', 'player_images/Shaw.png', NULL, CURRENT_TIMESTAMP),
+('Noussair', NULL, 'Mazraoui', 4000000.00, 'LB,RB', 1, 0, 25000000.00, '2027-06-30', 0, 'image/png', 'player_images/Mazraoui.png', NULL, CURRENT_TIMESTAMP),
+
+('Casemiro', NULL, 'Casemiro', 12000000.00, 'CDM', 1, 0, 30000000.00, '2026-06-30', 0, 'image/png', 'player_images/Casemiro.png', NULL, CURRENT_TIMESTAMP),
+('Kobbie', NULL, 'Mainoo', 1000000.00, 'CM', 1, 0, 25000000.00, '2027-06-30', 0, 'image/png', 'player_images/Mainoo.png', NULL, CURRENT_TIMESTAMP),
+('Scott', NULL, 'McTominay', 4000000.00, 'CM', 1, 0, 18000000.00, '2025-06-30', 0, 'image/png', 'player_images/McTominay.png', NULL, CURRENT_TIMESTAMP),
+('Christian', NULL, 'Eriksen', 6000000.00, 'CM', 1, 0, 8000000.00, '2025-06-30', 0, 'image/png', 'player_images/Eriksen.png', NULL, CURRENT_TIMESTAMP),
+('Bruno', NULL, 'Fernandes', 12000000.00, 'CAM', 1, 0, 70000000.00, '2026-06-30', 0, 'image/png', 'player_images/Fernandes.png', NULL, CURRENT_TIMESTAMP),
+('Mason', NULL, 'Mount', 7000000.00, 'CM', 1, 0, 50000000.00, '2028-06-30', 0, 'image/png', 'player_images/Mount.png', NULL, CURRENT_TIMESTAMP),
+
+('Marcus', NULL, 'Rashford', 10000000.00, 'LW', 1, 0, 80000000.00, '2028-06-30', 0, 'image/png', 'player_images/Rashford.png', NULL, CURRENT_TIMESTAMP),
+('Alejandro', NULL, 'Garnacho', 2000000.00, 'LW', 1, 0, 60000000.00, '2028-06-30', 0, 'image/png', 'player_images/Garnacho.png', NULL, CURRENT_TIMESTAMP),
+('Antony', NULL, 'Antony', 8000000.00, 'RW', 1, 0, 40000000.00, '2027-06-30', 0, 'image/png', 'player_images/Antony.png', NULL, CURRENT_TIMESTAMP),
+('Jadon', NULL, 'Sancho', 8000000.00, 'RW', 1, 0, 35000000.00, '2026-06-30', 0, 'image/png', 'player_images/Sancho.png', NULL, CURRENT_TIMESTAMP),
+('Rasmus', NULL, 'Hojlund', 6000000.00, 'ST', 1, 0, 50000000.00, '2028-06-30', 0, 'image/png', 'player_images/Hojlund.png', NULL, CURRENT_TIMESTAMP),
+('Anthony', NULL, 'Martial', 8000000.00, 'ST', 1, 0, 12000000.00, '2024-06-30', 0, 'image/png', 'player_images/Martial.png', NULL, CURRENT_TIMESTAMP);
 
 -- Medical report for Luke Shaw (injured)
 INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
@@ -354,6 +401,35 @@ INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, rep
 VALUES (@scout_id, 'Rasmus Hojlund', (SELECT player_id FROM player WHERE last_name='Hojlund' LIMIT 1), '2024-08-01', 'Strong, fast striker with good finishing')
   ON DUPLICATE KEY UPDATE report_id = LAST_INSERT_ID(report_id), report_desc = VALUES(report_desc);
 
+-- Dashboard counters (same as counters.rebuild())
+DELETE FROM dashboard_counter;
+INSERT INTO dashboard_counter (name, value)
+SELECT 'staff_total', COUNT(*) FROM staff
+UNION ALL SELECT 'scouts_total', COUNT(*) FROM scout
+UNION ALL SELECT 'players_total', COUNT(*) FROM player
+UNION ALL SELECT 'players_active', COALESCE(SUM(is_active), 0) FROM player
+UNION ALL SELECT 'players_injured', COALESCE(SUM(is_injured), 0) FROM player
+UNION ALL SELECT 'medical_reports_total', COUNT(*) FROM medical_report
+UNION ALL SELECT CONCAT('staff_type:', staff_type), COUNT(*) FROM staff GROUP BY staff_type;
+
+-- Season totals (same as season_stats.rebuild())
+DELETE FROM player_season_stats;
+INSERT INTO player_season_stats (player_id, season_start_year, appearances, starts, minutes, goals, assists,
+  shots_total, tackles, dribbles_attempted, fouls_committed, offsides, yellow_cards, red_cards,
+  passing_accuracy_sum, passing_accuracy_count)
+SELECT
+  pms.player_id,
+  COALESCE(YEAR(m.match_date) - (MONTH(m.match_date) < 8), 0) AS season_start_year,
+  COUNT(*), COALESCE(SUM(pms.started), 0), COALESCE(SUM(pms.minutes), 0), COALESCE(SUM(pms.goals), 0),
+  COALESCE(SUM(pms.assists), 0), COALESCE(SUM(pms.shots_total), 0), COALESCE(SUM(pms.tackles), 0),
+  COALESCE(SUM(pms.dribbles_attempted), 0), COALESCE(SUM(pms.fouls_committed), 0), COALESCE(SUM(pms.offsides), 0),
+  COALESCE(SUM(pms.yellow_cards), 0), COALESCE(SUM(pms.red_cards), 0),
+  COALESCE(SUM(pms.passing_accuracy), 0), COUNT(pms.passing_accuracy)
+FROM player_match_stats pms
+LEFT JOIN match_table m ON m.match_id = pms.match_id
+WHERE pms.player_id IS NOT NULL
+GROUP BY pms.player_id, season_start_year;
+
 -- Quick tests
 SELECT '--- Teams ---' AS info; SELECT * FROM team;
 SELECT '--- Staff ---' AS info; SELECT staff_id, first_name, last_name, email, staff_type FROM staff;
@@ -3,7 +3,13 @@ from mysql.connector import Error
 import os
 import time
 import dotenv
-dotenv.load_dotenv()    
+dotenv.load_dotenv()    # before the project imports, which read their settings when imported
+from blob_store import get_blob_store
+from image_pipeline import generate_variants, store_variants
+import counters
+import seed_engine
+import migrations
+import season_stats
 
 
 for _ in range(10):
@@ -100,7 +106,7 @@ cursor.execute("""
     );
     """)
 
-# Player table now includes LONGBLOB columns for a single profile photo and metadata
+# Player photo bytes live in the content-addressed blob store (blob_store.py); the row keeps the hash and metadata
 cursor.execute("""
 create table if not exists player 
 (
@@ -116,27 +122,38 @@ create table if not exists player
     contract_end_date DATE NOT NULL,
     scouted_player BOOLEAN DEFAULT FALSE,
     team_id INT NULL,
-    -- profile photo stored in the DB (LONGBLOB): binary, content type, filename, size and timestamp
-    photo LONGBLOB,
+    -- profile photo metadata: content type, filename, size and timestamp
     photo_content_type VARCHAR(100),
     photo_filename VARCHAR(255),
     photo_size BIGINT,
     photo_uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    -- sha256 of the photo bytes: blob store key, and the ETag / cache version of GET /player/{id}/photo
+    photo_sha256 CHAR(64),
     CONSTRAINT fk_player_team FOREIGN KEY (team_id) REFERENCES team(team_id) ON DELETE SET NULL ON UPDATE CASCADE,
     INDEX idx_player_team (team_id)
 );
 """)
 #scouted_player indicates if the player is being scouted and not on team
 
-# Alter existing table columns to support larger values if table already exists
+# Resized / re-encoded copies of each player photo (see image_pipeline.py)
 cursor.execute("""
-ALTER TABLE player 
-MODIFY COLUMN salary DECIMAL(12,2) NOT NULL,
-MODIFY COLUMN transfer_value DECIMAL(12,2)
+create table if not exists player_photo_variant
+(
+    player_id INT NOT NULL,
+    variant VARCHAR(16) NOT NULL,        -- thumb, small, medium, original
+    format VARCHAR(8) NOT NULL,          -- webp, jpeg, png
+    content_type VARCHAR(100) NOT NULL,
+    width INT NOT NULL,
+    height INT NOT NULL,
+    byte_size INT NOT NULL,
+    sha256 CHAR(64) NOT NULL,            -- blob store key
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (player_id, variant, format),
+    CONSTRAINT fk_photo_variant_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE
+);
 """)
 
 
-
 cursor.execute("""
 create table if not exists medical_report 
 (
@@ -247,6 +264,42 @@ create table if not exists player_match_stats
 );
 """)
 
+# Season totals of player_match_stats, kept current by the stat-line write paths (see season_stats.py)
+cursor.execute("""
+create table if not exists player_season_stats
+(
+    player_id int not null,
+    season_start_year smallint not null,   -- 2024 = the 2024/25 season (August to July), 0 = undated matches
+    appearances int not null default 0,
+    starts int not null default 0,
+    minutes int not null default 0,
+    goals int not null default 0,
+    assists int not null default 0,
+    shots_total int not null default 0,
+    tackles int not null default 0,
+    dribbles_attempted int not null default 0,
+    fouls_committed int not null default 0,
+    offsides int not null default 0,
+    yellow_cards int not null default 0,
+    red_cards int not null default 0,
+    passing_accuracy_sum DECIMAL(12,2) not null default 0,
+    passing_accuracy_count int not null default 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (player_id, season_start_year),
+    CONSTRAINT fk_pss_player FOREIGN KEY (player_id) REFERENCES player(player_id) ON DELETE CASCADE
+);
+""")
+
+# Row counts for GET /dashboard/summary, kept current by the write paths (see counters.py)
+cursor.execute("""
+create table if not exists dashboard_counter
+(
+    name VARCHAR(100) PRIMARY KEY,       -- e.g. players_injured, staff_type:Coach
+    value BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+""")
+
 #quick convenience view for medical staff to see player medical summaries
 cursor.execute("""
     create or replace view vw_player_medical_summary as
@@ -368,10 +421,17 @@ cursor.execute("""
 """)
 
 
+# Column changes and indexes for existing databases are versioned migrations (see migrations.py);
+# only the ones this database hasn't recorded yet run
+migrations.migrate(mydb)
 
-#someone test for stability and performance
 
-# Insert sample players with images
+# Sample data. Each table goes in with one batched INSERT inside its own transaction
+# (seed_engine.py), and the photos are read and resized in parallel.
+mydb.commit()
+print("Seeding sample data")
+seed_started = time.perf_counter()
+
 players_data = [
     ('Diogo', None, 'Dalot', 4000000.00, 'RB', 1, 0, 25000000.00, '2028-06-30', 0, 'player_images/Dalot.png'),
     ('Antony', None, 'Matheus dos Santos', 35000000.00, 'RW', 1, 0, 60000000.00, '2027-06-30', 0, 'player_images/Antony.png'),
@@ -401,118 +461,63 @@ players_data = [
     ('Andre', None, 'Onana', 15000000.00, 'GK', 1, 0, 30000000.00, '2027-06-30', 0, 'player_images/Onana.png')
 ]
 
-for first_name, middle_name, last_name, salary, positions, is_active, is_injured, transfer_value, contract_end_date, scouted_player, photo_filename in players_data:
-    photo_data = None
-    photo_content_type = 'image/png'
-    photo_size = None
-    full_path = os.path.join(os.path.dirname(__file__), photo_filename)
-    if os.path.exists(full_path):
-        with open(full_path, 'rb') as f:
-            photo_data = f.read()
-        photo_size = len(photo_data)
-        print(f"Read image file: {full_path}, size: {photo_size} bytes")
-    else:
-        print(f"Image file not found: {full_path}")
-    
-    cursor.execute("""
+photo_store = get_blob_store()
+with seed_engine.timed("player photos"):
+    photo_paths = [os.path.join(os.path.dirname(__file__), row[-1]) for row in players_data]
+    photos = seed_engine.read_files(photo_paths)
+    for path, photo in zip(photo_paths, photos):
+        if photo is None:
+            print(f"Image file not found: {path}")
+    # Sancho.png is seeded twice; the store keeps a single copy
+    photo_hashes = seed_engine.parallel_map(lambda photo: photo_store.put(photo) if photo else None, photos)
+    photo_variants = seed_engine.parallel_map(lambda photo: generate_variants(photo) if photo else [], photos)
+
+with seed_engine.phase(mydb, "player") as p:
+    player_ids = p.insert("""
         INSERT INTO player (first_name, middle_name, last_name, salary, positions, is_active, is_injured, transfer_value, contract_end_date, scouted_player,
-            photo, photo_content_type, photo_filename, photo_size, photo_uploaded_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-    """, (first_name, middle_name, last_name, salary, positions, is_active, is_injured, transfer_value, contract_end_date, scouted_player,
-          photo_data, photo_content_type, photo_filename, photo_size))
-
-
-
-cursor.execute("""
-INSERT INTO team (name, level) VALUES ('Lions', 'Professional')
-  ON DUPLICATE KEY UPDATE team_id = LAST_INSERT_ID(team_id);
-""")
-cursor.execute("SET @team_lions_id = LAST_INSERT_ID();")
-
-cursor.execute("""
-INSERT INTO team (name, level) VALUES ('Tigers', 'Development')
-  ON DUPLICATE KEY UPDATE team_id = LAST_INSERT_ID(team_id);
-""")
-cursor.execute("SET @team_tigers_id = LAST_INSERT_ID();")
-
-
-# Could I have made this in a loop yes but I am tired
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Season Opener', 'Main Stadium', '15:00:00', 'Rivals FC', CURDATE(), '2-1')
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-cursor.execute("SET @match_id = LAST_INSERT_ID();")
-
-# Past matches (3)
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 1', 'Old Trafford', '17:30:00', 'Liverpool FC', DATE_SUB(CURDATE(), INTERVAL 30 DAY), '1-3')
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 2', 'Etihad Stadium', '16:00:00', 'Manchester City', DATE_SUB(CURDATE(), INTERVAL 23 DAY), '0-2')
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('FA Cup Round 3', 'Wembley Stadium', '15:00:00', 'Chelsea FC', DATE_SUB(CURDATE(), INTERVAL 16 DAY), '2-1')
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-# Future matches (7)
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 15', 'Anfield', '20:00:00', 'Liverpool FC', DATE_ADD(CURDATE(), INTERVAL 7 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 16', 'Stamford Bridge', '17:30:00', 'Chelsea FC', DATE_ADD(CURDATE(), INTERVAL 14 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 17', 'Camp Nou', '21:00:00', 'FC Barcelona', DATE_ADD(CURDATE(), INTERVAL 21 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 18', 'Santiago Bernabeu', '19:00:00', 'Real Madrid', DATE_ADD(CURDATE(), INTERVAL 28 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 19', 'Allianz Arena', '18:30:00', 'Bayern Munich', DATE_ADD(CURDATE(), INTERVAL 35 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 20', 'Parc des Princes', '21:00:00', 'Paris Saint-Germain', DATE_ADD(CURDATE(), INTERVAL 42 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
-
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Champions League Quarter Final', 'San Siro', '20:45:00', 'AC Milan', DATE_ADD(CURDATE(), INTERVAL 49 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
+            photo_content_type, photo_filename, photo_size, photo_uploaded_at, photo_sha256)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP, %s)
+    """, [
+        (*row[:-1], 'image/png', row[-1], len(photo) if photo else None, sha256)
+        for row, photo, sha256 in zip(players_data, photos, photo_hashes)
+    ], ids=True)
+
+with seed_engine.phase(mydb, "player_photo_variant") as p:
+    for player_id, variants in zip(player_ids, photo_variants):
+        if variants:
+            store_variants(p.cursor, player_id, variants, store=photo_store)
+            p.rows += len(variants)
+
+with seed_engine.phase(mydb, "team") as p:
+    p.insert("INSERT IGNORE INTO team (name, level) VALUES (%s, %s)", [
+        ('Lions', 'Professional'),
+        ('Tigers', 'Development'),
+    ])
+
+# Dates are relative to today: the first four have been played, the rest are upcoming
+matches_data = [
+    ('Season Opener', 'Main Stadium', '15:00:00', 'Rivals FC', 0, '2-1'),
+    ('Premier League Round 1', 'Old Trafford', '17:30:00', 'Liverpool FC', -30, '1-3'),
+    ('Premier League Round 2', 'Etihad Stadium', '16:00:00', 'Manchester City', -23, '0-2'),
+    ('FA Cup Round 3', 'Wembley Stadium', '15:00:00', 'Chelsea FC', -16, '2-1'),
+    ('Premier League Round 15', 'Anfield', '20:00:00', 'Liverpool FC', 7, None),
+    ('Premier League Round 16', 'Stamford Bridge', '17:30:00', 'Chelsea FC', 14, None),
+    ('Premier League Round 17', 'Camp Nou', '21:00:00', 'FC Barcelona', 21, None),
+    ('Premier League Round 18', 'Santiago Bernabeu', '19:00:00', 'Real Madrid', 28, None),
+    ('Premier League Round 19', 'Allianz Arena', '18:30:00', 'Bayern Munich', 35, None),
+    ('Premier League Round 20', 'Parc des Princes', '21:00:00', 'Paris Saint-Germain', 42, None),
+    ('Champions League Quarter Final', 'San Siro', '20:45:00', 'AC Milan', 49, None),
+    ('Premier League Round 21', 'Signal Iduna Park', '15:30:00', 'Borussia Dortmund', 56, None),
+]
 
-cursor.execute("""
-INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
-VALUES ('Premier League Round 21', 'Signal Iduna Park', '15:30:00', 'Borussia Dortmund', DATE_ADD(CURDATE(), INTERVAL 56 DAY), NULL)
-  ON DUPLICATE KEY UPDATE match_id = LAST_INSERT_ID(match_id);
-""")
+with seed_engine.phase(mydb, "match_table") as p:
+    p.insert("""
+        INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
+        VALUES (%s, %s, %s, %s, DATE_ADD(CURDATE(), INTERVAL %s DAY), %s)
+    """, matches_data)
 
-#LOL
+# (player_id, match_id, team_id, started, minutes, tackles, shots_total, offsides, red_cards, yellow_cards,
+#  fouls_committed, dribbles_attempted, assists, goals, passing_accuracy)
 player_match_stats_data = [
     # Match 2 - Premier League Round 1 vs Liverpool FC
     (1, 2, 1, True, 45, 2, 1, 0, 0, 0, 1, 3, 0, 0, 85.2),  # Dalot
@@ -599,629 +604,199 @@ player_match_stats_data = [
     (26, 4, 1, True, 90, 0, 0, 0, 0, 0, 0, 0, 0, 0, 100.0), # Onana
 ]
 
-for player_id, match_id, team_id, started, minutes, tackles, shots_total, offsides, red_cards, yellow_cards, fouls_committed, dribbles_attempted, assists, goals, passing_accuracy in player_match_stats_data:
-    cursor.execute("""
+with seed_engine.phase(mydb, "player_match_stats") as p:
+    p.insert("""
         INSERT INTO player_match_stats (player_id, match_id, team_id, started, minutes, tackles, shots_total, offsides, red_cards, yellow_cards, fouls_committed, dribbles_attempted, assists, goals, passing_accuracy)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """, (player_id, match_id, team_id, started, minutes, tackles, shots_total, offsides, red_cards, yellow_cards, fouls_committed, dribbles_attempted, assists, goals, passing_accuracy))
-
-# Insert sample staff members
-# Manchester United Staff
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Erik', None, 'ten Hag', 'erik.tenhag@manutd.com', 9000000.00, 54, '2022-06-01', 'Coach'))
-coach_ten_hag_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('David', None, 'Harrison', 'david.harrison@manutd.com', 500000.00, 45, '2021-07-01', 'Scout'))
-scout_harrison_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Richard', None, 'Hartis', 'richard.hartis@manutd.com', 600000.00, 56, '2019-07-01', 'Med'))
-med_hartis_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Tom', None, 'Admin', 'tom.admin@manutd.com', 400000.00, 30, '2024-02-01', 'Admin'))
-admin_tom_id = cursor.lastrowid
-
-# Liverpool Staff
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Jurgen', None, 'Klopp', 'jurgen.klopp@liverpool.com', 8000000.00, 57, '2015-10-08', 'Coach'))
-coach_klopp_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Michael', None, 'Edwards', 'michael.edwards@liverpool.com', 450000.00, 42, '2016-10-01', 'Scout'))
-scout_edwards_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Zaf', 'Iqbal', 'zaf.iqbal@liverpool.com', 550000.00, 48, '2018-07-01', 'Med'))
-med_iqbal_id = cursor.lastrowid
-
-# Manchester City Staff
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Pep', None, 'Guardiola', 'pep.guardiola@mancity.com', 20000000.00, 53, '2016-07-01', 'Coach'))
-coach_guardiola_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Txiki', None, 'Begiristain', 'txiki.begiristain@mancity.com', 3000000.00, 59, '2012-07-01', 'Scout'))
-scout_begiristain_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Eva', 'Carrillo', 'eva.carrillo@mancity.com', 650000.00, 52, '2017-07-01', 'Med'))
-med_carrillo_id = cursor.lastrowid
-
-# Chelsea Staff
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Mauricio', None, 'Pochettino', 'mauricio.pochettino@chelsea.com', 15000000.00, 52, '2023-07-01', 'Coach'))
-coach_pochettino_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Scott', None, 'McLachlan', 'scott.mclachlan@chelsea.com', 400000.00, 38, '2020-07-01', 'Scout'))
-scout_mclachlan_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Eva', 'Silvestre', 'eva.silvestre@chelsea.com', 580000.00, 49, '2021-07-01', 'Med'))
-med_silvestre_id = cursor.lastrowid
-
-# Real Madrid Staff (La Liga)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Carlo', None, 'Ancelotti', 'carlo.ancelotti@realmadrid.com', 12000000.00, 65, '2021-06-01', 'Coach'))
-coach_ancelotti_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Juni', None, 'Calafat', 'juni.calafat@realmadrid.com', 800000.00, 55, '2013-07-01', 'Scout'))
-scout_calafat_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Jesus', 'Olmo', 'jesus.olmo@realmadrid.com', 700000.00, 58, '2018-07-01', 'Med'))
-med_olmo_id = cursor.lastrowid
-
-# FC Barcelona Staff (La Liga)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Xavi', None, 'Hernandez', 'xavi.hernandez@barcelona.com', 6000000.00, 44, '2021-11-06', 'Coach'))
-coach_xavi_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Ramon', None, 'Planes', 'ramon.planes@barcelona.com', 350000.00, 41, '2018-07-01', 'Scout'))
-scout_planes_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Ricard', 'Pruna', 'ricard.pruna@barcelona.com', 620000.00, 54, '2019-07-01', 'Med'))
-med_pruna_id = cursor.lastrowid
-
-# AC Milan Staff (Serie A)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Stefano', None, 'Pioli', 'stefano.pioli@acmilan.com', 4000000.00, 58, '2019-10-09', 'Coach'))
-coach_pioli_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Paolo', None, 'Maldini', 'paolo.maldini@acmilan.com', 1200000.00, 56, '2018-07-01', 'Scout'))
-scout_maldini_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Stefano', 'Mazzoni', 'stefano.mazzoni@acmilan.com', 550000.00, 47, '2020-07-01', 'Med'))
-med_mazzoni_id = cursor.lastrowid
-
-# Bayern Munich Staff (Bundesliga)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Thomas', None, 'Tuchel', 'thomas.tuchel@bayernmunich.com', 8000000.00, 51, '2024-03-01', 'Coach'))
-coach_tuchel_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Michael', None, 'Reschke', 'michael.reschke@bayernmunich.com', 600000.00, 50, '2017-07-01', 'Scout'))
-scout_reschke_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Hans-Wilhelm', 'Muller-Wohlfahrt', 'hans.muller@bayernmunich.com', 750000.00, 74, '1977-07-01', 'Med'))
-med_muller_id = cursor.lastrowid
-
-# Paris Saint-Germain Staff (Ligue 1)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Luis', None, 'Enrique', 'luis.enrique@psg.com', 10000000.00, 54, '2023-07-01', 'Coach'))
-coach_enrique_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Antero', None, 'Henrique', 'antero.henrique@psg.com', 900000.00, 54, '2017-06-01', 'Scout'))
-scout_henrique_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Nicolas', 'Bauer', 'nicolas.bauer@psg.com', 580000.00, 46, '2022-07-01', 'Med'))
-med_bauer_id = cursor.lastrowid
-
-# Borussia Dortmund Staff (Bundesliga)
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Edin', None, 'Terzic', 'edin.terzic@borussiadortmund.com', 2000000.00, 41, '2022-05-01', 'Coach'))
-coach_terzic_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Sven', None, 'Mislintat', 'sven.mislintat@borussiadortmund.com', 700000.00, 51, '2018-07-01', 'Scout'))
-scout_mislintat_id = cursor.lastrowid
-
-cursor.execute("""
-INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
-VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
-""", ('Dr.', 'Markus', 'Braun', 'markus.braun@borussiadortmund.com', 520000.00, 43, '2021-07-01', 'Med'))
-med_braun_id = cursor.lastrowid
-
-# Staff accounts for admin staff
-cursor.execute("""
-INSERT INTO staff_account (staff_id, username, password_hash, is_active, last_login)
-VALUES (%s, %s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE username = VALUES(username), password_hash = VALUES(password_hash), is_active = VALUES(is_active)
-""", (admin_tom_id, 'tom.admin', 'sha256_testhash_placeholder', 1, None))
-
-# Coach assignments
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_ten_hag_id, 'Manager', 1))
-
-# Assign remaining coaches to teams
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_klopp_id, 'Manager', 2))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_guardiola_id, 'Manager', 3))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_pochettino_id, 'Manager', 2))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_ancelotti_id, 'Manager', 3))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_xavi_id, 'Manager', 1))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_pioli_id, 'Manager', 2))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_tuchel_id, 'Manager', 3))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_enrique_id, 'Manager', 1))
-
-cursor.execute("""
-INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
-""", (coach_terzic_id, 'Manager', 2))
-
-# Scout assignments
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_harrison_id, 'Europe', 15))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_edwards_id, 'UK', 12))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_begiristain_id, 'Global', 25))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_mclachlan_id, 'UK', 10))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_calafat_id, 'Spain', 20))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_planes_id, 'Spain', 8))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_maldini_id, 'Italy', 18))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_reschke_id, 'Germany', 16))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_henrique_id, 'Portugal', 14))
-
-cursor.execute("""
-INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
-ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
-""", (scout_mislintat_id, 'Germany', 13))
-
-# Med Staff assignments
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_hartis_id, 'Head of Medical', 'UEFA Certified', 25))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_iqbal_id, 'Sports Medicine', 'FIFA Certified', 18))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_carrillo_id, 'Physiotherapy', 'UEFA Certified', 22))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_silvestre_id, 'Sports Science', 'FIFA Certified', 15))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_olmo_id, 'Head of Medical', 'UEFA Certified', 28))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_pruna_id, 'Sports Medicine', 'FIFA Certified', 20))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_mazzoni_id, 'Physiotherapy', 'UEFA Certified', 12))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_muller_id, 'Head of Medical', 'FIFA Certified', 45))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_bauer_id, 'Sports Science', 'UEFA Certified', 11))
-
-cursor.execute("""
-INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
-VALUES (%s, %s, %s, %s)
-ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
-""", (med_braun_id, 'Physiotherapy', 'FIFA Certified', 9))
-
-
-# Insert sample scouting reports
-# Manchester United scout (David Harrison) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_harrison_id, 'Kylian Mbappe', 18, '2024-11-15', 
-'Exceptional winger with blistering pace and clinical finishing. Age 25, at peak performance. Transfer value estimated at €180M. Would be perfect addition to our attacking lineup. Strong work rate and leadership qualities.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_harrison_id, 'Jude Bellingham', 20, '2024-10-20', 
-'Outstanding central midfielder with excellent vision and passing range. Age 21, huge potential for growth. Transfer value around €150M. Box-to-box midfielder with strong defensive capabilities. Would strengthen our midfield significantly.'))
-
-# Liverpool scout (Michael Edwards) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_edwards_id, 'Phil Foden', 15, '2024-09-10', 
-'Creative midfielder with exceptional dribbling skills and vision. Age 24, already at world-class level. Transfer value estimated at €120M. Perfect for our possession-based style of play. Excellent set-piece specialist.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_edwards_id, 'Trent Alexander-Arnold', 11, '2024-08-05', 
-'World-class right-back with exceptional crossing ability. Age 25, peak years ahead. Transfer value around €80M. Would provide width and creativity from full-back position. Strong defensively as well.'))
-
-# Manchester City scout (Txiki Begiristain) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_begiristain_id, 'Vinicius Jr', 2, '2024-12-01', 
-'Dynamic winger with incredible dribbling and pace. Age 24, explosive talent. Transfer value estimated at €150M. Would add flair and unpredictability to our attacking options. Still developing consistency.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_begiristain_id, 'Rodri', 4, '2024-11-25', 
-'Complete defensive midfielder with outstanding passing range. Age 28, in prime. Transfer value around €100M. Would provide stability and control in midfield. Excellent leadership qualities.'))
-
-# Chelsea scout (Scott McLachlan) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_mclachlan_id, 'Mohamed Salah', 6, '2024-10-30', 
-'Clinical finisher with exceptional pace and dribbling. Age 32, still world-class. Transfer value estimated at €50M. Would provide immediate goal threat. Experience and leadership invaluable.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_mclachlan_id, 'Alisson Becker', 26, '2024-09-15', 
-'World-class goalkeeper with excellent shot-stopping and distribution. Age 31, prime goalkeeper. Transfer value around €60M. Would provide stability in goal. Strong command of area.'))
-
-# Real Madrid scout (Juni Calafat) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_calafat_id, 'Pedri', 8, '2024-11-20', 
-'Exceptional young midfielder with incredible vision and technique. Age 21, huge potential. Transfer value estimated at €120M. Would be long-term solution for central midfield. Already showing world-class qualities.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_calafat_id, 'Ronald Araujo', 3, '2024-10-10', 
-'Modern center-back with excellent pace and technical ability. Age 25, peak years ahead. Transfer value around €90M. Would strengthen our defensive options significantly.'))
-
-# Barcelona scout (Ramon Planes) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_planes_id, 'Federico Valverde', 5, '2024-09-25', 
-'Box-to-box midfielder with exceptional work rate and passing. Age 26, in prime. Transfer value estimated at €100M. Would add dynamism and energy to our midfield. Strong defensively.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_planes_id, 'Martin Odegaard', 10, '2024-08-20', 
-'Creative midfielder with excellent vision and technical ability. Age 25, peak performance. Transfer value around €80M. Would provide creativity and control in attacking midfield.'))
-
-# AC Milan scout (Paolo Maldini) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_maldini_id, 'Harry Kane', 19, '2024-11-05', 
-'Clinical striker with exceptional finishing and movement. Age 31, still elite level. Transfer value estimated at €100M. Would provide guaranteed goals. Leadership and experience invaluable.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_maldini_id, 'Joshua Kimmich', 9, '2024-10-15', 
-'Complete full-back with outstanding crossing and defensive ability. Age 29, prime years. Transfer value around €70M. Would provide width and defensive solidity.'))
-
-# Bayern Munich scout (Michael Reschke) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_reschke_id, 'Jamal Musiala', 7, '2024-12-01', 
-'Exceptional young talent with incredible dribbling and vision. Age 21, huge potential. Transfer value estimated at €130M. Would be perfect for our attacking style. Already showing world-class qualities.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_reschke_id, 'Florian Wirtz', 14, '2024-11-10', 
-'Creative midfielder with outstanding technical ability. Age 21, recovering from injury. Transfer value around €100M. Huge potential once fully fit. Would add creativity to our midfield.'))
-
-# PSG scout (Antero Henrique) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_henrique_id, 'Bukayo Saka', 21, '2024-10-25', 
-'Dynamic winger with exceptional dribbling and crossing. Age 22, developing into world-class. Transfer value estimated at €120M. Would provide width and creativity from left flank.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_henrique_id, 'William Saliba', 17, '2024-09-30', 
-'Modern center-back with excellent reading of game and composure. Age 23, prime ahead. Transfer value around €80M. Would strengthen our defensive options significantly.'))
-
-# Borussia Dortmund scout (Sven Mislintat) scouting reports
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_mislintat_id, 'Enzo Fernandez', 24, '2024-11-15', 
-'Creative midfielder with excellent passing range and vision. Age 23, developing well. Transfer value estimated at €90M. Would add control and creativity to our midfield.'))
-
-cursor.execute("""
-INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
-VALUES (%s, %s, %s, %s, %s)
-""", (scout_mislintat_id, 'Raphinha', 22, '2024-10-20', 
-'Skilled winger with excellent dribbling and finishing. Age 28, experienced. Transfer value around €60M. Would provide attacking threat from wide positions.'))
-
-
-# Insert sample medical reports
-# Medical reports for injured players
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (1, 'Sprained ankle sustained during training session. Player experiencing pain and swelling in right ankle.', '2024-11-15', 'RICE protocol, anti-inflammatory medication, physiotherapy sessions twice daily', 'Moderate'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (3, 'Hamstring strain from sprint training. Grade 2 tear identified via MRI scan.', '2024-10-28', 'Rest, ice therapy, compression, elevation. Physiotherapy focusing on strengthening exercises.', 'Moderate'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (5, 'Groin injury sustained during match. Player reports sharp pain in right groin area.', '2024-11-05', 'Anti-inflammatory medication, rest from training, gradual return to play protocol', 'Mild'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (7, 'Knee ligament sprain from tackle in training. MRI shows partial ACL tear.', '2024-09-20', 'Immobilization with brace, physiotherapy, possible surgical intervention if no improvement', 'Severe'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (9, 'Shoulder dislocation during aerial challenge. X-ray confirms anterior dislocation.', '2024-10-12', 'Closed reduction performed, sling immobilization for 2 weeks, rehabilitation program', 'Moderate'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (11, 'Calf muscle tear from acceleration training. Ultrasound shows partial tear.', '2024-11-22', 'Rest, ice therapy, compression bandage, graduated return to running program', 'Moderate'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (13, 'Concussion from head collision in match. Player showing symptoms of headache and confusion.', '2024-10-05', 'Immediate removal from play, concussion protocol followed, gradual return to contact training', 'Severe'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (15, 'Achilles tendonitis from overuse. Player reports pain at back of heel.', '2024-09-15', 'Rest from running activities, orthotics, eccentric strengthening exercises, anti-inflammatory medication', 'Mild'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (17, 'Back spasm from heavy lifting in gym. Acute lower back pain with restricted movement.', '2024-11-10', 'Pain management medication, rest, core strengthening exercises, manual therapy', 'Mild'))
-
-cursor.execute("""
-INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
-VALUES (%s, %s, %s, %s, %s)
-""", (19, 'Quadriceps contusion from direct impact. Large hematoma on thigh.', '2024-10-18', 'Ice therapy, compression, elevation, pain management, gradual return to training', 'Moderate'))
-
-
-# Insert medical conditions linked to the medical reports above
-# Get the medical report IDs that were just inserted
-#this might work 
-cursor.execute("SELECT med_report_id, player_id FROM medical_report ORDER BY med_report_id DESC LIMIT 10")
-recent_reports = cursor.fetchall()
+    """, player_match_stats_data)
+
+# (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
+staff_data = [
+    # Manchester United
+    ('Erik', None, 'ten Hag', 'erik.tenhag@manutd.com', 9000000.0, 54, '2022-06-01', 'Coach'),
+    ('David', None, 'Harrison', 'david.harrison@manutd.com', 500000.0, 45, '2021-07-01', 'Scout'),
+    ('Richard', None, 'Hartis', 'richard.hartis@manutd.com', 600000.0, 56, '2019-07-01', 'Med'),
+    ('Tom', None, 'Admin', 'tom.admin@manutd.com', 400000.0, 30, '2024-02-01', 'Admin'),
+    # Liverpool
+    ('Jurgen', None, 'Klopp', 'jurgen.klopp@liverpool.com', 8000000.0, 57, '2015-10-08', 'Coach'),
+    ('Michael', None, 'Edwards', 'michael.edwards@liverpool.com', 450000.0, 42, '2016-10-01', 'Scout'),
+    ('Dr.', 'Zaf', 'Iqbal', 'zaf.iqbal@liverpool.com', 550000.0, 48, '2018-07-01', 'Med'),
+    # Manchester City
+    ('Pep', None, 'Guardiola', 'pep.guardiola@mancity.com', 20000000.0, 53, '2016-07-01', 'Coach'),
+    ('Txiki', None, 'Begiristain', 'txiki.begiristain@mancity.com', 3000000.0, 59, '2012-07-01', 'Scout'),
+    ('Dr.', 'Eva', 'Carrillo', 'eva.carrillo@mancity.com', 650000.0, 52, '2017-07-01', 'Med'),
+    # Chelsea
+    ('Mauricio', None, 'Pochettino', 'mauricio.pochettino@chelsea.com', 15000000.0, 52, '2023-07-01', 'Coach'),
+    ('Scott', None, 'McLachlan', 'scott.mclachlan@chelsea.com', 400000.0, 38, '2020-07-01', 'Scout'),
+    ('Dr.', 'Eva', 'Silvestre', 'eva.silvestre@chelsea.com', 580000.0, 49, '2021-07-01', 'Med'),
+    # Real Madrid (La Liga)
+    ('Carlo', None, 'Ancelotti', 'carlo.ancelotti@realmadrid.com', 12000000.0, 65, '2021-06-01', 'Coach'),
+    ('Juni', None, 'Calafat', 'juni.calafat@realmadrid.com', 800000.0, 55, '2013-07-01', 'Scout'),
+    ('Dr.', 'Jesus', 'Olmo', 'jesus.olmo@realmadrid.com', 700000.0, 58, '2018-07-01', 'Med'),
+    # FC Barcelona (La Liga)
+    ('Xavi', None, 'Hernandez', 'xavi.hernandez@barcelona.com', 6000000.0, 44, '2021-11-06', 'Coach'),
+    ('Ramon', None, 'Planes', 'ramon.planes@barcelona.com', 350000.0, 41, '2018-07-01', 'Scout'),
+    ('Dr.', 'Ricard', 'Pruna', 'ricard.pruna@barcelona.com', 620000.0, 54, '2019-07-01', 'Med'),
+    # AC Milan (Serie A)
+    ('Stefano', None, 'Pioli', 'stefano.pioli@acmilan.com', 4000000.0, 58, '2019-10-09', 'Coach'),
+    ('Paolo', None, 'Maldini', 'paolo.maldini@acmilan.com', 1200000.0, 56, '2018-07-01', 'Scout'),
+    ('Dr.', 'Stefano', 'Mazzoni', 'stefano.mazzoni@acmilan.com', 550000.0, 47, '2020-07-01', 'Med'),
+    # Bayern Munich (Bundesliga)
+    ('Thomas', None, 'Tuchel', 'thomas.tuchel@bayernmunich.com', 8000000.0, 51, '2024-03-01', 'Coach'),
+    ('Michael', None, 'Reschke', 'michael.reschke@bayernmunich.com', 600000.0, 50, '2017-07-01', 'Scout'),
+    ('Dr.', 'Hans-Wilhelm', 'Muller-Wohlfahrt', 'hans.muller@bayernmunich.com', 750000.0, 74, '1977-07-01', 'Med'),
+    # Paris Saint-Germain (Ligue 1)
+    ('Luis', None, 'Enrique', 'luis.enrique@psg.com', 10000000.0, 54, '2023-07-01', 'Coach'),
+    ('Antero', None, 'Henrique', 'antero.henrique@psg.com', 900000.0, 54, '2017-06-01', 'Scout'),
+    ('Dr.', 'Nicolas', 'Bauer', 'nicolas.bauer@psg.com', 580000.0, 46, '2022-07-01', 'Med'),
+    # Borussia Dortmund (Bundesliga)
+    ('Edin', None, 'Terzic', 'edin.terzic@borussiadortmund.com', 2000000.0, 41, '2022-05-01', 'Coach'),
+    ('Sven', None, 'Mislintat', 'sven.mislintat@borussiadortmund.com', 700000.0, 51, '2018-07-01', 'Scout'),
+    ('Dr.', 'Markus', 'Braun', 'markus.braun@borussiadortmund.com', 520000.0, 43, '2021-07-01', 'Med'),
+]
 
-# Create a mapping of player_id to med_report_id for the conditions
-report_mapping = {report[1]: report[0] for report in recent_reports}
+# The rows below refer to staff by email
+staff_accounts_data = [
+    ('tom.admin@manutd.com', 'tom.admin', 'sha256_testhash_placeholder', 1, None),
+]
+coaches_data = [
+    ('erik.tenhag@manutd.com', 'Manager', 1),
+    ('jurgen.klopp@liverpool.com', 'Manager', 2),
+    ('pep.guardiola@mancity.com', 'Manager', 3),
+    ('mauricio.pochettino@chelsea.com', 'Manager', 2),
+    ('carlo.ancelotti@realmadrid.com', 'Manager', 3),
+    ('xavi.hernandez@barcelona.com', 'Manager', 1),
+    ('stefano.pioli@acmilan.com', 'Manager', 2),
+    ('thomas.tuchel@bayernmunich.com', 'Manager', 3),
+    ('luis.enrique@psg.com', 'Manager', 1),
+    ('edin.terzic@borussiadortmund.com', 'Manager', 2),
+]
+scouts_data = [
+    ('david.harrison@manutd.com', 'Europe', 15),
+    ('michael.edwards@liverpool.com', 'UK', 12),
+    ('txiki.begiristain@mancity.com', 'Global', 25),
+    ('scott.mclachlan@chelsea.com', 'UK', 10),
+    ('juni.calafat@realmadrid.com', 'Spain', 20),
+    ('ramon.planes@barcelona.com', 'Spain', 8),
+    ('paolo.maldini@acmilan.com', 'Italy', 18),
+    ('michael.reschke@bayernmunich.com', 'Germany', 16),
+    ('antero.henrique@psg.com', 'Portugal', 14),
+    ('sven.mislintat@borussiadortmund.com', 'Germany', 13),
+]
+med_staff_data = [
+    ('richard.hartis@manutd.com', 'Head of Medical', 'UEFA Certified', 25),
+    ('zaf.iqbal@liverpool.com', 'Sports Medicine', 'FIFA Certified', 18),
+    ('eva.carrillo@mancity.com', 'Physiotherapy', 'UEFA Certified', 22),
+    ('eva.silvestre@chelsea.com', 'Sports Science', 'FIFA Certified', 15),
+    ('jesus.olmo@realmadrid.com', 'Head of Medical', 'UEFA Certified', 28),
+    ('ricard.pruna@barcelona.com', 'Sports Medicine', 'FIFA Certified', 20),
+    ('stefano.mazzoni@acmilan.com', 'Physiotherapy', 'UEFA Certified', 12),
+    ('hans.muller@bayernmunich.com', 'Head of Medical', 'FIFA Certified', 45),
+    ('nicolas.bauer@psg.com', 'Sports Science', 'UEFA Certified', 11),
+    ('markus.braun@borussiadortmund.com', 'Physiotherapy', 'FIFA Certified', 9),
+]
 
-# Insert medical conditions for each medical report
-# Player 1 (Dalot) - Ankle sprain
-cursor.execute("""
-INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
-VALUES (%s, %s, %s, %s)
-""", (report_mapping[1], 'Lateral Ankle Sprain', 'Grade 2 sprain of the lateral ligaments with swelling and bruising', '2024-11-15'))
+with seed_engine.phase(mydb, "staff") as p:
+    p.insert("""
+        INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
+    """, staff_data)
+    # Re-seeding keeps existing staff rows, so look the ids up rather than deriving them
+    staff_ids = p.lookup_ids('staff', 'staff_id', 'email', [row[3] for row in staff_data])
+
+with seed_engine.phase(mydb, "staff roles") as p:
+    p.insert("""
+        INSERT INTO staff_account (staff_id, username, password_hash, is_active, last_login)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE username = VALUES(username), password_hash = VALUES(password_hash), is_active = VALUES(is_active)
+    """, [(staff_ids[email], *rest) for email, *rest in staff_accounts_data])
+    p.insert("""
+        INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
+    """, [(staff_ids[email], *rest) for email, *rest in coaches_data])
+    p.insert("""
+        INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
+    """, [(staff_ids[email], *rest) for email, *rest in scouts_data])
+    p.insert("""
+        INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
+    """, [(staff_ids[email], *rest) for email, *rest in med_staff_data])
+
+# (scout email, target_player_name, target_player_id, report_date, report_desc)
+scouting_reports_data = [
+    # Manchester United scout (David Harrison)
+    ('david.harrison@manutd.com', 'Kylian Mbappe', 18, '2024-11-15', 'Exceptional winger with blistering pace and clinical finishing. Age 25, at peak performance. Transfer value estimated at €180M. Would be perfect addition to our attacking lineup. Strong work rate and leadership qualities.'),
+    ('david.harrison@manutd.com', 'Jude Bellingham', 20, '2024-10-20', 'Outstanding central midfielder with excellent vision and passing range. Age 21, huge potential for growth. Transfer value around €150M. Box-to-box midfielder with strong defensive capabilities. Would strengthen our midfield significantly.'),
+    # Liverpool scout (Michael Edwards)
+    ('michael.edwards@liverpool.com', 'Phil Foden', 15, '2024-09-10', 'Creative midfielder with exceptional dribbling skills and vision. Age 24, already at world-class level. Transfer value estimated at €120M. Perfect for our possession-based style of play. Excellent set-piece specialist.'),
+    ('michael.edwards@liverpool.com', 'Trent Alexander-Arnold', 11, '2024-08-05', 'World-class right-back with exceptional crossing ability. Age 25, peak years ahead. Transfer value around €80M. Would provide width and creativity from full-back position. Strong defensively as well.'),
+    # Manchester City scout (Txiki Begiristain)
+    ('txiki.begiristain@mancity.com', 'Vinicius Jr', 2, '2024-12-01', 'Dynamic winger with incredible dribbling and pace. Age 24, explosive talent. Transfer value estimated at €150M. Would add flair and unpredictability to our attacking options. Still developing consistency.'),
+    ('txiki.begiristain@mancity.com', 'Rodri', 4, '2024-11-25', 'Complete defensive midfielder with outstanding passing range. Age 28, in prime. Transfer value around €100M. Would provide stability and control in midfield. Excellent leadership qualities.'),
+    # Chelsea scout (Scott McLachlan)
+    ('scott.mclachlan@chelsea.com', 'Mohamed Salah', 6, '2024-10-30', 'Clinical finisher with exceptional pace and dribbling. Age 32, still world-class. Transfer value estimated at €50M. Would provide immediate goal threat. Experience and leadership invaluable.'),
+    ('scott.mclachlan@chelsea.com', 'Alisson Becker', 26, '2024-09-15', 'World-class goalkeeper with excellent shot-stopping and distribution. Age 31, prime goalkeeper. Transfer value around €60M. Would provide stability in goal. Strong command of area.'),
+    # Real Madrid scout (Juni Calafat)
+    ('juni.calafat@realmadrid.com', 'Pedri', 8, '2024-11-20', 'Exceptional young midfielder with incredible vision and technique. Age 21, huge potential. Transfer value estimated at €120M. Would be long-term solution for central midfield. Already showing world-class qualities.'),
+    ('juni.calafat@realmadrid.com', 'Ronald Araujo', 3, '2024-10-10', 'Modern center-back with excellent pace and technical ability. Age 25, peak years ahead. Transfer value around €90M. Would strengthen our defensive options significantly.'),
+    # FC Barcelona scout (Ramon Planes)
+    ('ramon.planes@barcelona.com', 'Federico Valverde', 5, '2024-09-25', 'Box-to-box midfielder with exceptional work rate and passing. Age 26, in prime. Transfer value estimated at €100M. Would add dynamism and energy to our midfield. Strong defensively.'),
+    ('ramon.planes@barcelona.com', 'Martin Odegaard', 10, '2024-08-20', 'Creative midfielder with excellent vision and technical ability. Age 25, peak performance. Transfer value around €80M. Would provide creativity and control in attacking midfield.'),
+    # AC Milan scout (Paolo Maldini)
+    ('paolo.maldini@acmilan.com', 'Harry Kane', 19, '2024-11-05', 'Clinical striker with exceptional finishing and movement. Age 31, still elite level. Transfer value estimated at €100M. Would provide guaranteed goals. Leadership and experience invaluable.'),
+    ('paolo.maldini@acmilan.com', 'Joshua Kimmich', 9, '2024-10-15', 'Complete full-back with outstanding crossing and defensive ability. Age 29, prime years. Transfer value around €70M. Would provide width and defensive solidity.'),
+    # Bayern Munich scout (Michael Reschke)
+    ('michael.reschke@bayernmunich.com', 'Jamal Musiala', 7, '2024-12-01', 'Exceptional young talent with incredible dribbling and vision. Age 21, huge potential. Transfer value estimated at €130M. Would be perfect for our attacking style. Already showing world-class qualities.'),
+    ('michael.reschke@bayernmunich.com', 'Florian Wirtz', 14, '2024-11-10', 'Creative midfielder with outstanding technical ability. Age 21, recovering from injury. Transfer value around €100M. Huge potential once fully fit. Would add creativity to our midfield.'),
+    # Paris Saint-Germain scout (Antero Henrique)
+    ('antero.henrique@psg.com', 'Bukayo Saka', 21, '2024-10-25', 'Dynamic winger with exceptional dribbling and crossing. Age 22, developing into world-class. Transfer value estimated at €120M. Would provide width and creativity from left flank.'),
+    ('antero.henrique@psg.com', 'William Saliba', 17, '2024-09-30', 'Modern center-back with excellent reading of game and composure. Age 23, prime ahead. Transfer value around €80M. Would strengthen our defensive options significantly.'),
+    # Borussia Dortmund scout (Sven Mislintat)
+    ('sven.mislintat@borussiadortmund.com', 'Enzo Fernandez', 24, '2024-11-15', 'Creative midfielder with excellent passing range and vision. Age 23, developing well. Transfer value estimated at €90M. Would add control and creativity to our midfield.'),
+    ('sven.mislintat@borussiadortmund.com', 'Raphinha', 22, '2024-10-20', 'Skilled winger with excellent dribbling and finishing. Age 28, experienced. Transfer value around €60M. Would provide attacking threat from wide positions.'),
+]
 
-cursor.execute("""
-INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
-VALUES (%s, %s, %s, %s)
-""", (report_mapping[1], 'Ankle Instability', 'Chronic ankle instability contributing to repeated sprains', '2024-11-15'))
+with seed_engine.phase(mydb, "scouting_report") as p:
+    p.insert("""
+        INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
+        VALUES (%s, %s, %s, %s, %s)
+    """, [(staff_ids[email], *rest) for email, *rest in scouting_reports_data])
+
+# (player_id, summary, report_date, treatment, severity_of_injury)
+medical_reports_data = [
+    (1, 'Sprained ankle sustained during training session. Player experiencing pain and swelling in right ankle.', '2024-11-15', 'RICE protocol, anti-inflammatory medication, physiotherapy sessions twice daily', 'Moderate'),
+    (3, 'Hamstring strain from sprint training. Grade 2 tear identified via MRI scan.', '2024-10-28', 'Rest, ice therapy, compression, elevation. Physiotherapy focusing on strengthening exercises.', 'Moderate'),
+    (5, 'Groin injury sustained during match. Player reports sharp pain in right groin area.', '2024-11-05', 'Anti-inflammatory medication, rest from training, gradual return to play protocol', 'Mild'),
+    (7, 'Knee ligament sprain from tackle in training. MRI shows partial ACL tear.', '2024-09-20', 'Immobilization with brace, physiotherapy, possible surgical intervention if no improvement', 'Severe'),
+    (9, 'Shoulder dislocation during aerial challenge. X-ray confirms anterior dislocation.', '2024-10-12', 'Closed reduction performed, sling immobilization for 2 weeks, rehabilitation program', 'Moderate'),
+    (11, 'Calf muscle tear from acceleration training. Ultrasound shows partial tear.', '2024-11-22', 'Rest, ice therapy, compression bandage, graduated return to running program', 'Moderate'),
+    (13, 'Concussion from head collision in match. Player showing symptoms of headache and confusion.', '2024-10-05', 'Immediate removal from play, concussion protocol followed, gradual return to contact training', 'Severe'),
+    (15, 'Achilles tendonitis from overuse. Player reports pain at back of heel.', '2024-09-15', 'Rest from running activities, orthotics, eccentric strengthening exercises, anti-inflammatory medication', 'Mild'),
+    (17, 'Back spasm from heavy lifting in gym. Acute lower back pain with restricted movement.', '2024-11-10', 'Pain management medication, rest, core strengthening exercises, manual therapy', 'Mild'),
+    (19, 'Quadriceps contusion from direct impact. Large hematoma on thigh.', '2024-10-18', 'Ice therapy, compression, elevation, pain management, gradual return to training', 'Moderate'),
+]
 
-# Player 3 (Martinez) - Hamstring strain
-cursor.execute("""
-INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
-VALUES (%s, %s, %s, %s)
-""", (report_mapping[3], 'Hamstring Strain', 'Grade 2 tear of the biceps femoris muscle', '2024-10-28'))
+# (player_id of the report above, condition_name, description, diagnosis_date)
+medical_conditions_data = [
+    (1, 'Lateral Ankle Sprain', 'Grade 2 sprain of the lateral ligaments with swelling and bruising', '2024-11-15'),
+    (1, 'Ankle Instability', 'Chronic ankle instability contributing to repeated sprains', '2024-11-15'),
+    (3, 'Hamstring Strain', 'Grade 2 tear of the biceps femoris muscle', '2024-10-28'),
+    (5, 'Adductor Strain', 'Strain of the adductor longus muscle', '2024-11-05'),
+]
 
-# Player 5 (Fernandes) - Groin injury
-cursor.execute("""
-INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
-VALUES (%s, %s, %s, %s)
-""", (report_mapping[5], 'Adductor Strain', 'Strain of the adductor longus muscle', '2024-11-05'))
+with seed_engine.phase(mydb, "medical reports") as p:
+    report_ids = p.insert("""
+        INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
+        VALUES (%s, %s, %s, %s, %s)
+    """, medical_reports_data, ids=True)
+    report_mapping = {row[0]: report_id for row, report_id in zip(medical_reports_data, report_ids)}
+    p.insert("""
+        INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
+        VALUES (%s, %s, %s, %s)
+    """, [(report_mapping[player_id], *rest) for player_id, *rest in medical_conditions_data])
 
 
 """
@@ -1260,5 +835,10 @@ VALUES (%s, %s, %s, %s)
 # To assign roles to users, you would need to create MySQL users and grant roles
 # For example, after creating a user: GRANT 'coach_role' TO 'username'@'host';
 
-mydb.commit()
+# The seed data above bypassed the API write paths, so recount the dashboard and season totals from scratch
+with seed_engine.phase(mydb, "counters and totals") as p:
+    counters.rebuild(p.cursor)
+    season_stats.rebuild(p.cursor)
+
 cursor.close()
+print(f"Seeded in {time.perf_counter() - seed_started:.2f}s")
@@ -0,0 +1,106 @@
+import mysql.connector
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query
+from starlette.responses import Response
+from typing import Dict, Literal, Optional
+
+import cache
+import json_response
+import pagination
+import queries
+import streaming
+from db_async_module import fetch_all, fetch_one
+
+# Async versions of the hot read endpoints. main.py mounts this router in front of the
+# sync handlers when SOMS_DB_MODE=async; responses are identical in both modes.
+router = APIRouter()
+
+
+async def _fetch_page(select_sql, keys, where, params, page_cursor, limit):
+    query, query_params = pagination.build_page_query(select_sql, keys, where, params, page_cursor, limit)
+    try:
+        rows = await fetch_all(query, query_params)
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    return pagination.split_page(rows, keys, limit)
+
+
+@router.get("/players", response_model=Dict)
+async def get_all_players(
+    is_active: Optional[bool] = None,
+    is_injured: Optional[bool] = None,
+    position: Optional[str] = None,
+    scouted_player: Optional[bool] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    requested = queries.PLAYER_FIELDS.parse(fields)
+    where, params = queries.player_filters(is_active, is_injured, position, scouted_player)
+    select_sql = queries.PLAYER_FIELDS.select_sql(requested, queries.PLAYERS_SORT)
+    if stream:
+        return await streaming.astream_page(select_sql, queries.PLAYERS_SORT, where, params, page_cursor, stream,
+                                            lambda rows: queries.PLAYER_FIELDS.project(queries.shape_players(rows), requested))
+    rows, next_cursor = await _fetch_page(select_sql, queries.PLAYERS_SORT, where, params, page_cursor, limit)
+    return queries.page_response(queries.PLAYER_FIELDS.project(queries.shape_players(rows), requested), next_cursor)
+
+
+@router.get("/fixtures", response_model=Dict)
+async def get_fixtures(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    requested = queries.MATCH_FIELDS.parse(fields)
+    where, params = queries.match_filters(date_from, date_to)
+    select_sql = queries.MATCH_FIELDS.select_sql(requested, queries.FIXTURES_SORT)
+    if stream:
+        return await streaming.astream_page(select_sql, queries.FIXTURES_SORT, where, params, page_cursor, stream,
+                                            lambda rows: queries.MATCH_FIELDS.project(rows, requested))
+    rows, next_cursor = await _fetch_page(select_sql, queries.FIXTURES_SORT, where, params, page_cursor, limit)
+    return queries.page_response(queries.MATCH_FIELDS.project(rows, requested), next_cursor)
+
+
+@router.get("/lineups", response_model=Dict)
+async def get_all_lineups(
+    match_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    """Get all saved lineups"""
+    requested = queries.LINEUP_FIELDS.parse(fields)
+    where, params = queries.lineup_filters(match_id, team_id, date_from, date_to)
+    select_sql = queries.LINEUP_FIELDS.select_sql(requested, queries.LINEUPS_SORT)
+    if stream:
+        return await streaming.astream_page(select_sql, queries.LINEUPS_SORT, where, params, page_cursor, stream,
+                                            lambda rows: queries.LINEUP_FIELDS.project(rows, requested))
+    rows, next_cursor = await _fetch_page(select_sql, queries.LINEUPS_SORT, where, params, page_cursor, limit)
+    return queries.page_response(queries.LINEUP_FIELDS.project(rows, requested), next_cursor)
+
+
+@router.get("/player_details/{player_id}", response_model=Dict)
+async def get_player_details(player_id: int):
+    body = cache.player_profiles.get(player_id)
+    if body is not None:
+        return Response(body, media_type="application/json")
+    token = cache.player_profiles.begin(player_id)
+
+    try:
+        row = await fetch_one(queries.PLAYER_PROFILE_SQL, (player_id,))
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    if not row:
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    body = json_response.dumps({"status": "success", "data": queries.shape_player_profile(row)})
+    cache.player_profiles.set(player_id, body, token)
+    return Response(body, media_type="application/json")
@@ -0,0 +1,74 @@
+import argparse
+
+from blob_store import BlobNotFound, get_blob_store
+from db_connect_module import get_db_connection
+from image_pipeline import generate_variants, store_variants
+
+
+def backfill_photo_variants(batch_size=50, force=False):
+    """Generate player_photo_variant rows for players uploaded before the image pipeline existed.
+
+    Walks the player table in player_id order (keyset batches, so no OFFSET scans) and commits
+    after every player. With force=True, derivatives are regenerated even if they already exist.
+    """
+    store = get_blob_store()
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    last_id = 0
+    processed = skipped = failed = 0
+
+    try:
+        while True:
+            cursor.execute("""
+                SELECT p.player_id, p.photo_sha256,
+                       EXISTS (SELECT 1 FROM player_photo_variant v WHERE v.player_id = p.player_id) AS has_variants
+                FROM player p
+                WHERE p.player_id > %s AND p.photo_sha256 IS NOT NULL
+                ORDER BY p.player_id
+                LIMIT %s
+            """, (last_id, batch_size))
+            batch = cursor.fetchall()
+            if not batch:
+                break
+            last_id = batch[-1]['player_id']
+
+            for row in batch:
+                player_id = row['player_id']
+                if row['has_variants'] and not force:
+                    skipped += 1
+                    continue
+
+                # One blob at a time keeps memory flat regardless of batch size
+                try:
+                    variants = generate_variants(store.get(row['photo_sha256']))
+                except BlobNotFound:
+                    print(f"Player {player_id}: photo blob missing from the store, skipping")
+                    failed += 1
+                    continue
+                if not variants:
+                    print(f"Player {player_id}: photo could not be decoded, skipping")
+                    failed += 1
+                    continue
+                try:
+                    store_variants(cursor, player_id, variants, store=store)
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    print(f"Player {player_id}: error storing variants: {e}")
+                    failed += 1
+                    continue
+                processed += 1
+                print(f"Player {player_id}: stored {len(variants)} variants")
+
+        print(f"\nBackfill complete: {processed} processed, {skipped} skipped, {failed} failed")
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate resized photo variants for existing players")
+    parser.add_argument("--batch-size", type=int, default=50, help="players fetched per query (default: 50)")
+    parser.add_argument("--force", action="store_true", help="regenerate variants that already exist")
+    args = parser.parse_args()
+    backfill_photo_variants(batch_size=args.batch_size, force=args.force)
@@ -0,0 +1,236 @@
+"""Micro-benchmarks: the pure-Python row shaping and encoding every list/detail request runs.
+
+    python benchmarks/bench_hot_paths.py [--sizes 1000,10000,100000] [--repeat 5] [--only players_page,...]
+    python benchmarks/bench_hot_paths.py --out baseline.json
+    python benchmarks/bench_hot_paths.py --baseline baseline.json [--tolerance 15]
+
+Each case runs on synthetic rows shaped like what mysql-connector returns, so no database is
+needed. Time is the best and median of --repeat runs, each on freshly built rows since the
+shaping mutates them. Allocations are measured in a separate run under tracemalloc: the peak
+while the case ran and what was still allocated after (the result), both in KiB.
+
+  players_page      shape_players + projection + page_response (/players, all fields)
+  players_fields    the same with ?fields=player_id,first_name,last_name,photo_url
+  page_cursor       split_page of a limit+1 fetch, including encode_cursor
+  medical_reports   shape_medical_reports (JSON_ARRAYAGG conditions) + encoding (/medical_reports)
+  player_profile    shape_player_profile of one player with N match lines (/player_details)
+  lineup_diff       _diff_slots for N lineup saves (Lineup.create_with_slots)
+  season_summary    season_stats.player_summary over N season rows
+  leaderboard       leaderboards.shape of N ranked rows
+  legacy_players    the old per-row date conversion + Dict serializer path, for reference
+
+With --baseline, a case whose median is more than --tolerance percent slower than the saved
+one is reported as a regression and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import orjson  # noqa: E402
+
+import leaderboards  # noqa: E402
+import queries  # noqa: E402
+import season_stats  # noqa: E402
+from bench_json_encoding import legacy  # noqa: E402
+from json_response import dumps  # noqa: E402
+from models import _diff_slots  # noqa: E402
+from pagination import split_page  # noqa: E402
+
+
+def player_rows(n, rng):
+    return [{
+        'player_id': i,
+        'first_name': f'First{i}',
+        'middle_name': None,
+        'last_name': f'Last{i % 997}',
+        'salary': Decimal('125000.00') + i,
+        'positions': 'CM,CDM',
+        'is_active': 1,
+        'is_injured': i % 11 == 0,
+        'transfer_value': Decimal('2500000.50'),
+        'contract_end_date': date(2027, 6, 30),
+        'scouted_player': 0,
+        'photo_sha256': f'{rng.getrandbits(256):064x}' if i % 4 else None,
+        'photo_content_type': 'image/png',
+        'photo_filename': f'player_images/{i}.png',
+        'photo_size': 48213,
+        'photo_uploaded_at': datetime(2025, 1, 2, 3, 4, 5),
+    } for i in range(1, n + 1)]
+
+
+def _conditions(rng, report_id, count):
+    return orjson.dumps([{
+        'condition_id': report_id * 4 + k,
+        'condition_name': 'Hamstring Strain',
+        'description': 'Grade 1 strain of the hamstring',
+        'diagnosis_date': f'2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+    } for k in range(count)]).decode() if count else None
+
+
+def medical_report_rows(n, rng):
+    return [{
+        'med_report_id': i,
+        'player_id': i % 500 + 1,
+        'player_first_name': 'First',
+        'player_middle_name': None,
+        'player_last_name': 'Last',
+        'summary': 'Assessed after training',
+        'report_date': date(2025, 1, 1) + timedelta(days=i % 365),
+        'treatment': 'Rest and physiotherapy',
+        'severity_of_injury': 'Minor',
+        'conditions': _conditions(rng, i, rng.choice((0, 1, 1, 2, 3))),
+    } for i in range(1, n + 1)]
+
+
+def profile_row(n, rng):
+    row = player_rows(1, rng)[0]
+    row['medical_reports'] = orjson.dumps([{
+        'med_report_id': i, 'summary': 'Assessed after training', 'report_date': f'2025-01-{i % 28 + 1:02d}',
+        'treatment': 'Rest', 'severity_of_injury': 'Minor',
+    } for i in range(max(1, n // 10))]).decode()
+    row['match_stats'] = orjson.dumps([{
+        'pms_id': i, 'player_id': 1, 'match_id': i, 'match_name': f'Match {i}',
+        'match_date': f'20{20 + i % 6}-{i % 12 + 1:02d}-{i % 28 + 1:02d}', 'match_time': '15:00:00',
+        'team_id': 1, 'team_name': 'Lions', 'started': 1, 'tackles': 2, 'minutes': 90, 'shots_total': 3,
+        'offsides': 0, 'red_cards': 0, 'yellow_cards': 0, 'fouls_committed': 1, 'dribbles_attempted': 4,
+        'assists': 0, 'goals': i % 3, 'passing_accuracy': 84.5,
+    } for i in range(n)]).decode()
+    row['season_totals'] = orjson.dumps([
+        {'season_start_year': 2020 + s, **{c: rng.randint(0, 3000) for c in season_stats.AGGREGATE_COLUMNS}}
+        for s in range(6)
+    ]).decode()
+    return row
+
+
+def lineups(n, rng):
+    saves = []
+    for _ in range(n):
+        stored = {slot: rng.randint(1, 100_000) for slot in range(1, 12)}
+        submitted = dict(stored)
+        a, b = rng.sample(range(1, 12), 2)
+        submitted[a], submitted[b] = stored[b], stored[a]
+        saves.append((stored, submitted))
+    return saves
+
+
+def season_rows(n, rng):
+    return [{'season_start_year': 2024 - i, **{c: rng.randint(0, 3000) for c in season_stats.AGGREGATE_COLUMNS}}
+            for i in range(n)]
+
+
+def leaderboard_rows(n, rng):
+    return [{'player_id': i, 'first_name': 'First', 'last_name': 'Last', 'appearances': Decimal(rng.randint(1, 38)),
+             'minutes': Decimal(rng.randint(90, 3420)), 'value': Decimal(rng.randint(0, 40))}
+            for i in range(n)]
+
+
+PLAYER_FIELDS = queries.PLAYER_FIELDS.parse('player_id,first_name,last_name,photo_url')
+
+# name -> (setup(n, rng) -> state, run(state))
+CASES = {
+    'players_page': (player_rows, lambda rows: queries.page_response(
+        queries.PLAYER_FIELDS.project(queries.shape_players(rows), None), None).body),
+    'players_fields': (player_rows, lambda rows: queries.page_response(
+        queries.PLAYER_FIELDS.project(queries.shape_players(rows), PLAYER_FIELDS), None).body),
+    'page_cursor': (lambda n, rng: player_rows(n + 1, rng),
+                    lambda rows: split_page(rows, queries.PLAYERS_SORT, len(rows) - 1)),
+    'medical_reports': (medical_report_rows, lambda rows: queries.page_response(
+        queries.shape_medical_reports(rows), None).body),
+    'player_profile': (profile_row, lambda row: dumps(queries.shape_player_profile(row))),
+    'lineup_diff': (lineups, lambda saves: [_diff_slots(stored, submitted) for stored, submitted in saves]),
+    'season_summary': (season_rows, lambda rows: season_stats.player_summary(1, rows)),
+    'leaderboard': (leaderboard_rows, lambda rows: leaderboards.shape(rows, 'goals')),
+    'legacy_players': (player_rows, legacy),
+}
+
+
+def measure(name, n, repeat, seed):
+    setup, run = CASES[name]
+    timings = []
+    for _ in range(repeat):
+        state = setup(n, random.Random(seed))
+        start = time.perf_counter()
+        run(state)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    state = setup(n, random.Random(seed))
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = run(state)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        'rows': n,
+        'best_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'peak_kib': round((peak - before) / 1024, 1),
+        'retained_kib': round((after - before) / 1024, 1),
+    }
+
+
+def regressions(results, baseline, tolerance):
+    slower = []
+    for key, r in results.items():
+        old = baseline.get(key)
+        if old and old['median_ms'] and r['median_ms'] > old['median_ms'] * (1 + tolerance / 100):
+            slower.append((key, old['median_ms'], r['median_ms']))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated row counts")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default=None, help=f"comma-separated cases: {', '.join(CASES)}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    parser.add_argument("--baseline", default=None, help="JSON from an earlier --out to compare against")
+    parser.add_argument("--tolerance", type=float, default=15, help="percent slower that counts as a regression")
+    args = parser.parse_args()
+
+    names = args.only.split(',') if args.only else list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    results = {}
+    print(f"best/median of {args.repeat} runs; allocations from one run under tracemalloc")
+    print(f"  {'case':<16} {'rows':>7} {'best ms':>10} {'median ms':>10} {'peak KiB':>11} {'kept KiB':>11}")
+    for name in names:
+        for n in sizes:
+            r = measure(name, n, args.repeat, args.seed)
+            results[f"{name}/{n}"] = r
+            print(f"  {name:<16} {n:>7} {r['best_ms']:>10.2f} {r['median_ms']:>10.2f} "
+                  f"{r['peak_kib']:>11.1f} {r['retained_kib']:>11.1f}")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'python': sys.version.split()[0], 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"Saved {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(results, json.load(f)['results'], args.tolerance)
+        for key, old, new in slower:
+            print(f"REGRESSION {key}: median {old:.2f} -> {new:.2f} ms")
+        if slower:
+            sys.exit(1)
+        print(f"No case is more than {args.tolerance:g}% slower than {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""End-to-end load test: the web client's route mix at fixed concurrency, per-route latency.
+
+    python benchmarks/load_test.py --url http://localhost:8000 [--concurrency 1,8,32] [--duration 30]
+    python benchmarks/load_test.py --boot [--concurrency 8,32]
+    python benchmarks/load_test.py --boot --reset --scales 1,10,50 --out results.json
+    python benchmarks/load_test.py --compare before.json after.json
+
+--url drives a server that is already running. --boot starts the app in this process (uvicorn
+on a background thread, against the DB_* database from .env), so a run measures the working
+tree as it is. --reset (with --boot) drops and recreates the SOMS database before each scale:
+SOMS_db_create.py, then generate_dataset.py --scale N. It is destructive, so use a throwaway
+database.
+
+Each of --concurrency workers loops over page loads picked by MIX weight until --duration runs
+out, one request at a time on its own keep-alive connection (a closed loop: throughput is what
+the server sustains at that concurrency). A page load is the requests the Next.js page makes:
+
+  dashboard     /dashboard/summary, /fixtures/upcoming
+  roster        /players?fields=..., every page (limit=1000, as apiFetchAllPages does)
+  player_page   /player_details/{id}, /player/{id}, /medical_reports/{id}
+  lineup_save   POST /lineup/create with the XI of a match that has stats, in shuffled slots
+  medical_list  /medical_reports, every page
+
+Results (requests, errors, throughput, p50/p95/p99 per route) print as a table and, with --out,
+are saved as JSON together with the commit they were measured on; --compare diffs two files.
+"""
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+MIX = {'dashboard': 30, 'roster': 10, 'player_page': 40, 'lineup_save': 10, 'medical_list': 10}
+ROSTER_FIELDS = 'player_id,first_name,last_name,positions,is_active,is_injured,photo_url'
+PAGE_LIMIT = 1000
+PERCENTILES = (50, 95, 99)
+# Every run's dataset is generated as of this date, so a scale means the same rows each time
+DATASET_AS_OF = '2026-06-30'
+
+
+class Client:
+    """One keep-alive connection; records (route, seconds, ok) for every request"""
+
+    def __init__(self, base_url, record):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.record = record
+        self.conn = None
+
+    def request(self, route, method, path, body=None):
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {'Content-Type': 'application/json'} if payload else {}
+        started = time.perf_counter()
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+            ok = response.status < 400
+        except (OSError, http.client.HTTPException):
+            self.close()
+            data, ok = None, False
+        self.record(route, time.perf_counter() - started, ok)
+        return json.loads(data) if ok and data else None
+
+    def get(self, route, path):
+        return self.request(route, 'GET', path)
+
+    def get_all_pages(self, route, path):
+        sep = '&' if '?' in path else '?'
+        page_cursor = None
+        while True:
+            query = f"{sep}limit={PAGE_LIMIT}" + (f"&cursor={quote(page_cursor)}" if page_cursor else "")
+            page = self.get(route, path + query)
+            page_cursor = page and page.get('next_cursor')
+            if not page_cursor:
+                return
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class Workload:
+    """Ids the page loads draw from, discovered from the running server"""
+
+    def __init__(self, client):
+        players = client.get('setup', f"/players?fields=player_id&limit={PAGE_LIMIT}") or {}
+        self.player_ids = [p['player_id'] for p in players.get('data', [])]
+        formations = client.get('setup', "/formations") or {}
+        self.formation_ids = [f['formation_id'] for f in formations.get('data', [])]
+        stats = client.get('setup', f"/player_match_stats?fields=match_id,team_id,player_id&limit={PAGE_LIMIT}") or {}
+        squads = {}
+        for row in stats.get('data', []):
+            if row['team_id'] is not None:
+                squads.setdefault((row['match_id'], row['team_id']), []).append(row['player_id'])
+        self.squads = [(key, players[:11]) for key, players in sorted(squads.items()) if len(players) >= 11]
+        if not self.player_ids:
+            raise SystemExit("No players found; seed the database first")
+
+    def scenarios(self):
+        mix = dict(MIX)
+        if not (self.squads and self.formation_ids):
+            print("No match with 11 stat lines and a formation; lineup_save is left out of the mix")
+            del mix['lineup_save']
+        return mix
+
+    def run(self, name, client, rng):
+        if name == 'dashboard':
+            client.get('/dashboard/summary', "/dashboard/summary")
+            client.get('/fixtures/upcoming', "/fixtures/upcoming")
+        elif name == 'roster':
+            client.get_all_pages('/players', f"/players?fields={ROSTER_FIELDS}")
+        elif name == 'player_page':
+            player_id = rng.choice(self.player_ids)
+            client.get('/player_details/{id}', f"/player_details/{player_id}")
+            client.get('/player/{id}', f"/player/{player_id}")
+            client.get('/medical_reports/{id}', f"/medical_reports/{player_id}")
+        elif name == 'lineup_save':
+            (match_id, team_id), players = rng.choice(self.squads)
+            players = rng.sample(players, len(players))
+            client.request('/lineup/create', 'POST', "/lineup/create", {
+                'match_id': match_id, 'team_id': team_id, 'formation_id': rng.choice(self.formation_ids),
+                'players': {slot_no: player_id for slot_no, player_id in enumerate(players, start=1)},
+            })
+        elif name == 'medical_list':
+            client.get_all_pages('/medical_reports', "/medical_reports")
+
+
+def percentile(ordered, p):
+    # Nearest rank
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(samples, duration):
+    routes = {}
+    for route, timings in sorted(samples.items()):
+        ok = sorted(seconds for seconds, success in timings if success)
+        routes[route] = {
+            'requests': len(timings),
+            'errors': len(timings) - len(ok),
+            'rps': round(len(timings) / duration, 2),
+            'mean_ms': round(statistics.fmean(ok) * 1000, 2) if ok else None,
+            **{f'p{p}_ms': round(percentile(ok, p) * 1000, 2) if ok else None for p in PERCENTILES},
+        }
+    total = sum(r['requests'] for r in routes.values())
+    return {'routes': routes, 'requests': total, 'errors': sum(r['errors'] for r in routes.values()),
+            'rps': round(total / duration, 2)}
+
+
+def run_level(base_url, workload, concurrency, duration, warmup, seed):
+    """Drive the mix with `concurrency` workers; returns the summary of the measured window"""
+    samples = {}
+    lock = threading.Lock()
+    measuring = threading.Event()
+    stop = threading.Event()
+
+    def record(route, seconds, ok):
+        if measuring.is_set():
+            with lock:
+                samples.setdefault(route, []).append((seconds, ok))
+
+    mix = workload.scenarios()
+    names, weights = list(mix), list(mix.values())
+
+    def worker(n):
+        rng = random.Random(seed * 1000 + n)
+        client = Client(base_url, record)
+        try:
+            while not stop.is_set():
+                workload.run(rng.choices(names, weights)[0], client, rng)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(n,), daemon=True) for n in range(concurrency)]
+    for t in threads:
+        t.start()
+    time.sleep(warmup)
+    measuring.set()
+    started = time.perf_counter()
+    time.sleep(duration)
+    measuring.clear()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for t in threads:
+        t.join()
+    return summarize(samples, elapsed)
+
+
+def print_level(label, result):
+    print(f"\n{label}: {result['rps']} req/s, {result['requests']} requests, {result['errors']} errors")
+    print(f"  {'route':<24} {'reqs':>7} {'err':>5} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for route, r in result['routes'].items():
+        cells = ' '.join(f"{r[f'p{p}_ms'] if r[f'p{p}_ms'] is not None else '-':>9}" for p in PERCENTILES)
+        print(f"  {route:<24} {r['requests']:>7} {r['errors']:>5} {r['rps']:>8} {cells}")
+
+
+class BootedServer:
+    """The app from the working tree, served by uvicorn on a background thread"""
+
+    def __init__(self, port):
+        import uvicorn
+
+        os.chdir(SERVER_DIR)
+        self.port = port
+        self.server = uvicorn.Server(uvicorn.Config("main:app", host="127.0.0.1", port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise SystemExit("The app failed to start")
+            time.sleep(0.05)
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def reset_database(scale):
+    """Recreate SOMS with the sample seed plus a generated dataset at `scale`"""
+    import dotenv
+    import mysql.connector
+
+    dotenv.load_dotenv(os.path.join(SERVER_DIR, '.env'))
+    conn = mysql.connector.connect(host=os.getenv('DB_HOST', 'localhost'), user=os.getenv('DB_USER', 'root'),
+                                   password=os.getenv('DB_PASSWORD', 'adminpass'))
+    try:
+        conn.cursor().execute("DROP DATABASE IF EXISTS SOMS")
+    finally:
+        conn.close()
+    for script in (["SOMS_db_create.py"], ["generate_dataset.py", "--scale", str(scale), "--as-of", DATASET_AS_OF]):
+        subprocess.run([sys.executable, *script], cwd=SERVER_DIR, check=True, stdout=subprocess.DEVNULL)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SERVER_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = {(r['scale'], r['concurrency']): r for r in json.load(f)['runs']}
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{before_path} -> {after_path}")
+    for run in after['runs']:
+        old = before.get((run['scale'], run['concurrency']))
+        if old is None:
+            continue
+        print(f"\nscale {run['scale'] if run['scale'] is not None else '-'}, concurrency {run['concurrency']}: "
+              f"{old['rps']} -> {run['rps']} req/s ({_change(old['rps'], run['rps'])})")
+        for route, r in run['routes'].items():
+            o = old['routes'].get(route)
+            if o is None:
+                continue
+            deltas = '  '.join(f"p{p} {o[f'p{p}_ms']} -> {r[f'p{p}_ms']} ms ({_change(o[f'p{p}_ms'], r[f'p{p}_ms'])})"
+                               for p in (50, 95))
+            print(f"  {route:<24} {deltas}")
+
+
+def _change(old, new):
+    if not old or new is None:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default=None, help="server to drive (default: --boot)")
+    target.add_argument("--boot", action="store_true", help="start the app in this process")
+    target.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="diff two result files")
+    parser.add_argument("--port", type=int, default=8765, help="port for --boot")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated worker counts")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=5, help="unmeasured seconds before each level")
+    parser.add_argument("--scales", default=None, help="with --reset: comma-separated generate_dataset scales")
+    parser.add_argument("--reset", action="store_true", help="recreate the SOMS database for each scale (destructive)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="write results as JSON")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.scales and not (args.reset and not args.url):
+        parser.error("--scales needs --reset and a booted app (not --url)")
+    levels = [int(c) for c in args.concurrency.split(',')]
+    scales = [float(s) for s in args.scales.split(',')] if args.scales else [None]
+
+    runs = []
+    for scale in scales:
+        if scale is not None:
+            print(f"Resetting the database at scale {scale:g}")
+            reset_database(scale)
+        with nullcontext(args.url) if args.url else BootedServer(args.port) as base_url:
+            workload = Workload(Client(base_url, lambda *sample: None))
+            for concurrency in levels:
+                result = run_level(base_url, workload, concurrency, args.duration, args.warmup, args.seed)
+                print_level(f"scale {scale if scale is not None else '-'}, concurrency {concurrency}", result)
+                runs.append({'scale': scale, 'concurrency': concurrency, **result})
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({
+                'commit': git_commit(),
+                'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'target': args.url or 'boot',
+                'duration_s': args.duration,
+                'mix': MIX,
+                'runs': runs,
+            }, f, indent=2)
+        print(f"\nSaved {args.out}")
+
+
+if __name__ == "__main__":
+    main()
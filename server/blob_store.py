@@ -0,0 +1,144 @@
+"""Content-addressed storage for player photos and their variants, keyed by sha256"""
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Optional
+
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class BlobNotFound(Exception):
+    pass
+
+
+class BlobStore(ABC):
+    """Immutable blobs addressed by the sha256 of their bytes.
+
+    Storing the same bytes twice is a no-op, so identical photos share one copy.
+    """
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Store `data` and return its sha256 hex digest"""
+
+    def put_file(self, src_path: str, digest: str) -> str:
+        """Store the file at `src_path`, whose sha256 the caller already computed, consuming it"""
+        with open(src_path, 'rb') as f:
+            data = f.read()
+        os.unlink(src_path)
+        return self.put(data)
+
+    @abstractmethod
+    def get(self, digest: str) -> bytes:
+        """Return the bytes for `digest`, raising BlobNotFound if absent"""
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, digest: str) -> None:
+        ...
+
+    def local_path(self, digest: str) -> Optional[str]:
+        # Stores backed by the local filesystem return a path so it can be served zero-copy
+        return None
+
+    def staging_dir(self) -> Optional[str]:
+        # Where uploads should be spooled so put_file() can adopt them cheaply; None means anywhere
+        return None
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs on disk under `root`, fanned out as root/ab/cd/abcd..."""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def _path(self, digest: str) -> str:
+        if not _DIGEST_RE.match(digest or ''):
+            raise ValueError(f"Not a sha256 hex digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def _write_atomic(self, path: str, write) -> None:
+        # Write to a temp file and rename, so readers never see a partial blob
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not os.path.exists(path):
+            self._write_atomic(path, lambda f: f.write(data))
+        return digest
+
+    def put_file(self, src_path: str, digest: str) -> str:
+        path = self._path(digest)
+        if os.path.exists(path):
+            os.unlink(src_path)
+            return digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            # Same filesystem: a rename, no bytes copied
+            os.replace(src_path, path)
+        except OSError:
+            with open(src_path, 'rb') as src:
+                self._write_atomic(path, lambda f: shutil.copyfileobj(src, f))
+            os.unlink(src_path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        try:
+            with open(self._path(digest), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise BlobNotFound(digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.isfile(self._path(digest))
+
+    def delete(self, digest: str) -> None:
+        try:
+            os.unlink(self._path(digest))
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, digest: str) -> Optional[str]:
+        path = self._path(digest)
+        return path if os.path.isfile(path) else None
+
+    def staging_dir(self) -> Optional[str]:
+        # Inside root, so put_file() is a rename rather than a copy
+        path = os.path.join(self.root, '.incoming')
+        os.makedirs(path, exist_ok=True)
+        return path
+
+
+_BACKENDS = {
+    'local': lambda: LocalBlobStore(os.getenv(
+        'PHOTO_STORE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'photo_store'))),
+}
+
+_store = None
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    if _store is None:
+        backend = os.getenv('PHOTO_STORE_BACKEND', 'local').strip().lower()
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown PHOTO_STORE_BACKEND {backend!r}; expected one of {', '.join(_BACKENDS)}")
+        _store = _BACKENDS[backend]()
+    return _store
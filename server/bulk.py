@@ -0,0 +1,81 @@
+"""Batched creation for the /player/bulk and /staff/bulk endpoints.
+
+Items are validated up front, then inserted one statement per row inside the caller's
+transaction, so the whole batch costs one commit and each row's id comes from its own
+lastrowid. A multi-row INSERT would be fewer round trips, but its ids can't be derived from
+lastrowid: with innodb_autoinc_lock_mode=2 (the MySQL 8 default) concurrent inserts may
+interleave their auto-increment values. A row that hits a per-row error (duplicate email,
+out-of-range value) is rolled back on its own and reported; the transaction carries on.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import mysql.connector
+from pydantic import ValidationError
+
+MAX_BULK_ITEMS = 5000
+
+ATOMIC = 'atomic'      # all items are created, or none are
+PARTIAL = 'partial'    # valid items are created, the rest are reported
+BULK_MODES = (ATOMIC, PARTIAL)
+
+# Errors caused by the row itself; anything else (lost connection, deadlock) fails the request
+_ROW_ERRORS = (mysql.connector.IntegrityError, mysql.connector.DataError)
+
+
+@dataclass
+class BulkResult:
+    id_name: str
+    total: int
+    ids: Dict[int, int] = field(default_factory=dict)        # item index -> generated id
+    errors: Dict[int, Any] = field(default_factory=dict)     # item index -> error message(s)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def rolled_back(self):
+        # Atomic failure: nothing was committed, so no id is real
+        self.ids.clear()
+
+    def to_response(self, mode: str) -> dict:
+        results = []
+        for index in range(self.total):
+            if index in self.errors:
+                results.append({"index": index, "status": "error", "error": self.errors[index]})
+            elif index in self.ids:
+                results.append({"index": index, "status": "created", self.id_name: self.ids[index]})
+            else:
+                results.append({"index": index, "status": "not_created"})
+        if self.ok:
+            status = "success"
+        elif self.ids:
+            status = "partial"
+        else:
+            status = "failed"
+        return {"status": status, "mode": mode, "created": len(self.ids), "failed": len(self.errors), "results": results}
+
+
+def validate_items(model, items: List[dict], result: BulkResult):
+    """Validate every item against `model`; returns [(index, instance)] and records the failures"""
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, model.model_validate(item)))
+        except ValidationError as e:
+            result.errors[index] = [
+                {"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors(include_url=False)
+            ]
+    return valid
+
+
+def insert_rows(cursor, insert_sql: str, rows, result: BulkResult):
+    """Insert `rows` ([(index, params)]) one by one, recording generated ids and row errors in `result`"""
+    for index, params in rows:
+        try:
+            # A failed single-row INSERT is rolled back on its own; the transaction carries on
+            cursor.execute(insert_sql, params)
+        except _ROW_ERRORS as err:
+            result.errors[index] = str(err)
+            continue
+        result.ids[index] = cursor.lastrowid
@@ -0,0 +1,91 @@
+"""Small in-process response cache with per-key invalidation.
+
+Entries expire after `ttl` seconds and the least recently used are evicted beyond `maxsize`.
+Writers call invalidate(key) after committing. Readers take a token with begin(key) before
+querying and pass it to set(): if the key was invalidated in between, the (possibly stale)
+value is dropped instead of cached.
+
+The cache is per process; with several workers, an invalidation only reaches the worker that
+handled the write, and the TTL bounds how stale the others can be.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    def __init__(self, maxsize=1024, ttl=60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._generations = {}          # key -> invalidation count
+        self._epoch = 0                 # bumped by clear()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def begin(self, key):
+        with self._lock:
+            return (self._epoch, self._generations.get(key, 0))
+
+    def set(self, key, value, token) -> bool:
+        with self._lock:
+            if token != (self._epoch, self._generations.get(key, 0)):
+                return False
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses}
+
+
+# Encoded /player_details responses, keyed by player_id
+player_profiles = TTLCache(
+    maxsize=int(os.getenv('PLAYER_PROFILE_CACHE_SIZE') or 1024),
+    ttl=float(os.getenv('PLAYER_PROFILE_CACHE_TTL') or 60),
+)
+
+
+def invalidate_player(player_id):
+    player_profiles.invalidate(player_id)
+
+
+# Encoded /leaderboards responses, keyed by their full parameter set. Any stat line write can
+# move any ranking, so writes clear the whole cache rather than tracking which boards changed.
+leaderboards = TTLCache(
+    maxsize=int(os.getenv('LEADERBOARD_CACHE_SIZE') or 256),
+    ttl=float(os.getenv('LEADERBOARD_CACHE_TTL') or 300),
+)
+
+
+def invalidate_stats():
+    leaderboards.clear()
@@ -0,0 +1,147 @@
+"""Maintained row counts behind GET /dashboard/summary.
+
+Every write path that adds, removes or re-flags a player, staff member, scout or medical report
+bumps the matching counters with bump() on its own cursor, inside its own transaction, so the
+counts commit or roll back together with the change. The dashboard then reads a handful of
+primary-key rows instead of COUNT(*)-scanning the tables. rebuild() recomputes everything from
+the base tables (used after seeding, or to repair drift after manual SQL edits).
+"""
+
+STAFF_TOTAL = 'staff_total'
+SCOUTS_TOTAL = 'scouts_total'
+PLAYERS_TOTAL = 'players_total'
+PLAYERS_ACTIVE = 'players_active'
+PLAYERS_INJURED = 'players_injured'
+MEDICAL_REPORTS_TOTAL = 'medical_reports_total'
+STAFF_TYPE_PREFIX = 'staff_type:'
+
+
+def staff_type_counter(staff_type: str) -> str:
+    return STAFF_TYPE_PREFIX + staff_type
+
+
+def bump(cursor, name: str, delta: int = 1) -> None:
+    bump_many(cursor, {name: delta})
+
+
+def bump_many(cursor, deltas: dict) -> None:
+    """Add each delta to its counter in one statement, creating missing counters at the delta"""
+    deltas = {name: d for name, d in deltas.items() if d}
+    if not deltas:
+        return
+    placeholders = ", ".join(["(%s, %s)"] * len(deltas))
+    params = [v for item in sorted(deltas.items()) for v in item]  # fixed order, so concurrent bumps lock rows alike
+    cursor.execute(f"""
+        INSERT INTO dashboard_counter (name, value) VALUES {placeholders}
+        ON DUPLICATE KEY UPDATE value = value + VALUES(value)
+    """, params)
+
+
+def player_deltas(before=None, after=None) -> dict:
+    """Counter changes for a player going from `before` to `after`.
+
+    Each side is a mapping with is_active / is_injured, or None for "no such row", so the same
+    function covers create (None -> row), delete (row -> None) and status changes.
+    """
+    deltas = {}
+    for state, sign in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        deltas[PLAYERS_TOTAL] = deltas.get(PLAYERS_TOTAL, 0) + sign
+        if state.get('is_active'):
+            deltas[PLAYERS_ACTIVE] = deltas.get(PLAYERS_ACTIVE, 0) + sign
+        if state.get('is_injured'):
+            deltas[PLAYERS_INJURED] = deltas.get(PLAYERS_INJURED, 0) + sign
+    return deltas
+
+
+def staff_deltas(before_type=None, after_type=None) -> dict:
+    deltas = {}
+    if before_type is not None:
+        deltas[STAFF_TOTAL] = -1
+        deltas[staff_type_counter(before_type)] = -1
+    if after_type is not None:
+        deltas[STAFF_TOTAL] = deltas.get(STAFF_TOTAL, 0) + 1
+        key = staff_type_counter(after_type)
+        deltas[key] = deltas.get(key, 0) + 1
+    return deltas
+
+
+def rebuild(cursor) -> None:
+    """Recompute every counter from the base tables; run inside a transaction"""
+    cursor.execute("DELETE FROM dashboard_counter")
+    cursor.execute("""
+        INSERT INTO dashboard_counter (name, value)
+        SELECT %s, COUNT(*) FROM staff
+        UNION ALL SELECT %s, COUNT(*) FROM scout
+        UNION ALL SELECT %s, COUNT(*) FROM player
+        UNION ALL SELECT %s, COALESCE(SUM(is_active), 0) FROM player
+        UNION ALL SELECT %s, COALESCE(SUM(is_injured), 0) FROM player
+        UNION ALL SELECT %s, COUNT(*) FROM medical_report
+        UNION ALL SELECT CONCAT(%s, staff_type), COUNT(*) FROM staff GROUP BY staff_type
+    """, (STAFF_TOTAL, SCOUTS_TOTAL, PLAYERS_TOTAL, PLAYERS_ACTIVE, PLAYERS_INJURED,
+          MEDICAL_REPORTS_TOTAL, STAFF_TYPE_PREFIX))
+
+
+UPCOMING_FIXTURES = 'upcoming_fixtures'
+
+# Counters by primary key, plus the one number that depends on today's date: upcoming fixtures,
+# a range count over idx_match_date_time that only touches future matches. One round trip.
+_SUMMARY_SQL = """
+    SELECT name, value FROM dashboard_counter
+    UNION ALL
+    SELECT %s, COUNT(*) FROM match_table WHERE match_date >= CURDATE()
+"""
+
+
+def _as_dict(rows) -> dict:
+    if rows and isinstance(rows[0], dict):
+        return {r['name']: int(r['value']) for r in rows}
+    return {name: int(value) for name, value in rows}
+
+
+def read_counters(cursor, *names) -> dict:
+    """Current value of each named counter (0 if it was never bumped)"""
+    placeholders = ", ".join(["%s"] * len(names))
+    cursor.execute(f"SELECT name, value FROM dashboard_counter WHERE name IN ({placeholders})", names)
+    counts = _as_dict(cursor.fetchall() or [])
+    return {name: counts.get(name, 0) for name in names}
+
+
+def read_summary(cursor) -> dict:
+    cursor.execute(_SUMMARY_SQL, (UPCOMING_FIXTURES,))
+    counts = _as_dict(cursor.fetchall() or [])
+    staff_by_type = {name[len(STAFF_TYPE_PREFIX):]: value for name, value in sorted(counts.items())
+                     if name.startswith(STAFF_TYPE_PREFIX) and value}
+    staff_total = counts.get(STAFF_TOTAL, 0)
+    return {
+        "total_users": staff_total + counts.get(SCOUTS_TOTAL, 0),
+        "staff": {"total": staff_total, "by_type": staff_by_type},
+        "players": {
+            "total": counts.get(PLAYERS_TOTAL, 0),
+            "active": counts.get(PLAYERS_ACTIVE, 0),
+            "injured": counts.get(PLAYERS_INJURED, 0),
+        },
+        "upcoming_fixtures": counts.get(UPCOMING_FIXTURES, 0),
+        # medical_report has no open/closed status, so only the total is tracked; players.injured
+        # is the closest thing to "open cases" the schema records
+        "medical_reports": {"total": counts.get(MEDICAL_REPORTS_TOTAL, 0)},
+    }
+
+
+if __name__ == "__main__":
+    from db_connect_module import get_db_connection
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        conn.start_transaction()
+        rebuild(cursor)
+        conn.commit()
+        print("Dashboard counters rebuilt")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,296 @@
+import asyncio
+import collections
+import time
+from contextlib import asynccontextmanager
+
+import mysql.connector.aio
+from mysql.connector import errors
+
+import metrics
+import request_stats
+from db_connect_module import connection_settings, pool_settings
+from db_instrumentation import AsyncInstrumentedCursor
+
+
+async def _connect():
+    return await mysql.connector.aio.connect(**connection_settings())
+
+
+class _AsyncPoolEntry:
+    __slots__ = ("raw", "created_at", "last_used")
+
+    def __init__(self, raw, now):
+        self.raw = raw
+        self.created_at = now
+        self.last_used = now
+
+
+class AsyncPooledConnection:
+    """Checked-out async connection; `await close()` hands it back to the pool."""
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    async def close(self):
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        await self._pool._release(entry)
+
+    async def discard(self):
+        # See PooledConnection.discard
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        await self._pool._release(entry, reusable=False)
+
+    async def cursor(self, *args, **kwargs):
+        return AsyncInstrumentedCursor(await self.__getattr__("cursor")(*args, **kwargs))
+
+    def __getattr__(self, name):
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise errors.InterfaceError("Connection has already been returned to the pool")
+        return getattr(entry.raw, name)
+
+
+class AsyncConnectionPool:
+    """asyncio counterpart of db_connect_module.ConnectionPool.
+
+    Uses the same DB_POOL_* settings and exposes the same counters. There is no reaper
+    task; idle/expired connections are trimmed opportunistically on checkout instead.
+    """
+
+    def __init__(self, min_size=2, max_size=20, timeout=10.0, max_idle=300.0, max_age=1800.0,
+                 ping_interval=0.0, reap_interval=30.0, connect=_connect):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.ping_interval = ping_interval
+        self.reap_interval = reap_interval
+        self._connect = connect
+
+        self._cond = asyncio.Condition()
+        self._idle = collections.deque()
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+        self._recycled = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._closed = False
+        self._next_reap = 0.0
+
+    @classmethod
+    def from_env(cls):
+        return cls(**pool_settings())
+
+    async def acquire(self):
+        started = time.perf_counter()
+        try:
+            return await self._acquire()
+        finally:
+            waited = time.perf_counter() - started
+            request_stats.record_wait(waited)
+            metrics.DB_CHECKOUT_WAIT.labels("async").observe(waited)
+
+    async def _acquire(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        if loop.time() >= self._next_reap:
+            self._next_reap = loop.time() + self.reap_interval
+            await self.reap()
+
+        async with self._cond:
+            while True:
+                if self._closed:
+                    raise errors.PoolError("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    entry = None
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise errors.PoolError(
+                        f"Timed out after {self.timeout}s waiting for a database connection "
+                        f"({self.max_size} in use)"
+                    )
+                self._waiting += 1
+                try:
+                    await asyncio.wait_for(self._cond.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._waiting -= 1
+            self._in_use += 1
+            self._checkouts += 1
+
+        try:
+            if entry is not None and not await self._is_usable(entry, loop.time()):
+                await self._close_quietly(entry)
+                entry = None
+            if entry is None:
+                entry = _AsyncPoolEntry(await self._connect(), loop.time())
+                self._created += 1
+        except BaseException:
+            async with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return AsyncPooledConnection(self, entry)
+
+    async def _is_usable(self, entry, now):
+        if self.max_age and now - entry.created_at >= self.max_age:
+            return False
+        if now - entry.last_used >= self.ping_interval:
+            try:
+                await entry.raw.ping(reconnect=False)
+            except errors.Error:
+                return False
+        return True
+
+    async def _release(self, entry, reusable=True):
+        healthy = reusable
+        try:
+            raw = entry.raw
+            if healthy and raw.unread_result:
+                await raw.consume_results()
+            if healthy and raw.in_transaction:
+                await raw.rollback()
+        except errors.Error:
+            healthy = False
+
+        now = asyncio.get_running_loop().time()
+        if self.max_age and now - entry.created_at >= self.max_age:
+            healthy = False
+
+        async with self._cond:
+            self._in_use -= 1
+            if healthy and not self._closed:
+                entry.last_used = now
+                self._idle.append(entry)
+                entry = None
+            else:
+                self._size -= 1
+            self._cond.notify()
+        if entry is not None:
+            await self._close_quietly(entry)
+
+    async def _close_quietly(self, entry):
+        self._recycled += 1
+        try:
+            await entry.raw.close()
+        except Exception:
+            pass
+
+    async def reap(self):
+        now = asyncio.get_running_loop().time()
+        expired = []
+        async with self._cond:
+            keep = collections.deque()
+            while self._idle:
+                entry = self._idle.popleft()
+                too_old = self.max_age and now - entry.created_at >= self.max_age
+                too_idle = (self.max_idle and now - entry.last_used >= self.max_idle
+                            and self._size - len(expired) > self.min_size)
+                if too_old or too_idle:
+                    expired.append(entry)
+                else:
+                    keep.append(entry)
+            self._idle = keep
+            self._size -= len(expired)
+        for entry in expired:
+            await self._close_quietly(entry)
+
+    def stats(self):
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "waiting": self._waiting,
+            "created": self._created,
+            "recycled": self._recycled,
+            "checkouts": self._checkouts,
+            "timeouts": self._timeouts,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+        }
+
+    async def close(self):
+        async with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), collections.deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            await self._close_quietly(entry)
+
+
+_pool = None
+
+
+def get_async_pool():
+    # Created lazily from inside the running event loop
+    global _pool
+    if _pool is None:
+        _pool = AsyncConnectionPool.from_env()
+    return _pool
+
+
+@asynccontextmanager
+async def async_db_connection():
+    conn = await get_async_pool().acquire()
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+
+@asynccontextmanager
+async def async_cursor(conn, dictionary=True):
+    cursor = await conn.cursor(dictionary=dictionary)
+    try:
+        yield cursor
+    finally:
+        await cursor.close()
+
+
+async def fetch_all(query, params=None, dictionary=True):
+    async with async_db_connection() as conn:
+        async with async_cursor(conn, dictionary=dictionary) as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchall()
+
+
+async def fetch_one(query, params=None, dictionary=True):
+    async with async_db_connection() as conn:
+        async with async_cursor(conn, dictionary=dictionary) as cursor:
+            await cursor.execute(query, params)
+            row = await cursor.fetchone()
+            if row is not None:
+                await cursor.fetchall()
+            return row
+
+
+def async_pool_stats():
+    if _pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **_pool.stats()}
+
+
+async def close_async_pool():
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,11 +1,405 @@
 import mysql.connector
+from mysql.connector import errors
+import collections
+import random
 import os
+import threading
+import time
 
-def get_db_connection():
-    connection = mysql.connector.connect(
+import metrics
+import request_stats
+from db_instrumentation import InstrumentedConnection, InstrumentedCursor
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name, default):
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def connection_settings():
+    return dict(
         host=os.getenv('DB_HOST', 'localhost'),
         user=os.getenv('DB_USER', 'root'),
         password=os.getenv('DB_PASSWORD', 'adminpass'),
         database=os.getenv('DB_NAME', 'SOMS')
     )
-    return connection
\ No newline at end of file
+
+
+def _connect():
+    return mysql.connector.connect(**connection_settings())
+
+
+def pool_settings():
+    return dict(
+        min_size=_env_int('DB_POOL_MIN_SIZE', 2),
+        max_size=_env_int('DB_POOL_MAX_SIZE', 20),
+        timeout=_env_float('DB_POOL_TIMEOUT', 10.0),
+        max_idle=_env_float('DB_POOL_MAX_IDLE', 300.0),
+        max_age=_env_float('DB_POOL_MAX_AGE', 1800.0),
+        ping_interval=_env_float('DB_POOL_PING_INTERVAL', 0.0),
+        reap_interval=_env_float('DB_POOL_REAP_INTERVAL', 30.0),
+    )
+
+
+class _PoolEntry:
+    __slots__ = ("raw", "created_at", "last_used")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class PooledConnection:
+    """A checked-out connection. close() hands it back to the pool instead of disconnecting,
+    so existing `connection.close()` calls in main.py/models.py keep working unchanged."""
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    def close(self):
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        self._pool._release(entry)
+
+    def discard(self):
+        """Close the underlying connection instead of returning it to the pool.
+
+        For connections abandoned mid-result (e.g. a client that stopped reading a stream),
+        where draining the unread rows just to reuse the connection would cost more than a new one.
+        """
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        self._pool._release(entry, reusable=False)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self.__getattr__("cursor")(*args, **kwargs))
+
+    def __getattr__(self, name):
+        entry = self.__dict__.get("_entry")
+        if entry is None:
+            raise errors.InterfaceError("Connection has already been returned to the pool")
+        return getattr(entry.raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe MySQL connection pool.
+
+    Connections are validated on checkout (max age + liveness ping), reset on return
+    (unread results consumed, open transaction rolled back) and reaped by a background
+    thread once they sit idle past max_idle while the pool is above min_size.
+    """
+
+    def __init__(self, min_size=2, max_size=20, timeout=10.0, max_idle=300.0, max_age=1800.0,
+                 ping_interval=0.0, reap_interval=30.0, connect=_connect):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_age = max_age
+        self.ping_interval = ping_interval
+        self.reap_interval = reap_interval
+        self._connect = connect
+
+        self._cond = threading.Condition()
+        self._idle = collections.deque()  # most recently used connections at the right
+        self._size = 0  # idle + in use + reserved slots currently being connected
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+        self._recycled = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._closed = False
+
+        self._reaper = threading.Thread(target=self._reap_loop, name="db-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    @classmethod
+    def from_env(cls):
+        return cls(**pool_settings())
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise errors.PoolError("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    # Reserve a slot now and connect outside the lock
+                    self._size += 1
+                    entry = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise errors.PoolError(
+                        f"Timed out after {self.timeout}s waiting for a database connection "
+                        f"({self.max_size} in use)"
+                    )
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            self._in_use += 1
+            self._checkouts += 1
+
+        try:
+            if entry is not None and not self._is_usable(entry):
+                self._close_quietly(entry)
+                entry = None
+            if entry is None:
+                entry = self._new_entry()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return PooledConnection(self, entry)
+
+    def _new_entry(self):
+        entry = _PoolEntry(self._connect())
+        with self._cond:
+            self._created += 1
+        return entry
+
+    def _is_usable(self, entry):
+        now = time.monotonic()
+        if self.max_age and now - entry.created_at >= self.max_age:
+            return False
+        if now - entry.last_used >= self.ping_interval:
+            try:
+                entry.raw.ping(reconnect=False)
+            except errors.Error:
+                return False
+        return True
+
+    def _release(self, entry, reusable=True):
+        healthy = reusable
+        try:
+            raw = entry.raw
+            if healthy and raw.unread_result:
+                raw.consume_results()
+            # Never hand out a connection with an open (possibly implicit) transaction:
+            # it would leak uncommitted writes or a stale REPEATABLE READ snapshot.
+            if healthy and raw.in_transaction:
+                raw.rollback()
+        except errors.Error:
+            healthy = False
+
+        now = time.monotonic()
+        if self.max_age and now - entry.created_at >= self.max_age:
+            healthy = False
+
+        with self._cond:
+            self._in_use -= 1
+            if healthy and not self._closed:
+                entry.last_used = now
+                self._idle.append(entry)
+                entry = None
+            else:
+                self._size -= 1
+            self._cond.notify()
+        if entry is not None:
+            self._close_quietly(entry)
+
+    def _close_quietly(self, entry):
+        with self._cond:
+            self._recycled += 1
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+
+    def _reap_loop(self):
+        while True:
+            try:
+                self.reap()
+            except Exception:
+                pass
+            with self._cond:
+                if self._closed:
+                    return
+                self._cond.wait(self.reap_interval)
+                if self._closed:
+                    return
+
+    def reap(self):
+        """Close expired idle connections, then top the pool back up to min_size."""
+        now = time.monotonic()
+        expired = []
+        with self._cond:
+            keep = collections.deque()
+            # Oldest-used connections sit at the left; those are the ones to trim first
+            while self._idle:
+                entry = self._idle.popleft()
+                too_old = self.max_age and now - entry.created_at >= self.max_age
+                too_idle = (self.max_idle and now - entry.last_used >= self.max_idle
+                            and self._size - len(expired) > self.min_size)
+                if too_old or too_idle:
+                    expired.append(entry)
+                else:
+                    keep.append(entry)
+            self._idle = keep
+            self._size -= len(expired)
+            missing = 0 if self._closed else max(0, self.min_size - self._size)
+            self._size += missing
+        for entry in expired:
+            self._close_quietly(entry)
+
+        for _ in range(missing):
+            try:
+                entry = self._new_entry()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                continue
+            with self._cond:
+                if self._closed:
+                    self._size -= 1
+                else:
+                    self._idle.appendleft(entry)
+                    entry = None
+                    self._cond.notify()
+            if entry is not None:
+                self._close_quietly(entry)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "created": self._created,
+                "recycled": self._recycled,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            }
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), collections.deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry)
+
+
+POOL_ENABLED = _env_bool('DB_POOL_ENABLED', True)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool.from_env()
+    return _pool
+
+
+def get_db_connection():
+    started = time.perf_counter()
+    try:
+        if not POOL_ENABLED:
+            return InstrumentedConnection(_connect())
+        return get_pool().acquire()
+    finally:
+        waited = time.perf_counter() - started
+        request_stats.record_wait(waited)
+        metrics.DB_CHECKOUT_WAIT.labels("sync").observe(waited)
+
+
+def discard_connection(connection):
+    # Pooled connections are dropped from the pool; unpooled ones are simply closed
+    try:
+        if isinstance(connection, PooledConnection):
+            connection.discard()
+        else:
+            connection.close()
+    except errors.Error:
+        pass
+
+
+def pool_stats():
+    if not POOL_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **get_pool().stats()}
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+# InnoDB picked this transaction as a deadlock victim: transient under concurrent writers, it's
+# detected at once, and the whole transaction can simply be rerun. A lock wait timeout (1205) is
+# not retried: each attempt has already waited innodb_lock_wait_timeout (50s by default).
+ER_LOCK_DEADLOCK = 1213
+RETRYABLE_ERRNOS = (ER_LOCK_DEADLOCK,)
+
+
+def run_transaction(work, attempts=3, backoff=0.05):
+    """Run `work(cursor)` in its own transaction and commit, rerunning it when chosen as a deadlock victim.
+
+    `work` must be safe to repeat: every attempt starts from a rolled-back transaction.
+    Returns whatever `work` returns; other errors roll back and propagate.
+    """
+    connection = get_db_connection()
+    try:
+        for attempt in range(1, attempts + 1):
+            connection.start_transaction()
+            cursor = connection.cursor()
+            try:
+                result = work(cursor)
+                connection.commit()
+                return result
+            except errors.Error as err:
+                connection.rollback()
+                if err.errno not in RETRYABLE_ERRNOS or attempt == attempts:
+                    raise
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+            time.sleep(backoff * attempt * (1 + random.random()))
+    finally:
+        connection.close()
@@ -0,0 +1,174 @@
+"""Cursor wrappers that account every statement to the current request (see request_stats.py) and
+to its query fingerprint (see query_log.py).
+
+The pooled connections (and get_db_connection() without a pool) hand these out from cursor(), so
+handlers, models and scripts get them without changing their `connection.cursor(...)` calls.
+They behave like the mysql-connector cursor they wrap: anything not overridden here
+(lastrowid, rowcount, description, ...) is passed straight through.
+
+Time spent in fetch*() counts as DB time too. With an unbuffered cursor that's where rows are
+actually read off the wire. For the same reason a statement is only handed to query_log once its
+rows are read: the result set is exhausted, the next statement runs or the cursor is closed.
+"""
+import time
+
+import query_log
+import request_stats
+
+
+class _StatementTracking:
+    __slots__ = ("_cursor", "_statement")
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._statement = None
+
+    def _started(self, operation, args, kwargs, seconds, failed, many=False):
+        request_stats.record_query(seconds)
+        statement = query_log.Statement(operation, query_log.statement_params(args, kwargs), seconds, many)
+        if failed:
+            statement.finish(failed=True)
+        else:
+            self._statement = statement
+
+    def _fetched(self, seconds, rows, exhausted):
+        request_stats.record_fetch(seconds, rows)
+        statement = self._statement
+        if statement is not None:
+            statement.seconds += seconds
+            if exhausted:
+                self._finish()
+
+    def _finish(self):
+        statement, self._statement = self._statement, None
+        if statement is not None:
+            statement.finish()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedCursor(_StatementTracking):
+    __slots__ = ()
+
+    def execute(self, operation, *args, **kwargs):
+        self._finish()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = self._cursor.execute(operation, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._started(operation, args, kwargs, time.perf_counter() - started, failed)
+
+    def executemany(self, operation, *args, **kwargs):
+        self._finish()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = self._cursor.executemany(operation, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._started(operation, args, kwargs, time.perf_counter() - started, failed, many=True)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(time.perf_counter() - started, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(time.perf_counter() - started, len(rows), not rows)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(time.perf_counter() - started, len(rows) if rows else 0, True)
+        return rows
+
+    def close(self):
+        self._finish()
+        return self._cursor.close()
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncInstrumentedCursor(_StatementTracking):
+    """InstrumentedCursor for mysql.connector.aio cursors"""
+
+    __slots__ = ()
+
+    async def execute(self, operation, *args, **kwargs):
+        self._finish()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await self._cursor.execute(operation, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._started(operation, args, kwargs, time.perf_counter() - started, failed)
+
+    async def executemany(self, operation, *args, **kwargs):
+        self._finish()
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await self._cursor.executemany(operation, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            self._started(operation, args, kwargs, time.perf_counter() - started, failed, many=True)
+
+    async def fetchone(self):
+        started = time.perf_counter()
+        row = await self._cursor.fetchone()
+        self._fetched(time.perf_counter() - started, 0 if row is None else 1, row is None)
+        return row
+
+    async def fetchmany(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = await self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(time.perf_counter() - started, len(rows), not rows)
+        return rows
+
+    async def fetchall(self):
+        started = time.perf_counter()
+        rows = await self._cursor.fetchall()
+        self._fetched(time.perf_counter() - started, len(rows) if rows else 0, True)
+        return rows
+
+    async def close(self):
+        self._finish()
+        return await self._cursor.close()
+
+
+class InstrumentedConnection:
+    """An unpooled connection whose cursors are instrumented (DB_POOL_ENABLED=false)"""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._raw.cursor(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._raw.close()
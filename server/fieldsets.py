@@ -0,0 +1,58 @@
+"""Sparse fieldsets (?fields=a,b,c) for the list endpoints.
+
+Each resource declares the columns it can return. A request's `fields` is validated against
+that whitelist and compiled into the SELECT list, so unrequested columns are never read.
+"""
+from typing import Optional
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+class FieldSet:
+    """Selectable columns of one resource.
+
+    `columns` maps output name -> SQL select expression, in output order. `virtual` maps
+    names computed after the query (e.g. photo_url) to the columns they are built from.
+    `hidden` columns can be selected internally but not requested.
+    """
+
+    def __init__(self, from_sql: str, columns: dict, virtual: Optional[dict] = None, hidden=()):
+        self.from_sql = from_sql.strip()
+        self.columns = dict(columns)
+        self.virtual = dict(virtual or {})
+        self.allowed = tuple(n for n in self.columns if n not in hidden) + tuple(self.virtual)
+
+    def parse(self, fields: Optional[str]):
+        """Return the requested names in request order, or None for the default (everything)"""
+        if fields is None or not fields.strip():
+            return None
+        names = list(dict.fromkeys(f.strip() for f in fields.split(',') if f.strip()))
+        unknown = [n for n in names if n not in self.allowed]
+        if unknown:
+            raise InvalidFields(f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(self.allowed)}")
+        return names
+
+    def select_sql(self, requested=None, keys=()) -> str:
+        """SELECT ... FROM for `requested` (None = all columns), plus the sort-key columns,
+        which are always needed to build the next cursor"""
+        if requested is None:
+            needed = set(self.columns)
+        else:
+            needed = set()
+            for name in requested:
+                needed.update(self.virtual.get(name, (name,)))
+            needed.update(k.row_key for k in keys)
+        select_list = ", ".join(expr for name, expr in self.columns.items() if name in needed)
+        return f"SELECT {select_list}\n{self.from_sql}"
+
+    def project(self, rows, requested):
+        # Drop what was only selected internally (sort keys, inputs to virtual fields)
+        if requested is None:
+            return rows
+        return [{name: row.get(name) for name in requested} for row in rows]
+
+
+def plain_columns(*names) -> dict:
+    return {name: name for name in names}
@@ -0,0 +1,453 @@
+"""Synthetic dataset generator for load testing.
+
+Writes a league-shaped dataset on top of an existing SOMS database (run SOMS_db_create.py first):
+teams in leagues of 20 with staff (coach, scout, medical), squads, double round-robin fixtures
+for each season, starting lineups laid out on formation_role slots, per-match stats for every
+player who played, medical reports with conditions and scouting reports on unattached players.
+
+    python generate_dataset.py                      # scale 1: 20 teams, ~600 players, ~30k stat lines
+    python generate_dataset.py --scale 170          # ~100k players, ~5M stat lines
+    python generate_dataset.py --scale 5 --seasons 2 --seed 7
+
+Everything is drawn from one random.Random(seed), so the same arguments (pin --as-of, which
+decides which fixtures have been played) against the same starting database produce the same rows. Rows go in through seed_engine (batched executemany,
+one transaction per phase); the fixtures, lineups and stats of a season are generated and
+inserted a league at a time, so memory stays flat as the scale grows. Runs append: teams and
+staff are matched by their unique name / email, everything else is added again.
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import counters
+import season_stats
+import seed_engine
+from db_connect_module import get_db_connection
+
+TEAMS_PER_LEAGUE = 20
+SQUAD = {'GK': 3, 'DEF': 8, 'MID': 8, 'FWD': 6}   # players per position group in each squad
+UNATTACHED_PER_TEAM = 5                           # scouted players without a team, per team
+SUBSTITUTES = 3                                   # per team per match
+INJURY_RATE = 0.3                                 # medical reports per player per season
+SCOUTING_REPORTS_PER_SEASON = 12                  # per scout
+DEFAULT_SEASONS = 3
+
+# Slot labels written to formation_role for the formations SOMS_db_create.py seeds; lineups are
+# laid out on whichever formations have a label for all 11 slots
+FORMATION_ROLES = {
+    '4-3-3': {1: 'Goalkeeper', 2: 'Right Back', 3: 'Left Back', 4: 'Centre Back', 5: 'Centre Back',
+              6: 'Holding Midfielder', 8: 'Central Midfielder', 10: 'Central Midfielder',
+              7: 'Right Winger', 9: 'Centre Forward', 11: 'Left Winger'},
+    '4-4-2': {1: 'Goalkeeper', 2: 'Right Back', 3: 'Left Back', 4: 'Centre Back', 5: 'Centre Back',
+              6: 'Central Midfielder', 8: 'Central Midfielder', 7: 'Right Midfielder',
+              11: 'Left Midfielder', 9: 'Striker', 10: 'Second Striker'},
+    '4-2-3-1': {1: 'Goalkeeper', 2: 'Right Back', 3: 'Left Back', 4: 'Centre Back', 5: 'Centre Back',
+                6: 'Holding Midfielder', 8: 'Holding Midfielder', 7: 'Right Winger',
+                10: 'Attacking Midfielder', 11: 'Left Winger', 9: 'Striker'},
+    '3-5-2': {1: 'Goalkeeper', 4: 'Centre Back', 5: 'Centre Back', 6: 'Centre Back',
+              2: 'Right Wing Back', 3: 'Left Wing Back', 7: 'Central Midfielder',
+              8: 'Central Midfielder', 10: 'Attacking Midfielder', 9: 'Striker', 11: 'Striker'},
+}
+
+POSITIONS = {'GK': ('GK',), 'DEF': ('CB', 'RB', 'LB'), 'MID': ('CDM', 'CM', 'CAM', 'RM', 'LM'), 'FWD': ('ST', 'LW', 'RW')}
+# Relative chance of scoring / assisting, by position group
+GOAL_WEIGHT = {'GK': 0, 'DEF': 1, 'MID': 3, 'FWD': 6}
+ASSIST_WEIGHT = {'GK': 0, 'DEF': 2, 'MID': 5, 'FWD': 3}
+
+FIRST_NAMES = ('James', 'Luca', 'Mateo', 'Noah', 'Oliver', 'Leo', 'Hugo', 'Elias', 'Kai', 'Rafael',
+               'Theo', 'Mason', 'Ethan', 'Adam', 'Yusuf', 'Ali', 'Kenji', 'Joao', 'Pedro', 'Diego',
+               'Marco', 'Jonas', 'Felix', 'Emil', 'Lars', 'Sami', 'Omar', 'Tomas', 'Nico', 'Victor',
+               'Amadou', 'Kwame', 'Ibrahim', 'Sven', 'Andrei', 'Pavel', 'Dario', 'Enzo', 'Jules', 'Milan')
+LAST_NAMES = ('Silva', 'Santos', 'Muller', 'Schmidt', 'Rossi', 'Bianchi', 'Garcia', 'Martinez', 'Smith',
+              'Jones', 'Brown', 'Taylor', 'Dubois', 'Martin', 'Jansen', 'De Vries', 'Nielsen', 'Hansen',
+              'Kowalski', 'Novak', 'Popescu', 'Ivanov', 'Yilmaz', 'Kaya', 'Diallo', 'Traore', 'Mensah',
+              'Okafor', 'Tanaka', 'Sato', 'Kim', 'Park', 'Costa', 'Pereira', 'Fernandes', 'Lopez',
+              'Moreau', 'Fischer', 'Weber', 'Romano')
+TOWNS = ('Ashford', 'Bramley', 'Carrow', 'Dunmore', 'Elmstead', 'Fairhaven', 'Glenbrook', 'Harwick',
+         'Ironbridge', 'Kingsport', 'Langley', 'Marlow', 'Northam', 'Oakridge', 'Penrith', 'Queensbury',
+         'Redcliffe', 'Stanmore', 'Thornbury', 'Upton', 'Valemont', 'Westfield', 'Yarmouth', 'Zennor')
+CLUB_SUFFIXES = ('United', 'City', 'Rovers', 'Athletic', 'Albion', 'Wanderers', 'Town', 'Rangers',
+                 'County', 'Villa', 'Orient', 'Harriers')
+REGIONS = ('UK', 'Europe', 'Spain', 'Italy', 'Germany', 'France', 'Portugal', 'South America', 'Africa', 'Asia')
+MED_SPECIALIZATIONS = ('Head of Medical', 'Sports Medicine', 'Physiotherapy', 'Sports Science')
+SEVERITIES = ('Minor', 'Moderate', 'Severe')
+CONDITIONS = (
+    ('Hamstring Strain', 'Grade 1 strain of the hamstring'),
+    ('Ankle Sprain', 'Lateral ligament sprain'),
+    ('Groin Strain', 'Adductor strain from overload'),
+    ('Calf Strain', 'Strain of the gastrocnemius'),
+    ('Knee Contusion', 'Impact bruising around the knee'),
+    ('Concussion', 'Head impact, return-to-play protocol'),
+    ('Muscle Fatigue', 'Accumulated training load'),
+    ('Shoulder Dislocation', 'Anterior dislocation, reduced on site'),
+)
+SCOUTING_NOTES = ('Good first touch and vision', 'Quick over the first five yards', 'Strong in the air',
+                  'Needs work on the weaker foot', 'Reads the game well', 'Composed under pressure',
+                  'High work rate, presses from the front', 'Inconsistent decision making')
+KICKOFF_TIMES = ('12:30:00', '15:00:00', '17:30:00', '20:00:00')
+
+# Column order of the rows match_stats() builds
+STAT_COLUMNS = ('player_id', 'match_id', 'team_id', 'started', 'minutes', 'tackles', 'shots_total', 'offsides',
+                'red_cards', 'yellow_cards', 'fouls_committed', 'dribbles_attempted', 'assists', 'goals',
+                'passing_accuracy')
+
+
+def season_start(year):
+    # First Saturday on or after 10 August
+    start = date(year, 8, 10)
+    return start + timedelta(days=(5 - start.weekday()) % 7)
+
+
+def current_season(today):
+    return today.year if today.month >= 8 else today.year - 1
+
+
+def round_robin(teams):
+    """Double round-robin by the circle method: [[(home, away)], ...] per round"""
+    teams = list(teams)
+    if len(teams) % 2:
+        teams.append(None)  # bye
+    n = len(teams)
+    rounds = []
+    for r in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            home, away = teams[i], teams[n - 1 - i]
+            if home is not None and away is not None:
+                pairs.append((home, away) if r % 2 == 0 else (away, home))
+        rounds.append(pairs)
+        teams.insert(1, teams.pop())
+    return rounds + [[(away, home) for home, away in pairs] for pairs in rounds]
+
+
+def position_group(label):
+    if 'Goalkeeper' in label:
+        return 'GK'
+    if 'Back' in label:
+        return 'DEF'
+    if 'Midfielder' in label:
+        return 'MID'
+    return 'FWD'
+
+
+class Generator:
+    def __init__(self, conn, scale=1.0, seasons=DEFAULT_SEASONS, first_season=None, seed=0, today=None):
+        self.conn = conn
+        self.rng = random.Random(seed)
+        self.today = today or date.today()
+        self.team_count = max(2, round(TEAMS_PER_LEAGUE * scale))
+        self.seasons = seasons
+        self.first_season = first_season if first_season is not None else current_season(self.today) - seasons + 1
+        self.teams = []          # [{team_id, name, venue}]
+        self.squads = {}         # team_id -> {group: [(player_id, jersey_number)]}
+        self.unattached = []     # [(player_id, name)]
+        self.scouts = []         # staff_ids
+        self.formations = []     # [(formation_id, {slot_no: group})]
+        self.totals = {}
+
+    def count(self, table, rows):
+        self.totals[table] = self.totals.get(table, 0) + rows
+
+    def run(self):
+        started = time.perf_counter()
+        print(f"Generating {self.team_count} teams, {self.seasons} season(s) from {self.first_season}")
+        self.load_formations()
+        self.create_teams()
+        self.create_staff()
+        self.create_players()
+        for year in range(self.first_season, self.first_season + self.seasons):
+            self.create_season(year)
+        with seed_engine.phase(self.conn, "counters and totals") as p:
+            counters.rebuild(p.cursor)
+            season_stats.rebuild(p.cursor)
+        for table, rows in self.totals.items():
+            print(f"  {table:<24} {rows:>8}")
+        print(f"Generated in {time.perf_counter() - started:.2f}s")
+
+    def load_formations(self):
+        with seed_engine.phase(self.conn, "formation_role") as p:
+            p.insert("INSERT IGNORE INTO formation (code, name) VALUES (%s, %s)",
+                     [(code, f"{code} Standard") for code in FORMATION_ROLES])
+            ids = p.lookup_ids('formation', 'formation_id', 'code', FORMATION_ROLES)
+            p.insert("INSERT IGNORE INTO formation_role (formation_id, slot_no, label) VALUES (%s, %s, %s)", [
+                (ids[code], slot_no, label)
+                for code, roles in FORMATION_ROLES.items() for slot_no, label in sorted(roles.items())
+            ])
+            p.cursor.execute("SELECT formation_id, slot_no, label FROM formation_role ORDER BY formation_id, slot_no")
+            slots = {}
+            for formation_id, slot_no, label in p.cursor.fetchall():
+                slots.setdefault(formation_id, {})[slot_no] = position_group(label)
+        # Only complete formations with one goalkeeper can host a generated lineup
+        self.formations = [
+            (formation_id, roles) for formation_id, roles in sorted(slots.items())
+            if len(roles) == 11 and list(roles.values()).count('GK') == 1
+        ]
+
+    def create_teams(self):
+        names = [f"{town} {suffix}" for suffix in CLUB_SUFFIXES for town in TOWNS]
+        rows = []
+        for i in range(self.team_count):
+            name = names[i % len(names)]
+            if i >= len(names):
+                name = f"{name} {i // len(names) + 1}"
+            league = i // TEAMS_PER_LEAGUE + 1
+            rows.append((name, f"League {league}"))
+        with seed_engine.phase(self.conn, "team") as p:
+            p.insert("""
+                INSERT INTO team (name, level) VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE level = VALUES(level)
+            """, rows)
+            ids = p.lookup_ids('team', 'team_id', 'name', [name for name, _ in rows])
+        self.teams = [{'team_id': ids[name], 'name': name, 'venue': f"{name.split(' ')[0]} Park"} for name, _ in rows]
+        self.count('team', len(rows))
+
+    def person(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def create_staff(self):
+        rng = self.rng
+        staff, roles = [], []
+        for n, team in enumerate(self.teams):
+            domain = team['name'].lower().replace(' ', '') + '.example'
+            for staff_type, salary, age in (('Coach', (500_000, 8_000_000), (35, 70)),
+                                            ('Scout', (60_000, 900_000), (28, 65)),
+                                            ('Med', (70_000, 700_000), (30, 65))):
+                first, last = self.person()
+                email = f"{first.lower()}.{last.lower().replace(' ', '')}.{n}@{domain}"
+                hired = date(rng.randint(2005, self.today.year - 1), rng.randint(1, 12), 1)
+                staff.append((first, None, last, email, rng.randrange(*salary, 1000), rng.randint(*age), hired, staff_type))
+                roles.append((staff_type, email, team['team_id']))
+        with seed_engine.phase(self.conn, "staff") as p:
+            p.insert("""
+                INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, date_hired, staff_type)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE staff_id = LAST_INSERT_ID(staff_id)
+            """, staff)
+            ids = p.lookup_ids('staff', 'staff_id', 'email', [row[3] for row in staff])
+            p.insert("""
+                INSERT INTO coach (staff_id, role, team_id) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE role = VALUES(role), team_id = VALUES(team_id)
+            """, [(ids[email], 'Manager', team_id) for kind, email, team_id in roles if kind == 'Coach'])
+            p.insert("""
+                INSERT INTO scout (staff_id, region, YOE) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE region = VALUES(region), YOE = VALUES(YOE)
+            """, [(ids[email], rng.choice(REGIONS), rng.randint(1, 30)) for kind, email, _ in roles if kind == 'Scout'])
+            p.insert("""
+                INSERT INTO med_staff (staff_id, med_specialization, certification, YOE)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE med_specialization = VALUES(med_specialization), certification = VALUES(certification), YOE = VALUES(YOE)
+            """, [(ids[email], rng.choice(MED_SPECIALIZATIONS), rng.choice(('UEFA Certified', 'FIFA Certified')), rng.randint(1, 30))
+                  for kind, email, _ in roles if kind == 'Med'])
+        self.scouts = [ids[email] for kind, email, _ in roles if kind == 'Scout']
+        self.count('staff', len(staff))
+
+    def player_row(self, group, team_id):
+        rng = self.rng
+        first, last = self.person()
+        value = rng.randrange(250_000, 120_000_000, 50_000)
+        contract_end = date(self.today.year + rng.randint(0, 5), 6, 30)
+        return (first, None, last, round(value * rng.uniform(0.02, 0.1), -3), rng.choice(POSITIONS[group]),
+                1, 1 if rng.random() < 0.05 else 0, value, contract_end, 0 if team_id else 1, team_id)
+
+    def create_players(self):
+        rows, slots = [], []
+        for team in self.teams:
+            jersey = 0
+            for group, size in SQUAD.items():
+                for _ in range(size):
+                    jersey += 1
+                    rows.append(self.player_row(group, team['team_id']))
+                    slots.append((team['team_id'], group, jersey))
+        for _ in range(UNATTACHED_PER_TEAM * len(self.teams)):
+            rows.append(self.player_row(self.rng.choice(tuple(SQUAD)), None))
+        with seed_engine.phase(self.conn, "player") as p:
+            ids = p.insert("""
+                INSERT INTO player (first_name, middle_name, last_name, salary, positions, is_active, is_injured,
+                    transfer_value, contract_end_date, scouted_player, team_id)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, rows, ids=True)
+        for player_id, (team_id, group, jersey) in zip(ids, slots):
+            self.squads.setdefault(team_id, {}).setdefault(group, []).append((player_id, jersey))
+        self.unattached = [(player_id, f"{row[0]} {row[2]}") for player_id, row in zip(ids[len(slots):], rows[len(slots):])]
+        self.count('player', len(rows))
+
+    def create_season(self, year):
+        with seed_engine.phase(self.conn, f"season {year}/{(year + 1) % 100:02d}") as p:
+            for start in range(0, len(self.teams), TEAMS_PER_LEAGUE):
+                self.create_league_season(p, year, self.teams[start:start + TEAMS_PER_LEAGUE])
+            self.create_medical_reports(p, year)
+            self.create_scouting_reports(p, year)
+
+    def create_league_season(self, p, year, league):
+        rng = self.rng
+        kickoff = season_start(year)
+        fixtures = []
+        for round_no, pairs in enumerate(round_robin(league)):
+            match_date = kickoff + timedelta(weeks=round_no)
+            for home, away in pairs:
+                played = match_date <= self.today
+                goals = (rng.choice((0, 0, 1, 1, 1, 2, 2, 3, 4)), rng.choice((0, 0, 1, 1, 2, 2, 3))) if played else None
+                fixtures.append((home, away, match_date, goals))
+        match_ids = p.insert("""
+            INSERT INTO match_table (name, venue, match_time, opponent_team, match_date, result)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, [
+            (f"{home['name']} v {away['name']}"[:100], home['venue'], rng.choice(KICKOFF_TIMES), away['name'],
+             match_date, f"{goals[0]}-{goals[1]}" if goals else None)
+            for home, away, match_date, goals in fixtures
+        ], ids=True)
+        self.count('match_table', len(fixtures))
+
+        lineups, lineup_slots, stats = [], [], []
+        for match_id, (home, away, _, goals) in zip(match_ids, fixtures):
+            if goals is None:
+                continue
+            for team, scored in ((home, goals[0]), (away, goals[1])):
+                formation_id, starters, bench = self.pick_lineup(team['team_id'])
+                lineups.append((match_id, team['team_id'], formation_id))
+                lineup_slots.append(starters)
+                stats.extend(self.match_stats(match_id, team['team_id'], starters, bench, scored))
+        lineup_ids = p.insert("""
+            INSERT INTO match_lineup (match_id, team_id, formation_id, is_starting, minute_applied)
+            VALUES (%s, %s, %s, TRUE, 0)
+        """, lineups, ids=True)
+        slot_rows = []
+        for lineup_id, starters in zip(lineup_ids, lineup_slots):
+            captain = rng.choice(starters)[0]
+            slot_rows.extend((lineup_id, slot_no, player_id, jersey, slot_no == captain)
+                             for slot_no, player_id, jersey, _ in starters)
+        p.insert("""
+            INSERT INTO match_lineup_slot (lineup_id, slot_no, player_id, jersey_number, captain)
+            VALUES (%s, %s, %s, %s, %s)
+        """, slot_rows)
+        p.insert(f"""
+            INSERT INTO player_match_stats ({", ".join(STAT_COLUMNS)})
+            VALUES ({", ".join(["%s"] * len(STAT_COLUMNS))})
+        """, stats)
+        self.count('match_lineup', len(lineups))
+        self.count('match_lineup_slot', len(slot_rows))
+        self.count('player_match_stats', len(stats))
+
+    def pick_lineup(self, team_id):
+        """(formation_id, [(slot_no, player_id, jersey, group)] for the XI, [(player_id, jersey, group)] on the bench)"""
+        rng = self.rng
+        formation_id, roles = rng.choice(self.formations)
+        squad = {group: rng.sample(players, len(players)) for group, players in self.squads[team_id].items()}
+        starters = []
+        for slot_no, group in sorted(roles.items()):
+            # A formation can ask for more of a group than the squad has; borrow from the nearest one
+            for candidate in (group, 'MID', 'DEF', 'FWD'):
+                if squad.get(candidate) and (candidate != 'GK' or group == 'GK'):
+                    player_id, jersey = squad[candidate].pop()
+                    starters.append((slot_no, player_id, jersey, group))
+                    break
+        bench = [(player_id, jersey, group) for group, players in squad.items() if group != 'GK' for player_id, jersey in players]
+        return formation_id, starters, rng.sample(bench, min(SUBSTITUTES, len(bench)))
+
+    def match_stats(self, match_id, team_id, starters, bench, scored):
+        rng = self.rng
+        lines = {}
+        outfield = [s for s in starters if s[3] != 'GK']
+        for (_, player_id, _, group), (sub_id, _, sub_group) in zip(rng.sample(outfield, len(bench)), bench):
+            minute = rng.randint(46, 85)
+            lines[sub_id] = [sub_group, 0, 90 - minute]
+            lines[player_id] = [group, 1, minute]
+        for _, player_id, _, group in starters:
+            lines.setdefault(player_id, [group, 1, 90])
+
+        goals, assists = dict.fromkeys(lines, 0), dict.fromkeys(lines, 0)
+        players = list(lines)
+        for _ in range(scored):
+            scorer = rng.choices(players, [GOAL_WEIGHT[lines[pid][0]] * lines[pid][2] for pid in players])[0]
+            goals[scorer] += 1
+            if rng.random() < 0.75:
+                helpers = [pid for pid in players if pid != scorer]
+                assists[rng.choices(helpers, [ASSIST_WEIGHT[lines[pid][0]] * lines[pid][2] for pid in helpers])[0]] += 1
+
+        rows = []
+        for player_id, (group, started, minutes) in lines.items():
+            share = minutes / 90
+            outfield_player = group != 'GK'
+            rows.append((
+                player_id, match_id, team_id, started, minutes,
+                round(rng.randint(0, 5 if group in ('DEF', 'MID') else 2) * share),
+                round(rng.randint(0, 5 if group == 'FWD' else 2) * share) + goals[player_id] if outfield_player else 0,
+                rng.choice((0, 0, 0, 1)) if group == 'FWD' else 0,
+                1 if rng.random() < 0.01 else 0,
+                1 if rng.random() < 0.12 else 0,
+                round(rng.randint(0, 3) * share),
+                round(rng.randint(0, 6 if group in ('MID', 'FWD') else 1) * share),
+                assists[player_id],
+                goals[player_id],
+                round(rng.uniform(55, 95), 2),
+            ))
+        return rows
+
+    def create_medical_reports(self, p, year):
+        rng = self.rng
+        first_day, last_day = season_start(year), min(season_start(year + 1) - timedelta(days=1), self.today)
+        if first_day > last_day:
+            return
+        span = (last_day - first_day).days
+        reports, conditions = [], []
+        for squad in self.squads.values():
+            for players in squad.values():
+                for player_id, _ in players:
+                    if rng.random() >= INJURY_RATE:
+                        continue
+                    report_date = first_day + timedelta(days=rng.randint(0, span))
+                    picked = rng.sample(CONDITIONS, rng.choice((1, 1, 1, 2)))
+                    reports.append((player_id, f"{picked[0][0]} assessed after training", report_date,
+                                    rng.choice(('Rest and physiotherapy', 'Rehabilitation programme', 'Ice and compression')),
+                                    rng.choice(SEVERITIES)))
+                    conditions.append([(name, desc, report_date) for name, desc in picked])
+        report_ids = p.insert("""
+            INSERT INTO medical_report (player_id, summary, report_date, treatment, severity_of_injury)
+            VALUES (%s, %s, %s, %s, %s)
+        """, reports, ids=True)
+        condition_rows = [(report_id, *c) for report_id, picked in zip(report_ids, conditions) for c in picked]
+        p.insert("""
+            INSERT INTO medical_condition (med_report_id, condition_name, description, diagnosis_date)
+            VALUES (%s, %s, %s, %s)
+        """, condition_rows)
+        self.count('medical_report', len(reports))
+        self.count('medical_condition', len(condition_rows))
+
+    def create_scouting_reports(self, p, year):
+        rng = self.rng
+        first_day, last_day = season_start(year), min(season_start(year + 1) - timedelta(days=1), self.today)
+        if first_day > last_day or not self.unattached:
+            return
+        span = (last_day - first_day).days
+        rows = []
+        for scout_id in self.scouts:
+            for _ in range(SCOUTING_REPORTS_PER_SEASON):
+                player_id, name = rng.choice(self.unattached)
+                rows.append((scout_id, name, player_id, first_day + timedelta(days=rng.randint(0, span)),
+                             rng.choice(SCOUTING_NOTES)))
+        p.insert("""
+            INSERT INTO scouting_report (scout_id, target_player_name, target_player_id, report_date, report_desc)
+            VALUES (%s, %s, %s, %s, %s)
+        """, rows)
+        self.count('scouting_report', len(rows))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic SOMS dataset for load testing")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help=f"{TEAMS_PER_LEAGUE} teams per unit of scale (default 1)")
+    parser.add_argument("--seasons", type=int, default=DEFAULT_SEASONS, help="seasons of fixtures (default 3)")
+    parser.add_argument("--first-season", type=int, default=None,
+                        help="starting year of the first season (default: the last --seasons up to today)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None,
+                        help="YYYY-MM-DD; fixtures after it are left unplayed (default today)")
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        Generator(conn, scale=args.scale, seasons=args.seasons, first_season=args.first_season, seed=args.seed,
+                  today=args.as_of).run()
+    finally:
+        conn.close()
@@ -0,0 +1,122 @@
+"""Generates the resized / re-encoded player photo variants served by GET /player/{id}/photo"""
+import io
+import os
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from blob_store import get_blob_store
+from photos import photo_digest
+
+# Longest side in pixels for each derivative; the original upload is always kept as-is
+VARIANT_SIZES = {
+    'thumb': 64,
+    'small': 160,
+    'medium': 480,
+}
+VARIANT_NAMES = ('original',) + tuple(VARIANT_SIZES)
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+# Refuse to decode anything that would expand past this many pixels (decompression bombs)
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+
+@dataclass
+class PhotoVariant:
+    variant: str
+    format: str
+    content_type: str
+    width: int
+    height: int
+    data: bytes
+
+    @property
+    def sha256(self) -> str:
+        return photo_digest(self.data)
+
+    @property
+    def byte_size(self) -> int:
+        return len(self.data)
+
+
+def _has_alpha(img) -> bool:
+    return img.mode in ('RGBA', 'LA', 'PA') or (img.mode == 'P' and 'transparency' in img.info)
+
+
+def _encode(img, fmt: str) -> bytes:
+    buf = io.BytesIO()
+    if fmt == 'webp':
+        img.save(buf, 'WEBP', quality=WEBP_QUALITY, method=4)
+    elif fmt == 'jpeg':
+        img.convert('RGB').save(buf, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    else:
+        img.save(buf, 'PNG', optimize=True)
+    return buf.getvalue()
+
+
+def generate_variants(source):
+    """Return PhotoVariant objects for every size in VARIANT_SIZES, each as WebP plus a
+    JPEG (opaque) or PNG (transparent) fallback, and a WebP copy of the full-size image.
+    `source` is the image bytes or a path to them. Returns an empty list when the image
+    can't be decoded, so uploads never fail here."""
+    if isinstance(source, (bytes, bytearray)):
+        source_size = len(source)
+        source = io.BytesIO(source)
+    else:
+        source_size = os.path.getsize(source)
+    try:
+        with Image.open(source) as src:
+            src.seek(0)  # first frame of animated GIF/WebP
+            img = ImageOps.exif_transpose(src)
+            img.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError, ValueError):
+        return []
+
+    alpha = _has_alpha(img)
+    img = img.convert('RGBA' if alpha else 'RGB')
+    fallback = 'png' if alpha else 'jpeg'
+
+    variants = []
+    for name, max_side in VARIANT_SIZES.items():
+        resized = img.copy()
+        resized.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        for fmt in ('webp', fallback):
+            variants.append(PhotoVariant(name, fmt, f'image/{fmt}', resized.width, resized.height, _encode(resized, fmt)))
+
+    # Full-size WebP is only worth keeping when it actually beats the upload
+    full_webp = _encode(img, 'webp')
+    if len(full_webp) < source_size:
+        variants.append(PhotoVariant('original', 'webp', 'image/webp', img.width, img.height, full_webp))
+    return variants
+
+
+def store_variants(cursor, player_id: int, variants, store=None) -> None:
+    # Caller owns the transaction; replaces whatever derivatives the player already had.
+    # Bytes go to the blob store, the table only keeps their hash and dimensions.
+    store = store or get_blob_store()
+    cursor.execute("DELETE FROM player_photo_variant WHERE player_id = %s", (player_id,))
+    if not variants:
+        return
+    cursor.executemany("""
+        INSERT INTO player_photo_variant
+            (player_id, variant, format, content_type, width, height, byte_size, sha256)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """, [
+        (player_id, v.variant, v.format, v.content_type, v.width, v.height, v.byte_size, store.put(v.data))
+        for v in variants
+    ])
+
+
+def choose_format(accept_header, available):
+    """Pick the best stored format for a request: WebP when the client advertises it,
+    otherwise the JPEG/PNG fallback. `available` is an iterable of format names."""
+    available = set(available)
+    accept = (accept_header or '').lower()
+    if 'webp' in available and 'image/webp' in accept:
+        return 'webp'
+    for fmt in ('jpeg', 'png'):
+        if fmt in available:
+            return fmt
+    return None
@@ -0,0 +1,108 @@
+"""Top-K player rankings over player_match_stats, for GET /leaderboards/{metric}.
+
+Totals come from player_season_stats (see season_stats.py) when the filters allow it, so a
+whole-career or single-season board groups a few rows per player; a date range or team filter
+needs the individual match lines and aggregates player_match_stats instead. Either way MySQL
+ranks with ORDER BY ... LIMIT, which keeps only the top K rows (a bounded priority queue)
+rather than sorting every player.
+"""
+from season_stats import SEASON_START_YEAR_SQL, SUMMED_COLUMNS
+
+TOTAL = 'total'
+PER_90 = 'per_90'
+RATES = (TOTAL, PER_90)
+
+PASSING_ACCURACY = 'passing_accuracy'
+# Counted stats can be ranked as totals or per 90 minutes; passing accuracy is always an average
+METRICS = ('appearances', 'starts') + SUMMED_COLUMNS + (PASSING_ACCURACY,)
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+
+_COUNTED = ('appearances', 'starts') + SUMMED_COLUMNS
+
+
+def _from_seasons(where):
+    sums = ",\n            ".join(f"SUM(s.{c}) AS {c}" for c in _COUNTED)
+    return f"""
+        SELECT s.player_id,
+            {sums},
+            SUM(s.passing_accuracy_sum) AS passing_accuracy_sum,
+            SUM(s.passing_accuracy_count) AS passing_accuracy_count
+        FROM player_season_stats s
+        {where}
+        GROUP BY s.player_id
+    """
+
+
+def _from_matches(where):
+    sums = ",\n            ".join(f"COALESCE(SUM(pms.{c}), 0) AS {c}" for c in SUMMED_COLUMNS)
+    return f"""
+        SELECT pms.player_id,
+            COUNT(*) AS appearances,
+            COALESCE(SUM(pms.started), 0) AS starts,
+            {sums},
+            COALESCE(SUM(pms.passing_accuracy), 0) AS passing_accuracy_sum,
+            COUNT(pms.passing_accuracy) AS passing_accuracy_count
+        FROM player_match_stats pms
+        LEFT JOIN match_table m ON m.match_id = pms.match_id
+        {where}
+        GROUP BY pms.player_id
+    """
+
+
+def _value_sql(metric, rate):
+    if metric == PASSING_ACCURACY:
+        return "ROUND(t.passing_accuracy_sum / NULLIF(t.passing_accuracy_count, 0), 2)"
+    if rate == PER_90:
+        return f"ROUND(t.{metric} * 90 / NULLIF(t.minutes, 0), 2)"
+    return f"t.{metric}"
+
+
+def build_query(metric, rate=TOTAL, date_from=None, date_to=None, team_id=None, season=None,
+                min_minutes=0, limit=DEFAULT_LIMIT):
+    """SQL and params for one leaderboard; `metric` and `rate` must already be validated"""
+    where, params = [], []
+    if date_from is None and date_to is None and team_id is None:
+        if season is not None:
+            where.append("s.season_start_year = %s")
+            params.append(season)
+        totals = _from_seasons("WHERE " + " AND ".join(where) if where else "")
+    else:
+        where.append("pms.player_id IS NOT NULL")
+        if date_from is not None:
+            where.append("m.match_date >= %s")
+            params.append(date_from)
+        if date_to is not None:
+            where.append("m.match_date <= %s")
+            params.append(date_to)
+        if team_id is not None:
+            where.append("pms.team_id = %s")
+            params.append(team_id)
+        if season is not None:
+            where.append(f"{SEASON_START_YEAR_SQL} = %s")
+            params.append(season)
+        totals = _from_matches("WHERE " + " AND ".join(where))
+
+    query = f"""
+        SELECT p.player_id, p.first_name, p.last_name, t.appearances, t.minutes,
+               {_value_sql(metric, rate)} AS value
+        FROM ({totals}) t
+        JOIN player p ON p.player_id = t.player_id
+        WHERE t.minutes >= %s
+        HAVING value IS NOT NULL
+        ORDER BY value DESC, p.player_id
+        LIMIT %s
+    """
+    return query, (*params, min_minutes, limit)
+
+
+def shape(rows, metric, rate=TOTAL):
+    # SUM() and ROUND() come back as DECIMAL, which the JSON encoder would send as strings
+    whole = rate == TOTAL and metric != PASSING_ACCURACY
+    ranked = []
+    for rank, row in enumerate(rows, start=1):
+        row['appearances'], row['minutes'] = int(row['appearances']), int(row['minutes'])
+        row['value'] = int(row['value']) if whole else float(row['value'])
+        ranked.append({"rank": rank, **row})
+    return ranked
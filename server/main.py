@@ -1,14 +1,28 @@
 import mysql.connector
-import base64
 import logging
 import os
-from datetime import date, datetime, time as dtime
+from contextlib import asynccontextmanager
+from datetime import date
 import uvicorn
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
-from typing import Dict, Optional
-from db_connect_module import get_db_connection
+from typing import Any, Dict, List, Literal, Optional
+
+# Before the project imports: db_connect_module, uploads, cache, request_stats, query_log and
+# metrics read their settings from the environment when they're imported
+load_dotenv()
+
+from db_connect_module import get_db_connection, pool_stats, close_pool
+from db_async_module import async_pool_stats, close_async_pool
+import async_routes
+import queries
+import pagination
+from fieldsets import InvalidFields
+import json_response
+from json_response import FastJSONResponse
+import cache
 from models import (
     Staff,
     Coach,
@@ -28,26 +42,31 @@ from models import (
     FormationCreate,
     LineupCreate,
     StaffAccountCreate,
-    MatchCreate
+    MatchCreate,
+    PlayerMatchStats,
+    PlayerMatchStatsCreate,
+    PMS_COLUMNS
 )
 from werkzeug.security import check_password_hash, generate_password_hash
-from starlette.responses import JSONResponse
-
-load_dotenv()
+from starlette.responses import JSONResponse, Response
+import photos
+import image_pipeline
+from blob_store import BlobNotFound, get_blob_store
+import uploads
+import counters
+import bulk
+import streaming
+import season_stats
+import leaderboards
+import request_stats
+import query_log
+import metrics
 
 def verify_password(plain: str, hashed: str) -> bool:
     if hashed is None:
         return False
     return check_password_hash(hashed, plain)
 
-
-def _serialize_row_dates(row: dict) -> dict:
-    # Convert date/time/datetime objects into strings for JSON serialization
-    for k, v in list(row.items()):
-        if isinstance(v, (date, datetime, dtime)):
-            row[k] = str(v)
-    return row
-
 #Logging to soms_app.log
 logger = logging.getLogger("SOMS_App")
 logger.setLevel(logging.INFO)
@@ -60,7 +79,25 @@ fh.setFormatter(formatter)
 logger.addHandler(fh)
 
 
-app = FastAPI(title = 'SOMS_API')
+# SOMS_DB_MODE=async serves the hot read endpoints from the asyncio data-access layer
+# instead of the threadpool + blocking pool path, so the two can be benchmarked
+DB_MODE = os.getenv("SOMS_DB_MODE", "sync").strip().lower()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_async_pool()
+    close_pool()
+
+
+# Every response is encoded with orjson; list handlers return FastJSONResponse directly to also
+# skip FastAPI's response_model serialization (see json_response.py)
+app = FastAPI(title = 'SOMS_API', lifespan=lifespan, default_response_class=FastJSONResponse)
+
+# Body-size and concurrency limits for uploads, enforced before the multipart body is parsed
+# (added before CORS so it sits inside it and its 413/503 responses still get CORS headers)
+app.add_middleware(uploads.UploadLimitMiddleware, paths=["/player/create-with-photo"])
 
 app.add_middleware(
     CORSMiddleware,
@@ -73,17 +110,44 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-#middleware for logging requests and responses
+#middleware for logging requests and responses, with their timing and SQL accounting (see request_stats.py)
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    logger.info(f"Incoming request: {request.method} {request.url}")
+    stats, token = request_stats.begin()
+    in_flight = metrics.HTTP_IN_FLIGHT.labels(request.method)
+    in_flight.inc()
+    # An exception is logged and re-raised, so ServerErrorMiddleware still answers it; the request
+    # is accounted as the 500 it turns into
+    status = 500
     try:
         response = await call_next(request)
-        logger.info(f"Response status: {response.status_code}")
+        status = response.status_code
+        response.headers["Server-Timing"] = stats.server_timing(stats.elapsed())
         return response
     except Exception:
         logger.exception("Request failed")
-        return JSONResponse(status_code=500, content={"detail": "Internal Server Error"})
+        raise
+    finally:
+        total = stats.elapsed()
+        # Undone first, so a failing metric or log handler can't leave the gauge raised or the
+        # request's stats attached to the context
+        in_flight.dec()
+        request_stats.end(token)
+        if metrics.METRICS_ENABLED:
+            route = metrics.route_label(request.scope)
+            metrics.HTTP_REQUESTS.labels(request.method, route, str(status)).inc()
+            metrics.HTTP_REQUEST_DURATION.labels(request.method, route).observe(total)
+        fields = {"method": request.method, "path": request.url.path, "status": status, **stats.fields(total)}
+        level = logging.WARNING if stats.queries > request_stats.QUERY_WARN_THRESHOLD else logging.INFO
+        logger.log(level, f"{request.method} {request.url.path} {status} "
+                          + " ".join(f"{k}={v}" for k, v in fields.items() if k not in ("method", "path", "status")),
+                   extra={"request": fields})
+
+
+@app.exception_handler(pagination.InvalidCursor)
+@app.exception_handler(InvalidFields)
+async def invalid_list_params_handler(request: Request, exc: ValueError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
 
 
 @app.get("/health")
@@ -91,36 +155,45 @@ def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/total_users")
-def get_total_users() -> Dict[str, int]:
-    connection = get_db_connection()
-    cursor = connection.cursor()
-    try:
-        cursor.execute("SELECT COUNT(*) FROM staff")
-        total_staff = cursor.fetchone()[0]
+@app.get("/health/db_pool")
+def get_db_pool_stats() -> Dict:
+    return {"status": "success", "db_mode": DB_MODE, "data": pool_stats(), "async_data": async_pool_stats()}
 
-        cursor.execute("select count(*) from scout")
-        total_scouts = cursor.fetchone()[0]
 
-        return {"total_count": total_staff + total_scouts}
-    except mysql.connector.Error as err:
-        raise HTTPException(status_code=500, detail=str(err))
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
+@app.get("/health/queries")
+def get_query_stats(
+    limit: int = Query(20, ge=1, le=500),
+    sort: Literal["total", "count", "max", "mean"] = "total",
+) -> Dict:
+    """Per-fingerprint SQL counts and latency histograms since startup (see query_log.py)"""
+    return {"status": "success", "slow_query_ms": query_log.SLOW_QUERY_MS,
+            "data": query_log.snapshot(limit, sort)}
 
 
-@app.get("/total_staff")
-def get_total_staff() -> Dict[str, int]:
+metrics.register_collector(metrics.pool_collector("sync", pool_stats))
+metrics.register_collector(metrics.pool_collector("async", async_pool_stats))
+
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Prometheus scrape endpoint (see metrics.py)"""
+    if not metrics.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+if DB_MODE == "async":
+    # Registered before the sync routes below, so these take precedence for the same paths
+    app.include_router(async_routes.router)
+
+
+@app.get("/dashboard/summary")
+def get_dashboard_summary() -> Dict:
+    """Every dashboard count in one response, read from the maintained counters (see counters.py)"""
     connection = get_db_connection()
     cursor = connection.cursor()
     try:
-        cursor.execute("SELECT COUNT(*) FROM staff")
-        total_staff = cursor.fetchone()[0]
-        
-        return {"total_staff": total_staff}
+        return {"status": "success", "data": counters.read_summary(cursor)}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -130,15 +203,11 @@ def get_total_staff() -> Dict[str, int]:
             connection.close()
 
 
-@app.get("/total_players")
-def get_total_players() -> Dict[str, int]:
+def _read_counters(*names) -> Dict[str, int]:
     connection = get_db_connection()
     cursor = connection.cursor()
     try:
-        cursor.execute("SELECT COUNT(*) FROM player")
-        total_players = cursor.fetchone()[0]
-        
-        return {"total_players": total_players}
+        return counters.read_counters(cursor, *names)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -148,6 +217,23 @@ def get_total_players() -> Dict[str, int]:
             connection.close()
 
 
+# The single-count endpoints below predate /dashboard/summary and are kept for existing callers
+@app.get("/total_users")
+def get_total_users() -> Dict[str, int]:
+    counts = _read_counters(counters.STAFF_TOTAL, counters.SCOUTS_TOTAL)
+    return {"total_count": counts[counters.STAFF_TOTAL] + counts[counters.SCOUTS_TOTAL]}
+
+
+@app.get("/total_staff")
+def get_total_staff() -> Dict[str, int]:
+    return {"total_staff": _read_counters(counters.STAFF_TOTAL)[counters.STAFF_TOTAL]}
+
+
+@app.get("/total_players")
+def get_total_players() -> Dict[str, int]:
+    return {"total_players": _read_counters(counters.PLAYERS_TOTAL)[counters.PLAYERS_TOTAL]}
+
+
 @app.post("/staff/create", status_code=201)
 def create_staff_member(staff: StaffCreate):
     try:
@@ -156,6 +242,37 @@ def create_staff_member(staff: StaffCreate):
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
 
+
+def _bulk_response(result, mode: str):
+    # 201 when everything was created; 207 when partial mode created some; 422 when nothing was
+    if result.ok:
+        status_code = 201
+    elif result.ids:
+        status_code = 207
+    else:
+        status_code = 422
+    return FastJSONResponse(result.to_response(mode), status_code=status_code)
+
+
+def _check_bulk_size(items):
+    if len(items) > bulk.MAX_BULK_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {bulk.MAX_BULK_ITEMS} items per request")
+
+
+@app.post("/staff/bulk", status_code=201)
+def bulk_create_staff(
+    items: List[Dict[str, Any]] = Body(...),
+    mode: Literal["atomic", "partial"] = bulk.ATOMIC,
+):
+    """Create many staff members in one transaction; results are reported per item"""
+    _check_bulk_size(items)
+    try:
+        result = Staff.bulk_create(items, mode)
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    return _bulk_response(result, mode)
+
+
 @app.get("/staff/{staff_id}", response_model=Dict)
 def get_staff_by_id(staff_id: int):
     connection = get_db_connection()
@@ -172,7 +289,6 @@ def get_staff_by_id(staff_id: int):
         if not row:
             raise HTTPException(status_code=404, detail="Staff member not found")
         
-        row = _serialize_row_dates(row)
         return {"status": "success", "data": row}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
@@ -184,6 +300,7 @@ def get_staff_by_id(staff_id: int):
 
 @app.post("/login")
 def login(credentials: LoginRequest):
+    metrics.LOGIN_ATTEMPTS.inc()
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
@@ -194,17 +311,21 @@ def login(credentials: LoginRequest):
         )
         row = cursor.fetchone()
         if not row:
+            metrics.LOGIN_FAILURES.labels("invalid_credentials").inc()
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
         if not row.get("is_active", True):
+            metrics.LOGIN_FAILURES.labels("inactive").inc()
             raise HTTPException(status_code=403, detail="Account is inactive")
 
         stored_hash = row.get("password_hash")
         if not verify_password(credentials.password, stored_hash):
+            metrics.LOGIN_FAILURES.labels("invalid_credentials").inc()
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
         return {"status": "success", "staff_id": row.get("staff_id")}
     except mysql.connector.Error as err:
+        metrics.LOGIN_FAILURES.labels("error").inc()
         raise HTTPException(status_code=500, detail=str(err))
     finally:
         if cursor:
@@ -258,18 +379,20 @@ def create_account(payload: StaffAccountCreate):
 
 #get staff
 @app.get("/staff", response_model=Dict)
-def get_all_staff():
-
+def get_all_staff(
+    staff_type: Optional[str] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+):
+    requested = queries.STAFF_FIELDS.parse(fields)
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT staff_id, first_name, middle_name, last_name, email, salary, age, date_hired, staff_type FROM staff")
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        # serialize any date fields
-        rows = [_serialize_row_dates(r) for r in rows]
-        return {"status": "success", "count": len(rows), "data": rows}
+        where, params = queries.staff_filters(staff_type)
+        select_sql = queries.STAFF_FIELDS.select_sql(requested, queries.STAFF_SORT)
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.STAFF_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.STAFF_FIELDS.project(rows, requested), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -280,21 +403,17 @@ def get_all_staff():
 
 #get scouts
 @app.get("/scouts", response_model=Dict)
-def get_all_scouts():
+def get_all_scouts(
+    region: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+):
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT s.staff_id, st.first_name, st.middle_name, st.last_name, st.email, s.region, s.YOE
-            FROM scout s
-            JOIN staff st ON s.staff_id = st.staff_id
-            ORDER BY st.last_name, st.first_name
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        rows = [_serialize_row_dates(r) for r in rows]
-        return {"status": "success", "count": len(rows), "data": rows}
+        where, params = queries.scout_filters(region)
+        rows, next_cursor = pagination.fetch_page(cursor, queries.SCOUTS_SQL, queries.STAFF_JOIN_SORT, where, params, page_cursor, limit)
+        return queries.page_response(rows, next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -306,27 +425,27 @@ def get_all_scouts():
 
 #player data
 @app.get("/players", response_model=Dict)
-def get_all_players():
+def get_all_players(
+    is_active: Optional[bool] = None,
+    is_injured: Optional[bool] = None,
+    position: Optional[str] = None,
+    scouted_player: Optional[bool] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    requested = queries.PLAYER_FIELDS.parse(fields)
+    where, params = queries.player_filters(is_active, is_injured, position, scouted_player)
+    select_sql = queries.PLAYER_FIELDS.select_sql(requested, queries.PLAYERS_SORT)
+    if stream:
+        return streaming.stream_page(select_sql, queries.PLAYERS_SORT, where, params, page_cursor, stream,
+                                     lambda rows: queries.PLAYER_FIELDS.project(queries.shape_players(rows), requested))
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT player_id, first_name, middle_name, last_name, salary, positions, is_active, is_injured, transfer_value, contract_end_date, scouted_player,
-                   photo, photo_content_type, photo_filename, photo_size, photo_uploaded_at
-            FROM player
-            ORDER BY last_name, first_name
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        rows = [_serialize_row_dates(r) for r in rows]
-        
-        # Convert photos to base64
-        for row in rows:
-            if row.get('photo'):
-                row['photo'] = base64.b64encode(row['photo']).decode('utf-8')
-        
-        return {"status": "success", "count": len(rows), "data": rows}
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.PLAYERS_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.PLAYER_FIELDS.project(queries.shape_players(rows), requested), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -337,23 +456,25 @@ def get_all_players():
 
 
 @app.get("/fixtures", response_model=Dict)
-def get_fixtures():
+def get_fixtures(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    requested = queries.MATCH_FIELDS.parse(fields)
+    where, params = queries.match_filters(date_from, date_to)
+    select_sql = queries.MATCH_FIELDS.select_sql(requested, queries.FIXTURES_SORT)
+    if stream:
+        return streaming.stream_page(select_sql, queries.FIXTURES_SORT, where, params, page_cursor, stream,
+                                     lambda rows: queries.MATCH_FIELDS.project(rows, requested))
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT match_id, name, venue, match_time, opponent_team, match_date, result
-            FROM match_table
-            ORDER BY match_date ASC, match_time ASC
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        # serialize date/time fields
-        serialized = []
-        for r in rows:
-            serialized.append(_serialize_row_dates(r))
-        return {"status": "success", "count": len(serialized), "data": serialized}
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.FIXTURES_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.MATCH_FIELDS.project(rows, requested), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -364,21 +485,17 @@ def get_fixtures():
 
 
 @app.get("/coaches", response_model=Dict)
-def get_all_coaches():
+def get_all_coaches(
+    team_id: Optional[int] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+):
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT c.staff_id, st.first_name, st.middle_name, st.last_name, st.email, c.role, c.team_id
-            FROM coach c
-            JOIN staff st ON c.staff_id = st.staff_id
-            ORDER BY st.last_name, st.first_name
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        rows = [_serialize_row_dates(r) for r in rows]
-        return {"status": "success", "count": len(rows), "data": rows}
+        where, params = queries.coach_filters(team_id)
+        rows, next_cursor = pagination.fetch_page(cursor, queries.COACHES_SQL, queries.STAFF_JOIN_SORT, where, params, page_cursor, limit)
+        return queries.page_response(rows, next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -408,6 +525,23 @@ def create_player(player: PlayerCreate):
         raise HTTPException(status_code=500, detail=str(err))
 
 
+@app.post("/player/bulk", status_code=201)
+def bulk_create_players(
+    items: List[Dict[str, Any]] = Body(...),
+    mode: Literal["atomic", "partial"] = bulk.ATOMIC,
+):
+    """Create many players in one transaction; results are reported per item"""
+    _check_bulk_size(items)
+    try:
+        result = Player.bulk_create(items, mode)
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    return _bulk_response(result, mode)
+
+
+UPLOAD_ENDPOINT = "create_player_with_photo"
+
+
 @app.post("/player/create-with-photo", status_code=201)
 async def create_player_with_photo(
     first_name: str = Form(...),
@@ -422,6 +556,8 @@ async def create_player_with_photo(
     scouted_player: Optional[bool] = Form(False),
     file: UploadFile = File(None),
 ):
+    photo_store = get_blob_store()
+
     # build Player instance
     contract_date = None
     if contract_end_date:
@@ -443,52 +579,129 @@ async def create_player_with_photo(
         scouted_player=scouted_player,
     )
 
-    photo_bytes = None
+    upload = None
     content_type = None
     filename = None
-    size = None
     if file is not None:
         # Security validation
         allowed_mime_types = ['image/png', 'image/jpeg', 'image/jpg', 'image/gif', 'image/webp']
         allowed_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
-        max_size = 2_294_967_294  # 2GB
 
         # Check MIME type
         if file.content_type not in allowed_mime_types:
+            metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "invalid").inc()
             raise HTTPException(status_code=400, detail="Invalid file type. Only image files are allowed.")
 
         # Check file extension
         if file.filename:
             _, ext = os.path.splitext(file.filename.lower())
             if ext not in allowed_extensions:
+                metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "invalid").inc()
                 raise HTTPException(status_code=400, detail="Invalid file extension. Allowed: png, jpg, jpeg, gif, webp")
 
+        # Copied in chunks to a temp file, hashed and size-checked on the way; never held in memory
         try:
-            photo_bytes = await file.read()
-            size = len(photo_bytes)
+            upload = await uploads.read_upload(file, photo_store, uploads.PHOTO_MAX_BYTES)
+        except uploads.UploadTooLarge as e:
+            metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "too_large").inc()
+            raise HTTPException(status_code=413, detail=str(e))
+        except OSError as e:
+            metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "invalid").inc()
+            raise HTTPException(status_code=400, detail=f"Error reading uploaded file: {e}")
+        finally:
+            await file.close()
 
-            # Check file size
-            if size > max_size:
-                raise HTTPException(status_code=400, detail="File too large. Maximum size is 4GB.")
+        # The declared type is only a hint; the magic bytes decide what gets stored
+        if upload.content_type not in allowed_mime_types:
+            upload.discard()
+            metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "invalid").inc()
+            raise HTTPException(status_code=400, detail="Invalid file type. Only image files are allowed.")
+        metrics.UPLOADS.labels(UPLOAD_ENDPOINT, "accepted").inc()
+        metrics.UPLOAD_BYTES.labels(UPLOAD_ENDPOINT).inc(upload.size)
+        content_type = upload.content_type
+        filename = file.filename
+
+    variants = None
+    photo_sha256 = None
+    if upload is not None:
+        try:
+            # Resizing is CPU-bound; keep it off the event loop
+            variants = await run_in_threadpool(image_pipeline.generate_variants, upload.path)
+            photo_sha256 = await run_in_threadpool(photo_store.put_file, upload.path, upload.sha256)
+        finally:
+            upload.discard()
 
-            content_type = file.content_type
-            filename = file.filename
+    try:
+        # Pool checkout, the transaction and the variant writes all block; keep them off the event loop
+        player_id = await run_in_threadpool(Player.create_with_photo, player_obj, photo_sha256, content_type,
+                                            filename, upload.size if upload else None, variants=variants)
+        return {"status": "success", "player_id": player_id}
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
 
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Error reading uploaded file: {e}")
 
+@app.get("/player/{player_id}/photo")
+def get_player_photo(player_id: int, request: Request, size: str = "original"):
+    """Serve a player's photo from the blob store with ETag/Last-Modified revalidation and Range support.
+
+    `size` picks a pre-generated derivative (thumb, small, medium, original); WebP is sent to
+    clients that accept it. Falls back to the original upload when no derivative exists yet.
+    """
+    if size not in image_pipeline.VARIANT_NAMES:
+        raise HTTPException(status_code=400, detail=f"size must be one of: {', '.join(image_pipeline.VARIANT_NAMES)}")
+
+    connection = get_db_connection()
+    cursor = connection.cursor(dictionary=True)
     try:
-        player_id = Player.create_with_photo(player_obj, photo_bytes, content_type, filename, size)
-        return {"status": "success", "player_id": player_id}
+        cursor.execute("""
+            SELECT photo_sha256, photo_content_type, photo_uploaded_at
+            FROM player
+            WHERE player_id = %s
+        """, (player_id,))
+        meta = cursor.fetchone()
+        if not meta:
+            raise HTTPException(status_code=404, detail="Player not found")
+        if not meta['photo_sha256']:
+            raise HTTPException(status_code=404, detail="Player has no photo")
+
+        cursor.execute("""
+            SELECT format, content_type, sha256, created_at
+            FROM player_photo_variant
+            WHERE player_id = %s AND variant = %s
+        """, (player_id, size))
+        stored = {row['format']: row for row in cursor.fetchall()}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
-        if file:
-            await file.close()
-            photo_bytes = None
-            content_type = None
-            filename = None
-            size = None
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+    fmt = image_pipeline.choose_format(request.headers.get('accept'), stored)
+    if fmt is not None:
+        digest = stored[fmt]['sha256']
+        last_modified = stored[fmt]['created_at']
+        media_type = stored[fmt]['content_type']
+    else:
+        digest = meta['photo_sha256']
+        last_modified = meta['photo_uploaded_at']
+        media_type = meta['photo_content_type'] or 'application/octet-stream'
+
+    # Derivatives are tied to the original, so the ?v= version covers them too
+    version = meta['photo_sha256'][:photos.PHOTO_VERSION_LENGTH]
+    etag = photos.make_etag(digest)
+    headers = photos.cache_headers(etag, last_modified, immutable=request.query_params.get('v') == version)
+    headers["Vary"] = "Accept"
+
+    if photos.is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        return photos.blob_response(get_blob_store(), digest, media_type, headers)
+    except BlobNotFound:
+        logger.warning(f"Photo blob {digest} for player {player_id} is missing from the blob store")
+        raise HTTPException(status_code=404, detail="Photo file not found")
 
 
 @app.post("/scout/create", status_code=201)
@@ -510,11 +723,8 @@ def get_all_medical_staff():
             JOIN staff st ON ms.staff_id = st.staff_id
             ORDER BY st.last_name, st.first_name
         """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        rows = [_serialize_row_dates(r) for r in rows]
-        return {"status": "success", "count": len(rows), "data": rows}
+        rows = cursor.fetchall() or []
+        return FastJSONResponse({"status": "success", "count": len(rows), "data": rows})
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -548,67 +758,13 @@ def get_all_medical_reports(player_id: int):
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT
-                mr.med_report_id,
-                mr.player_id,
-                p.first_name,
-                p.middle_name,
-                p.last_name,
-                mr.summary,
-                mr.report_date,
-                mr.treatment,
-                mr.severity_of_injury,
-                mc.condition_id,
-                mc.condition_name,
-                mc.description AS condition_description,
-                mc.diagnosis_date
-            FROM medical_report mr
-            JOIN player p ON mr.player_id = p.player_id
-            LEFT JOIN medical_condition mc ON mc.med_report_id = mr.med_report_id
+        cursor.execute(f"""
+            {queries.MEDICAL_REPORTS_SQL}
             WHERE mr.player_id = %s
-            ORDER BY mr.report_date DESC, mc.diagnosis_date DESC
+            ORDER BY {pagination.order_by(queries.MEDICAL_REPORTS_SORT)}
         """, (player_id,))
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-
-        # Group rows by med_report_id and accumulate conditions into a list for each report
-        reports_by_id = {}
-        for r in rows:
-            report_id = r.get('med_report_id')
-            if report_id not in reports_by_id:
-                report = {
-                    'med_report_id': report_id,
-                    'player_id': r.get('player_id'),
-                    'player_first_name': r.get('first_name'),
-                    'player_middle_name': r.get('middle_name'),
-                    'player_last_name': r.get('last_name'),
-                    'summary': r.get('summary'),
-                    'report_date': r.get('report_date'),
-                    'treatment': r.get('treatment'),
-                    'severity_of_injury': r.get('severity_of_injury'),
-                    'conditions': []
-                }
-                reports_by_id[report_id] = report
-
-            # If there is a condition row (may be NULL if no conditions linked), append it
-            if r.get('condition_id') is not None:
-                cond = {
-                    'condition_id': r.get('condition_id'),
-                    'condition_name': r.get('condition_name'),
-                    'description': r.get('condition_description'),
-                    'diagnosis_date': r.get('diagnosis_date')
-                }
-                reports_by_id[report_id]['conditions'].append(_serialize_row_dates(cond))
-
-        # Prepare final list with serialized report dates
-        result = []
-        for rep in reports_by_id.values():
-            rep_serialized = _serialize_row_dates(rep)
-            result.append(rep_serialized)
-
-        return {"status": "success", "count": len(result), "data": result}
+        result = queries.shape_medical_reports(cursor.fetchall() or [])
+        return FastJSONResponse({"status": "success", "count": len(result), "data": result})
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -631,14 +787,8 @@ def get_upcoming_fixtures():
             WHERE match_date >= CURDATE()
             ORDER BY match_date ASC, match_time ASC
         """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        # serialize date/time fields
-        serialized = []
-        for r in rows:
-            serialized.append(_serialize_row_dates(r))
-        return {"status": "success", "count": len(serialized), "data": serialized}
+        rows = cursor.fetchall() or []
+        return FastJSONResponse({"status": "success", "count": len(rows), "data": rows})
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -689,35 +839,28 @@ def get_all_formations():
 
 
 @app.get("/lineups", response_model=Dict)
-def get_all_lineups():
+def get_all_lineups(
+    match_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
     """Get all saved lineups"""
+    requested = queries.LINEUP_FIELDS.parse(fields)
+    where, params = queries.lineup_filters(match_id, team_id, date_from, date_to)
+    select_sql = queries.LINEUP_FIELDS.select_sql(requested, queries.LINEUPS_SORT)
+    if stream:
+        return streaming.stream_page(select_sql, queries.LINEUPS_SORT, where, params, page_cursor, stream,
+                                     lambda rows: queries.LINEUP_FIELDS.project(rows, requested))
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT 
-                ml.lineup_id, 
-                ml.match_id, 
-                ml.team_id, 
-                ml.formation_id,
-                ml.is_starting,
-                ml.minute_applied,
-                f.code as formation_code,
-                f.name as formation_name,
-                m.name as match_name,
-                m.match_date,
-                t.name as team_name
-            FROM match_lineup ml
-            JOIN formation f ON f.formation_id = ml.formation_id
-            LEFT JOIN match_table m ON m.match_id = ml.match_id
-            LEFT JOIN team t ON t.team_id = ml.team_id
-            ORDER BY ml.lineup_id DESC
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        rows = [_serialize_row_dates(r) for r in rows]
-        return {"status": "success", "count": len(rows), "data": rows}
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.LINEUPS_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.LINEUP_FIELDS.project(rows, requested), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -771,7 +914,6 @@ def get_lineup_details(lineup_id: int):
         """, (lineup_id,))
         slots = cursor.fetchall()
         
-        lineup = _serialize_row_dates(lineup)
         lineup['slots'] = slots if slots else []
         
         return {"status": "success", "data": lineup}
@@ -786,71 +928,26 @@ def get_lineup_details(lineup_id: int):
 
 
 @app.get("/medical_reports", response_model=Dict)
-def get_all_medical_reports_all_players():
+def get_all_medical_reports_all_players(
+    player_id: Optional[int] = None,
+    severity: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
     """Return all medical reports across all players, with linked medical conditions nested per report"""
+    where, params = queries.medical_report_filters(player_id, severity, date_from, date_to)
+    if stream:
+        return streaming.stream_page(queries.MEDICAL_REPORTS_SQL, queries.MEDICAL_REPORTS_SORT, where, params,
+                                     page_cursor, stream, queries.shape_medical_reports)
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT
-                mr.med_report_id,
-                mr.player_id,
-                p.first_name,
-                p.middle_name,
-                p.last_name,
-                mr.summary,
-                mr.report_date,
-                mr.treatment,
-                mr.severity_of_injury,
-                mc.condition_id,
-                mc.condition_name,
-                mc.description AS condition_description,
-                mc.diagnosis_date
-            FROM medical_report mr
-            JOIN player p ON mr.player_id = p.player_id
-            LEFT JOIN medical_condition mc ON mc.med_report_id = mr.med_report_id
-            ORDER BY mr.report_date DESC, mc.diagnosis_date DESC
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-
-        # Group rows by med_report_id and accumulate conditions into a list for each report
-        reports_by_id = {}
-        for r in rows:
-            report_id = r.get('med_report_id')
-            if report_id not in reports_by_id:
-                report = {
-                    'med_report_id': report_id,
-                    'player_id': r.get('player_id'),
-                    'player_first_name': r.get('first_name'),
-                    'player_middle_name': r.get('middle_name'),
-                    'player_last_name': r.get('last_name'),
-                    'summary': r.get('summary'),
-                    'report_date': r.get('report_date'),
-                    'treatment': r.get('treatment'),
-                    'severity_of_injury': r.get('severity_of_injury'),
-                    'conditions': []
-                }
-                reports_by_id[report_id] = report
-
-            # If there is a condition row (may be NULL if no conditions linked), append it
-            if r.get('condition_id') is not None:
-                cond = {
-                    'condition_id': r.get('condition_id'),
-                    'condition_name': r.get('condition_name'),
-                    'description': r.get('condition_description'),
-                    'diagnosis_date': r.get('diagnosis_date')
-                }
-                reports_by_id[report_id]['conditions'].append(_serialize_row_dates(cond))
-
-        # Prepare final list with serialized report dates
-        result = []
-        for rep in reports_by_id.values():
-            rep_serialized = _serialize_row_dates(rep)
-            result.append(rep_serialized)
-
-        return {"status": "success", "count": len(result), "data": result}
+        rows, next_cursor = pagination.fetch_page(cursor, queries.MEDICAL_REPORTS_SQL, queries.MEDICAL_REPORTS_SORT,
+                                                  where, params, page_cursor, limit)
+        return queries.page_response(queries.shape_medical_reports(rows), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -861,90 +958,19 @@ def get_all_medical_reports_all_players():
 
 @app.get("/player_details/{player_id}", response_model=Dict)
 def get_player_details(player_id: int):
+    """Player profile with medical reports, match stats and season totals, from one query"""
+    body = cache.player_profiles.get(player_id)
+    if body is not None:
+        return Response(body, media_type="application/json")
+    token = cache.player_profiles.begin(player_id)
+
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT 
-                player_id,
-                first_name,
-                middle_name,
-                last_name,
-                salary,
-                positions,
-                is_active,
-                is_injured,
-                transfer_value,
-                contract_end_date,
-                scouted_player,
-                photo,
-                photo_content_type,
-                photo_filename,
-                photo_size,
-                photo_uploaded_at
-            FROM player
-            WHERE player_id = %s
-        """, (player_id,))
-        player = cursor.fetchone()
-        
-        if not player:
+        cursor.execute(queries.PLAYER_PROFILE_SQL, (player_id,))
+        row = cursor.fetchone()
+        if not row:
             raise HTTPException(status_code=404, detail="Player not found")
-        
-        player = _serialize_row_dates(player)
-        
-        # Convert photo to base64 if exists
-        if player.get('photo'):
-            player['photo'] = base64.b64encode(player['photo']).decode('utf-8')
-        
-        # Get medical reports for the player
-        cursor.execute("""
-            SELECT
-                mr.med_report_id,
-                mr.summary,
-                mr.report_date,
-                mr.treatment,
-                mr.severity_of_injury
-            FROM medical_report mr
-            WHERE mr.player_id = %s
-            ORDER BY mr.report_date DESC
-        """, (player_id,))
-        reports = cursor.fetchall()
-        
-        player['medical_reports'] = [_serialize_row_dates(r) for r in reports] if reports else []
-        
-        # Get match stats for the player across matches
-        cursor.execute("""
-            SELECT
-                pms.pms_id,
-                pms.player_id,
-                pms.match_id,
-                m.name AS match_name,
-                m.match_date,
-                m.match_time,
-                pms.team_id,
-                t.name AS team_name,
-                pms.started,
-                pms.tackles,
-                pms.minutes,
-                pms.shots_total,
-                pms.offsides,
-                pms.red_cards,
-                pms.yellow_cards,
-                pms.fouls_committed,
-                pms.dribbles_attempted,
-                pms.assists,
-                pms.goals,
-                pms.passing_accuracy
-            FROM player_match_stats pms
-            LEFT JOIN match_table m ON pms.match_id = m.match_id
-            LEFT JOIN team t ON pms.team_id = t.team_id
-            WHERE pms.player_id = %s
-            ORDER BY m.match_date DESC, m.match_time DESC
-        """, (player_id,))
-        pms_rows = cursor.fetchall()
-        player['match_stats'] = [_serialize_row_dates(r) for r in pms_rows] if pms_rows else []
-        
-        return {"status": "success", "data": player}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -953,6 +979,10 @@ def get_player_details(player_id: int):
         if connection:
             connection.close()
 
+    body = json_response.dumps({"status": "success", "data": queries.shape_player_profile(row)})
+    cache.player_profiles.set(player_id, body, token)
+    return Response(body, media_type="application/json")
+
 
 
 @app.post("/match/create", status_code=201)
@@ -1004,7 +1034,6 @@ def get_match_by_id(match_id: int):
         if not row:
             raise HTTPException(status_code=404, detail="Match not found")
         
-        row = _serialize_row_dates(row)
         return {"status": "success", "data": row}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
@@ -1016,25 +1045,26 @@ def get_match_by_id(match_id: int):
 
 
 @app.get("/matches", response_model=Dict)
-def get_all_matches():
+def get_all_matches(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
     """Get all matches"""
+    requested = queries.MATCH_FIELDS.parse(fields)
+    where, params = queries.match_filters(date_from, date_to)
+    select_sql = queries.MATCH_FIELDS.select_sql(requested, queries.MATCHES_SORT)
+    if stream:
+        return streaming.stream_page(select_sql, queries.MATCHES_SORT, where, params, page_cursor, stream,
+                                     lambda rows: queries.MATCH_FIELDS.project(rows, requested))
     connection = get_db_connection()
     cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            SELECT match_id, name, venue, match_time, opponent_team, match_date, result
-            FROM match_table
-            ORDER BY match_date DESC, match_time DESC
-        """)
-        rows = cursor.fetchall()
-        if rows is None:
-            rows = []
-        
-        serialized = []
-        for r in rows:
-            serialized.append(_serialize_row_dates(r))
-        
-        return {"status": "success", "count": len(serialized), "data": serialized}
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.MATCHES_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.MATCH_FIELDS.project(rows, requested), next_cursor)
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
     finally:
@@ -1043,104 +1073,211 @@ def get_all_matches():
         if connection:
             connection.close()
 
-@app.post("/player/injure/{player_id}", status_code=200)
-def set_player_as_injured(player_id: int):
+
+@app.get("/player_match_stats", response_model=Dict)
+def get_player_match_stats(
+    player_id: Optional[int] = None,
+    match_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    fields: Optional[str] = None,
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    limit: int = Query(pagination.DEFAULT_LIMIT, ge=1, le=pagination.MAX_LIMIT),
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    """Per-match player stat lines; ?stream=ndjson exports the whole table"""
+    requested = queries.PMS_FIELDS.parse(fields)
+    where, params = queries.pms_filters(player_id, match_id, team_id)
+    select_sql = queries.PMS_FIELDS.select_sql(requested, queries.PMS_SORT)
+    if stream:
+        return streaming.stream_page(select_sql, queries.PMS_SORT, where, params, page_cursor, stream,
+                                     lambda rows: queries.PMS_FIELDS.project(rows, requested))
     connection = get_db_connection()
-    connection.start_transaction()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            UPDATE player SET is_injured = TRUE WHERE player_id = %s
-        """, (player_id,))
+        rows, next_cursor = pagination.fetch_page(cursor, select_sql, queries.PMS_SORT, where, params, page_cursor, limit)
+        return queries.page_response(queries.PMS_FIELDS.project(rows, requested), next_cursor)
     except mysql.connector.Error as err:
-        connection.rollback()
         raise HTTPException(status_code=500, detail=str(err))
-    except Exception as e:
-        connection.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
     finally:
         if cursor:
             cursor.close()
         if connection:
-            connection.commit()
             connection.close()
 
+@app.post("/player_match_stats/create", status_code=201)
+def create_player_match_stats(stats: PlayerMatchStatsCreate):
+    try:
+        pms_id = PlayerMatchStats.create(stats)
+        return {"status": "success", "pms_id": pms_id}
+    except mysql.connector.IntegrityError as err:
+        raise HTTPException(status_code=409, detail=str(err))
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
 
-# UPDATE endpoint for player injury status
-@app.post("/player/injure/{player_id}", status_code=200)
-def set_player_as_injured(player_id: int):
+
+@app.put("/player_match_stats/{pms_id}", status_code=200)
+def update_player_match_stats(pms_id: int, stats: PlayerMatchStatsCreate):
     connection = get_db_connection()
     connection.start_transaction()
-    connection.commit()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            UPDATE player SET is_injured = TRUE WHERE player_id = %s
-        """, (player_id,))
+        before = season_stats.fetch_stat_line(cursor, pms_id)
+        if not before:
+            raise HTTPException(status_code=404, detail="Match stats not found")
+
+        assignments = ", ".join(f"{column} = %s" for column in PMS_COLUMNS)
+        cursor.execute(f"UPDATE player_match_stats SET {assignments} WHERE pms_id = %s",
+                       (*(getattr(stats, c) for c in PMS_COLUMNS), pms_id))
+        season_stats.apply_change(cursor, before, season_stats.fetch_stat_line(cursor, pms_id))
+        connection.commit()
+        cache.invalidate_player(before['player_id'])
+        cache.invalidate_player(stats.player_id)
+        cache.invalidate_stats()
+        return {"status": "success", "message": "Match stats updated"}
+    except mysql.connector.IntegrityError as err:
+        connection.rollback()
+        raise HTTPException(status_code=409, detail=str(err))
     except mysql.connector.Error as err:
         connection.rollback()
         raise HTTPException(status_code=500, detail=str(err))
-    except Exception as e:
-        connection.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
     finally:
         if cursor:
             cursor.close()
         if connection:
-            connection.commit()
             connection.close()
-    return {"status": "success", "message": "Player marked as injured"}
 
 
-# UPDATE endpoint to heal player
-@app.post("/player/heal/{player_id}", status_code=200)
-def set_player_as_healed(player_id: int):
+@app.delete("/player_match_stats/{pms_id}", status_code=200)
+def delete_player_match_stats(pms_id: int):
     connection = get_db_connection()
     connection.start_transaction()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            UPDATE player SET is_injured = FALSE WHERE player_id = %s
-        """, (player_id,))
+        before = season_stats.fetch_stat_line(cursor, pms_id)
+        if not before:
+            raise HTTPException(status_code=404, detail="Match stats not found")
+
+        cursor.execute("DELETE FROM player_match_stats WHERE pms_id = %s", (pms_id,))
+        season_stats.apply_change(cursor, before=before)
+        connection.commit()
+        cache.invalidate_player(before['player_id'])
+        cache.invalidate_stats()
+        return {"status": "success", "message": "Match stats deleted"}
     except mysql.connector.Error as err:
         connection.rollback()
         raise HTTPException(status_code=500, detail=str(err))
-    except Exception as e:
-        connection.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
     finally:
         if cursor:
             cursor.close()
         if connection:
-            connection.commit()
             connection.close()
-    return {"status": "success", "message": "Player marked as healed"}
 
 
-# UPDATE endpoint to deactivate player
-@app.post("/player/deactivate/{player_id}", status_code=200)
-def set_player_as_inactive(player_id: int):
+@app.get("/player_season_stats/{player_id}", response_model=Dict)
+def get_player_season_stats(player_id: int):
+    """Season and career totals with per-90 rates, read from the player_season_stats aggregate"""
+    connection = get_db_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        rows = season_stats.read_player(cursor, player_id)
+        if not rows:
+            cursor.execute("SELECT 1 FROM player WHERE player_id = %s", (player_id,))
+            if not cursor.fetchone():
+                raise HTTPException(status_code=404, detail="Player not found")
+        return FastJSONResponse({"status": "success", "data": season_stats.player_summary(player_id, rows)})
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+
+@app.get("/leaderboards/{metric}", response_model=Dict)
+def get_leaderboard(
+    metric: Literal[leaderboards.METRICS],
+    rate: Literal[leaderboards.RATES] = leaderboards.TOTAL,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    team_id: Optional[int] = None,
+    season: Optional[int] = Query(None, description="Starting year, e.g. 2024 for 2024/25"),
+    min_minutes: int = Query(0, ge=0),
+    limit: int = Query(leaderboards.DEFAULT_LIMIT, ge=1, le=leaderboards.MAX_LIMIT),
+):
+    """Top players by one player_match_stats metric, e.g. /leaderboards/tackles?rate=per_90&min_minutes=900"""
+    key = (metric, rate, date_from, date_to, team_id, season, min_minutes, limit)
+    body = cache.leaderboards.get(key)
+    if body is not None:
+        return Response(body, media_type="application/json")
+    token = cache.leaderboards.begin(key)
+
+    query, params = leaderboards.build_query(metric, rate, date_from, date_to, team_id, season, min_minutes, limit)
+    connection = get_db_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(query, params)
+        rows = leaderboards.shape(cursor.fetchall(), metric, rate)
+    except mysql.connector.Error as err:
+        raise HTTPException(status_code=500, detail=str(err))
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+    body = json_response.dumps({"status": "success", "metric": metric, "rate": rate, "count": len(rows), "data": rows})
+    cache.leaderboards.set(key, body, token)
+    return Response(body, media_type="application/json")
+
+
+def _set_player_flags(player_id: int, **flags) -> None:
+    """Set is_active / is_injured on one player and move the dashboard counters with it"""
     connection = get_db_connection()
     connection.start_transaction()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
-        cursor.execute("""
-            UPDATE player SET is_active = FALSE WHERE player_id = %s
-        """, (player_id,))
-        if cursor.rowcount == 0:
+        # Lock the row so the counter delta is computed from the state this UPDATE replaces
+        cursor.execute("SELECT is_active, is_injured FROM player WHERE player_id = %s FOR UPDATE", (player_id,))
+        before = cursor.fetchone()
+        if not before:
             raise HTTPException(status_code=404, detail="Player not found")
+        assignments = ", ".join(f"{column} = %s" for column in flags)
+        cursor.execute(f"UPDATE player SET {assignments} WHERE player_id = %s", (*flags.values(), player_id))
+        counters.bump_many(cursor, counters.player_deltas(before, {**before, **flags}))
+        connection.commit()
+        cache.invalidate_player(player_id)
+    except HTTPException:
+        connection.rollback()
+        raise
     except mysql.connector.Error as err:
         connection.rollback()
         raise HTTPException(status_code=500, detail=str(err))
-    except Exception as e:
-        connection.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
     finally:
         if cursor:
             cursor.close()
         if connection:
-            connection.commit()
             connection.close()
+
+
+# UPDATE endpoint for player injury status
+@app.post("/player/injure/{player_id}", status_code=200)
+def set_player_as_injured(player_id: int):
+    _set_player_flags(player_id, is_injured=True)
+    return {"status": "success", "message": "Player marked as injured"}
+
+
+# UPDATE endpoint to heal player
+@app.post("/player/heal/{player_id}", status_code=200)
+def set_player_as_healed(player_id: int):
+    _set_player_flags(player_id, is_injured=False)
+    return {"status": "success", "message": "Player marked as healed"}
+
+
+# UPDATE endpoint to deactivate player
+@app.post("/player/deactivate/{player_id}", status_code=200)
+def set_player_as_inactive(player_id: int):
+    _set_player_flags(player_id, is_active=False)
     return {"status": "success", "message": "Player marked as inactive"}
 
 
@@ -1177,12 +1314,17 @@ def delete_match(match_id: int):
     connection.start_transaction()
     cursor = connection.cursor()
     try:
+        # The match's stat lines cascade away with it; take them out of the season totals first
+        season_stats.remove_match(cursor, match_id)
         cursor.execute("DELETE FROM match_table WHERE match_id = %s", (match_id,))
         
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Match not found")
             
         connection.commit()
+        # The match's stats rows went with it, and they appear in many player profiles
+        cache.player_profiles.clear()
+        cache.invalidate_stats()
         return {"status": "success", "message": "Match deleted"}
     except mysql.connector.Error as err:
         connection.rollback()
@@ -1201,6 +1343,11 @@ def update_staff(staff_id: int, staff: StaffCreate):
     connection.start_transaction()
     cursor = connection.cursor()
     try:
+        cursor.execute("SELECT staff_type FROM staff WHERE staff_id = %s FOR UPDATE", (staff_id,))
+        before = cursor.fetchone()
+        if not before:
+            raise HTTPException(status_code=404, detail="Staff member not found")
+
         cursor.execute("""
             UPDATE staff 
             SET first_name = %s, middle_name = %s, last_name = %s, 
@@ -1208,10 +1355,9 @@ def update_staff(staff_id: int, staff: StaffCreate):
             WHERE staff_id = %s
         """, (staff.first_name, staff.middle_name, staff.last_name,
               staff.email, staff.salary, staff.age, staff.staff_type, staff_id))
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Staff member not found")
-            
+
+        if before[0] != staff.staff_type:
+            counters.bump_many(cursor, counters.staff_deltas(before[0], staff.staff_type))
         connection.commit()
         return {"status": "success", "message": "Staff updated"}
     except mysql.connector.Error as err:
@@ -1229,8 +1375,13 @@ def update_staff(staff_id: int, staff: StaffCreate):
 def update_player(player_id: int, player: PlayerCreate):
     connection = get_db_connection()
     connection.start_transaction()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
+        cursor.execute("SELECT is_active, is_injured FROM player WHERE player_id = %s FOR UPDATE", (player_id,))
+        before = cursor.fetchone()
+        if not before:
+            raise HTTPException(status_code=404, detail="Player not found")
+
         cursor.execute("""
             UPDATE player 
             SET first_name = %s, middle_name = %s, last_name = %s, 
@@ -1241,11 +1392,11 @@ def update_player(player_id: int, player: PlayerCreate):
               player.salary, player.positions, player.is_active, player.is_injured,
               player.transfer_value, player.contract_end_date, player.scouted_player,
               player_id))
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Player not found")
-            
+
+        counters.bump_many(cursor, counters.player_deltas(before, vars(player)))
         connection.commit()
+        cache.invalidate_player(player_id)
+        cache.invalidate_stats()
         return {"status": "success", "message": "Player updated"}
     except mysql.connector.Error as err:
         connection.rollback()
@@ -1262,18 +1413,29 @@ def update_player(player_id: int, player: PlayerCreate):
 def delete_player(player_id: int):
     connection = get_db_connection()
     connection.start_transaction()
-    cursor = connection.cursor()
+    cursor = connection.cursor(dictionary=True)
     try:
+        cursor.execute("""
+            SELECT is_active, is_injured,
+                   (SELECT COUNT(*) FROM medical_report WHERE player_id = %s) AS medical_reports
+            FROM player WHERE player_id = %s FOR UPDATE
+        """, (player_id, player_id))
+        before = cursor.fetchone()
+        if not before:
+            raise HTTPException(status_code=404, detail="Player not found")
+
         # First, delete from match_lineup_slot to avoid foreign key constraint
         cursor.execute("DELETE FROM match_lineup_slot WHERE player_id = %s", (player_id,))
         
         # Then delete the player (this will cascade to medical_report, player_match_stats, scouting_report)
         cursor.execute("DELETE FROM player WHERE player_id = %s", (player_id,))
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Player not found")
-            
+
+        deltas = counters.player_deltas(before=before)
+        deltas[counters.MEDICAL_REPORTS_TOTAL] = -before['medical_reports']
+        counters.bump_many(cursor, deltas)
         connection.commit()
+        cache.invalidate_player(player_id)
+        cache.invalidate_stats()
         return {"status": "success", "message": "Player and all related records deleted"}
     except mysql.connector.Error as err:
         connection.rollback()
@@ -1303,7 +1465,6 @@ def get_player_by_id(player_id: int):
         if not row:
             raise HTTPException(status_code=404, detail="Player not found")
         
-        row = _serialize_row_dates(row)
         return {"status": "success", "data": row}
     except mysql.connector.Error as err:
         raise HTTPException(status_code=500, detail=str(err))
@@ -0,0 +1,234 @@
+"""Process metrics in the Prometheus text exposition format, served at `GET /metrics`.
+
+Kept to what the app needs instead of pulling in prometheus_client: counters, gauges and
+histograms with fixed label names, each child updated under its metric's lock. Recording is a
+dict lookup and an add (plus a bisect for histograms), cheap enough to leave on for every request.
+
+Values that already live elsewhere (the connection pools' counters, for instance) aren't copied
+here on every change; a collector registered with register_collector() reads them at scrape time.
+
+Requests are labelled with their route template (`/player/{player_id}/photo`), never the raw
+path, so the number of series stays bounded; requests no route matched share route="<unmatched>".
+"""
+import bisect
+import math
+import os
+import threading
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").strip().lower() in ("1", "true", "yes", "on")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; the same bounds as the per-fingerprint SQL histograms (query_log.py)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs += [f'{name}="{_escape(value)}"' for name, value in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            lines.extend(self._render_child(values, child))
+        return lines
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value):
+        self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value(self._lock)
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+    def _render_child(self, values, child):
+        yield f"{self.name}{_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount=1):
+        self.labels().dec(amount)
+
+    def set(self, value):
+        self.labels().set(value)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+
+    def __init__(self, bounds, lock):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = lock
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def _render_child(self, values, child):
+        with self._lock:
+            counts, total = list(child.counts), child.sum
+        cumulative = 0
+        for bound, n in zip(self.buckets + (math.inf,), counts):
+            cumulative += n
+            yield f"{self.name}_bucket{_labels(self.labelnames, values, [('le', _format_value(bound))])} {cumulative}"
+        yield f"{self.name}_sum{_labels(self.labelnames, values)} {_format_value(total)}"
+        yield f"{self.name}_count{_labels(self.labelnames, values)} {cumulative}"
+
+
+_registry = []
+_collectors = []
+
+
+def _register(metric):
+    _registry.append(metric)
+    return metric
+
+
+def register_collector(collect):
+    """`collect()` returns (name, kind, documentation, [(labels dict, value), ...]) tuples at scrape time"""
+    _collectors.append(collect)
+    return collect
+
+
+def render() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    # Several collectors may report the same family (one per pool); each family gets one header
+    families = {}
+    for collect in _collectors:
+        for name, kind, documentation, samples in collect():
+            families.setdefault(name, (kind, documentation, []))[2].extend(samples)
+    for name, (kind, documentation, samples) in families.items():
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            lines.append(f"{name}{_labels(labels.keys(), labels.values())} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUESTS = _register(Counter(
+    "soms_http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")))
+HTTP_REQUEST_DURATION = _register(Histogram(
+    "soms_http_request_duration_seconds", "Time from request to response headers", ("method", "route")))
+HTTP_IN_FLIGHT = _register(Gauge(
+    "soms_http_requests_in_flight", "Requests currently being handled", ("method",)))
+
+DB_CHECKOUT_WAIT = _register(Histogram(
+    "soms_db_checkout_wait_seconds", "Time waiting to check out a database connection", ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)))
+
+UPLOAD_BYTES = _register(Counter(
+    "soms_upload_bytes_total", "Bytes of accepted file uploads", ("endpoint",)))
+UPLOADS = _register(Counter(
+    "soms_uploads_total", "File uploads by outcome (accepted, too_large, invalid)", ("endpoint", "outcome")))
+
+LOGIN_ATTEMPTS = _register(Counter(
+    "soms_login_attempts_total", "Login attempts"))
+LOGIN_FAILURES = _register(Counter(
+    "soms_login_failures_total", "Failed logins by reason", ("reason",)))
+
+
+def route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+def pool_collector(name, stats):
+    """A collector exporting a connection pool's stats() (see ConnectionPool.stats) as `pool=name`"""
+    def collect():
+        data = stats()
+        if not data.get("enabled"):
+            return []
+        pool = {"pool": name}
+        return [
+            ("soms_db_pool_connections", "gauge", "Open connections by state",
+             [({**pool, "state": "idle"}, data["idle"]), ({**pool, "state": "in_use"}, data["in_use"])]),
+            ("soms_db_pool_size", "gauge", "Open connections, including ones being connected",
+             [(pool, data["size"])]),
+            ("soms_db_pool_max_size", "gauge", "Configured connection cap", [(pool, data["max_size"])]),
+            ("soms_db_pool_waiting", "gauge", "Callers waiting for a free connection", [(pool, data["waiting"])]),
+            ("soms_db_pool_connections_created_total", "counter", "Connections opened",
+             [(pool, data["created"])]),
+            ("soms_db_pool_connections_recycled_total", "counter", "Connections closed for age, idleness or errors",
+             [(pool, data["recycled"])]),
+            ("soms_db_pool_checkouts_total", "counter", "Connections checked out", [(pool, data["checkouts"])]),
+            ("soms_db_pool_timeouts_total", "counter", "Checkouts that timed out waiting", [(pool, data["timeouts"])]),
+        ]
+    return collect
@@ -0,0 +1,118 @@
+import argparse
+
+from blob_store import get_blob_store
+from db_connect_module import get_db_connection
+
+
+def _column_exists(cursor, table, column):
+    cursor.execute("""
+        SELECT COUNT(*) AS n FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+    """, (table, column))
+    return cursor.fetchone()['n'] > 0
+
+
+def _migrate_player_photos(conn, cursor, store, batch_size):
+    moved = 0
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT player_id FROM player
+            WHERE player_id > %s AND photo IS NOT NULL
+            ORDER BY player_id
+            LIMIT %s
+        """, (last_id, batch_size))
+        ids = [row['player_id'] for row in cursor.fetchall()]
+        if not ids:
+            return moved
+        last_id = ids[-1]
+
+        for player_id in ids:
+            # One blob at a time keeps memory flat regardless of batch size
+            cursor.execute("SELECT photo FROM player WHERE player_id = %s", (player_id,))
+            data = bytes(cursor.fetchone()['photo'])
+            digest = store.put(data)
+            cursor.execute("""
+                UPDATE player
+                SET photo_sha256 = %s, photo_size = COALESCE(photo_size, %s), photo = NULL
+                WHERE player_id = %s
+            """, (digest, len(data), player_id))
+        conn.commit()
+        moved += len(ids)
+        print(f"Players: moved {moved} photos (up to player_id {last_id})")
+
+
+def _migrate_variant_data(conn, cursor, store, batch_size):
+    moved = 0
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT DISTINCT player_id FROM player_photo_variant
+            WHERE player_id > %s AND data IS NOT NULL
+            ORDER BY player_id
+            LIMIT %s
+        """, (last_id, batch_size))
+        ids = [row['player_id'] for row in cursor.fetchall()]
+        if not ids:
+            return moved
+        last_id = ids[-1]
+
+        for player_id in ids:
+            cursor.execute("""
+                SELECT variant, format, data FROM player_photo_variant
+                WHERE player_id = %s AND data IS NOT NULL
+            """, (player_id,))
+            for row in cursor.fetchall():
+                digest = store.put(bytes(row['data']))
+                cursor.execute("""
+                    UPDATE player_photo_variant SET sha256 = %s, data = NULL
+                    WHERE player_id = %s AND variant = %s AND format = %s
+                """, (digest, player_id, row['variant'], row['format']))
+                moved += 1
+        conn.commit()
+        print(f"Variants: moved {moved} blobs (up to player_id {last_id})")
+
+
+def migrate_photos_to_store(batch_size=100, drop_column=False):
+    """Move photo bytes out of MySQL (player.photo, player_photo_variant.data) into the blob store.
+
+    Works in keyset batches of player_id and commits after each batch, so it can be stopped and
+    re-run safely. With drop_column=True the emptied BLOB columns are dropped at the end.
+    """
+    store = get_blob_store()
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        has_photo_column = _column_exists(cursor, 'player', 'photo')
+        has_data_column = _column_exists(cursor, 'player_photo_variant', 'data')
+
+        if has_photo_column:
+            print(f"Moved {_migrate_player_photos(conn, cursor, store, batch_size)} player photos")
+        if has_data_column:
+            # New code inserts variants without bytes, so the legacy column must allow NULL
+            cursor.execute("ALTER TABLE player_photo_variant MODIFY COLUMN data MEDIUMBLOB NULL")
+            print(f"Moved {_migrate_variant_data(conn, cursor, store, batch_size)} variant blobs")
+
+        if drop_column:
+            if has_photo_column:
+                cursor.execute("ALTER TABLE player DROP COLUMN photo")
+                print("Dropped player.photo")
+            if has_data_column:
+                cursor.execute("ALTER TABLE player_photo_variant DROP COLUMN data")
+                print("Dropped player_photo_variant.data")
+        print("\nMigration complete")
+    except Exception as e:
+        conn.rollback()
+        print(f"Error migrating photos: {e}")
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move photo BLOBs out of MySQL into the content-addressed blob store")
+    parser.add_argument("--batch-size", type=int, default=100, help="players per batch/commit (default: 100)")
+    parser.add_argument("--drop-column", action="store_true", help="drop the emptied BLOB columns when done")
+    args = parser.parse_args()
+    migrate_photos_to_store(batch_size=args.batch_size, drop_column=args.drop_column)
@@ -0,0 +1,176 @@
+"""Versioned schema changes, applied in order and recorded in schema_migrations.
+
+SOMS_db_create.py creates any missing tables and then calls migrate(), which runs only the
+migrations a database hasn't recorded yet, so re-running the bootstrap skips work already done.
+Run it on its own against an existing database with:
+
+    python migrations.py            # apply pending migrations
+    python migrations.py status     # list applied and pending versions
+
+MySQL commits DDL implicitly, so a migration can't be rolled back halfway. Each one therefore
+checks information_schema before every change and is safe to re-run after a failure. Indexes
+are added with ALGORITHM=INPLACE, LOCK=NONE: the table stays readable and writable while the
+index builds, and MySQL refuses outright (rather than locking the table) if it can't do that.
+"""
+from collections import namedtuple
+
+Migration = namedtuple("Migration", "version name apply")
+
+MIGRATIONS = []
+
+# Serializes concurrent bootstraps (e.g. several containers starting at once)
+_LOCK_NAME = 'soms_schema_migrations'
+_LOCK_TIMEOUT = 60
+
+
+def migration(version, name):
+    def register(apply):
+        if MIGRATIONS and version <= MIGRATIONS[-1].version:
+            raise ValueError(f"Migration {version} is out of order")
+        MIGRATIONS.append(Migration(version, name, apply))
+        return apply
+    return register
+
+
+def _scalar(cursor, query, params=()):
+    cursor.execute(query, params)
+    return cursor.fetchone()[0]
+
+
+def column_type(cursor, table, column):
+    """COLUMN_TYPE (e.g. 'decimal(12,2)') of a column, or None if it doesn't exist"""
+    cursor.execute("""
+        SELECT column_type FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+    """, (table, column))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def index_exists(cursor, table, index_name):
+    return _scalar(cursor, """
+        SELECT COUNT(*) FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+    """, (table, index_name)) > 0
+
+
+def add_index(cursor, table, index_name, columns):
+    if not index_exists(cursor, table, index_name):
+        cursor.execute(f"ALTER TABLE {table} ADD INDEX {index_name} ({columns}), ALGORITHM=INPLACE, LOCK=NONE")
+
+
+@migration(1, "widen player salary and transfer_value to DECIMAL(12,2)")
+def _widen_player_money(cursor):
+    # Changing a column type rebuilds the table, so only do it on databases that need it
+    if (column_type(cursor, 'player', 'salary') != 'decimal(12,2)'
+            or column_type(cursor, 'player', 'transfer_value') != 'decimal(12,2)'):
+        cursor.execute("""
+            ALTER TABLE player
+            MODIFY COLUMN salary DECIMAL(12,2) NOT NULL,
+            MODIFY COLUMN transfer_value DECIMAL(12,2)
+        """)
+
+
+@migration(2, "add player.photo_sha256")
+def _add_photo_sha256(cursor):
+    if column_type(cursor, 'player', 'photo_sha256') is None:
+        cursor.execute("""
+            ALTER TABLE player ADD COLUMN photo_sha256 CHAR(64) AFTER photo_uploaded_at,
+            ALGORITHM=INPLACE, LOCK=NONE
+        """)
+
+
+@migration(3, "allow NULL in the legacy player_photo_variant.data column")
+def _nullable_variant_data(cursor):
+    # Databases created before the blob store still carry the column (see migrate_photos_to_store.py);
+    # new rows leave it NULL
+    if column_type(cursor, 'player_photo_variant', 'data') is not None:
+        cursor.execute("ALTER TABLE player_photo_variant MODIFY COLUMN data MEDIUMBLOB NULL")
+
+
+@migration(4, "indexes matching the sort order of the paginated list endpoints")
+def _list_sort_indexes(cursor):
+    add_index(cursor, 'player', 'idx_player_name', 'last_name, first_name, player_id')
+    add_index(cursor, 'staff', 'idx_staff_name', 'last_name, first_name, staff_id')
+    add_index(cursor, 'match_table', 'idx_match_date_time', 'match_date, match_time, match_id')
+    add_index(cursor, 'medical_report', 'idx_medrep_date', 'report_date, med_report_id')
+
+
+@migration(5, "index player_match_stats on (player_id, match_id)")
+def _pms_player_match_index(cursor):
+    # Per-player stat lines (profiles, season totals) and the one-line-per-player-per-match lookup
+    add_index(cursor, 'player_match_stats', 'idx_pms_player_match', 'player_id, match_id')
+
+
+def _ensure_version_table(cursor):
+    cursor.execute("""
+        create table if not exists schema_migrations
+        (
+            version INT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def applied_versions(cursor):
+    _ensure_version_table(cursor)
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def pending(cursor):
+    done = applied_versions(cursor)
+    return [m for m in MIGRATIONS if m.version not in done]
+
+
+def migrate(conn, verbose=True):
+    """Apply every pending migration in version order; returns the versions applied"""
+    cursor = conn.cursor()
+    applied = []
+    try:
+        if not _scalar(cursor, "SELECT GET_LOCK(%s, %s)", (_LOCK_NAME, _LOCK_TIMEOUT)):
+            raise RuntimeError("Timed out waiting for another process to finish migrating")
+        try:
+            # Read under the lock, so a migration another process just applied isn't run again
+            for m in pending(cursor):
+                if verbose:
+                    print(f"Applying migration {m.version}: {m.name}")
+                m.apply(cursor)
+                cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (m.version, m.name))
+                conn.commit()
+                applied.append(m.version)
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (_LOCK_NAME,))
+            cursor.fetchall()
+    except Exception as e:
+        print(f"Error applying migrations: {e}")
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return applied
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from db_connect_module import get_db_connection
+
+    parser = argparse.ArgumentParser(description="Apply or list SOMS schema migrations")
+    parser.add_argument("command", nargs="?", choices=("migrate", "status"), default="migrate")
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        if args.command == "status":
+            cursor = conn.cursor()
+            done = applied_versions(cursor)
+            cursor.close()
+            for m in MIGRATIONS:
+                print(f"{'applied' if m.version in done else 'pending'}  {m.version:>3}  {m.name}")
+        else:
+            versions = migrate(conn)
+            print(f"Applied {len(versions)} migration(s)" if versions else "Schema is up to date")
+    finally:
+        conn.close()
@@ -1,8 +1,13 @@
-from db_connect_module import get_db_connection
-from typing import Optional, Dict
+from db_connect_module import get_db_connection, run_transaction
+from typing import Optional, Dict, List
 from pydantic import BaseModel, EmailStr, Field
 from datetime import date
 from datetime import time as dtime
+from image_pipeline import store_variants
+import counters
+import cache
+import bulk
+import season_stats
 
 
 class StaffCreate(BaseModel): 
@@ -81,6 +86,79 @@ class MatchCreate(BaseModel):
     match_date: Optional[date] = None
     result: Optional[str] = None
 
+class PlayerMatchStatsCreate(BaseModel):
+    player_id: int
+    match_id: int
+    team_id: Optional[int] = None
+    started: bool = False
+    minutes: int = Field(0, ge=0, le=150)
+    goals: int = Field(0, ge=0)
+    assists: int = Field(0, ge=0)
+    shots_total: int = Field(0, ge=0)
+    tackles: int = Field(0, ge=0)
+    dribbles_attempted: int = Field(0, ge=0)
+    fouls_committed: int = Field(0, ge=0)
+    offsides: int = Field(0, ge=0)
+    yellow_cards: int = Field(0, ge=0, le=2)
+    red_cards: int = Field(0, ge=0, le=1)
+    passing_accuracy: Optional[float] = Field(None, ge=0, le=100)
+
+
+STAFF_INSERT_SQL = """
+INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, staff_type, date_hired)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+PLAYER_INSERT_SQL = """
+INSERT INTO player (first_name, middle_name, last_name, salary, positions, 
+                   is_active, is_injured, transfer_value, contract_end_date, scouted_player)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+def _bulk_create(label, items, mode, model, id_name, insert_sql, to_params, to_deltas):
+    """Validate and insert `items` in one transaction; see bulk.py. Returns a BulkResult.
+
+    In atomic mode any failed item rolls the whole batch back; in partial mode the items
+    that succeeded are committed. Counters move by the sum over the created items.
+    """
+    result = bulk.BulkResult(id_name, len(items))
+    valid = bulk.validate_items(model, items, result)
+    if not valid or (mode == bulk.ATOMIC and not result.ok):
+        return result
+
+    conn = None
+    cursor = None
+    try:
+        conn = get_db_connection()
+        conn.start_transaction()
+        cursor = conn.cursor()
+        bulk.insert_rows(cursor, insert_sql, [(index, to_params(obj)) for index, obj in valid], result)
+        if mode == bulk.ATOMIC and not result.ok:
+            conn.rollback()
+            result.rolled_back()
+            return result
+
+        deltas = {}
+        for index, obj in valid:
+            if index in result.ids:
+                for name, delta in to_deltas(obj).items():
+                    deltas[name] = deltas.get(name, 0) + delta
+        counters.bump_many(cursor, deltas)
+        conn.commit()
+    except Exception as e:
+        print(f"Error bulk creating {label}: {e}")
+        if conn:
+            conn.rollback()
+        raise
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+    return result
+
+
 class Staff:
     def __init__(self, first_name, middle_name, last_name, email, salary, age, staff_type, date_hired=None):
         self.first_name = first_name
@@ -104,11 +182,7 @@ class Staff:
             
             hire_date = staff.date_hired if staff.date_hired else date.today()
             
-            query = """
-            INSERT INTO staff (first_name, middle_name, last_name, email, salary, age, staff_type, date_hired)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(query, (
+            cursor.execute(STAFF_INSERT_SQL, (
                 staff.first_name, 
                 staff.middle_name, 
                 staff.last_name,
@@ -118,8 +192,9 @@ class Staff:
                 staff.staff_type,
                 hire_date
             ))
-            conn.commit()
             last_id = cursor.lastrowid
+            counters.bump_many(cursor, counters.staff_deltas(after_type=staff.staff_type))
+            conn.commit()
         except Exception as e:
             print(f"Error creating staff: {e}")
             if conn:
@@ -132,6 +207,16 @@ class Staff:
                 conn.close()
         return last_id
 
+    @staticmethod
+    def bulk_create(items: List[dict], mode: str = bulk.ATOMIC) -> bulk.BulkResult:
+        hire_date = date.today()
+        return _bulk_create(
+            "staff", items, mode, StaffCreate, "staff_id", STAFF_INSERT_SQL,
+            lambda s: (s.first_name, s.middle_name, s.last_name, s.email, s.salary, s.age,
+                       s.staff_type, s.date_hired or hire_date),
+            lambda s: counters.staff_deltas(after_type=s.staff_type),
+        )
+
 
 class Coach:
     def __init__(self, staff_id, role, team_id=None):
@@ -190,12 +275,7 @@ class Player:
             conn = get_db_connection()
             conn.start_transaction()
             cursor = conn.cursor()
-            query = """
-            INSERT INTO player (first_name, middle_name, last_name, salary, positions, 
-                               is_active, is_injured, transfer_value, contract_end_date, scouted_player)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(query, (
+            cursor.execute(PLAYER_INSERT_SQL, (
                 player.first_name, 
                 player.middle_name, 
                 player.last_name,
@@ -208,6 +288,7 @@ class Player:
                 player.scouted_player
             ))
             last_id = cursor.lastrowid
+            counters.bump_many(cursor, counters.player_deltas(after=vars(player)))
             conn.commit()
         except Exception as e:
             print(f"Error creating player: {e}")
@@ -222,18 +303,20 @@ class Player:
         return last_id
 
     @staticmethod
-    def create_with_photo(player, photo_bytes: bytes, photo_content_type: str, photo_filename: str, photo_size: int):
+    def create_with_photo(player, photo_sha256: str, photo_content_type: str, photo_filename: str, photo_size: int, variants=None):
         conn = None
         cursor = None
         last_id = None
         try:
+            # The caller has already put the bytes in the blob store; the row only keeps the hash.
+            # A rollback below can leave an unreferenced blob behind, which is harmless.
             conn = get_db_connection()
             conn.start_transaction()
             cursor = conn.cursor()
             query = """
             INSERT INTO player (first_name, middle_name, last_name, salary, positions, 
                                is_active, is_injured, transfer_value, contract_end_date, scouted_player,
-                               photo, photo_content_type, photo_filename, photo_size)
+                               photo_content_type, photo_filename, photo_size, photo_sha256)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             cursor.execute(query, (
@@ -247,12 +330,16 @@ class Player:
                 player.transfer_value,
                 player.contract_end_date,
                 player.scouted_player,
-                photo_bytes,
                 photo_content_type,
                 photo_filename,
                 photo_size,
+                photo_sha256,
             ))
             last_id = cursor.lastrowid
+            if variants:
+                # Derivatives land in the same transaction, so a player never has a half-written set
+                store_variants(cursor, last_id, variants)
+            counters.bump_many(cursor, counters.player_deltas(after=vars(player)))
             conn.commit()
         except Exception as e:
             print(f"Error creating player with photo: {e}")
@@ -266,6 +353,15 @@ class Player:
                 conn.close()
         return last_id  #should the  last row_ids be moved into the try block?
 
+    @staticmethod
+    def bulk_create(items: List[dict], mode: str = bulk.ATOMIC) -> bulk.BulkResult:
+        return _bulk_create(
+            "players", items, mode, PlayerCreate, "player_id", PLAYER_INSERT_SQL,
+            lambda p: (p.first_name, p.middle_name, p.last_name, p.salary, p.positions, p.is_active,
+                       p.is_injured, p.transfer_value, p.contract_end_date, p.scouted_player),
+            lambda p: counters.player_deltas(after=vars(p)),
+        )
+
 
 class Scout:
     def __init__(self, staff_id, region, YOE):
@@ -286,6 +382,7 @@ class Scout:
             VALUES (%s, %s, %s)
             """
             cursor.execute(query, (scout.staff_id, scout.region, scout.YOE))
+            counters.bump(cursor, counters.SCOUTS_TOTAL)
             conn.commit()
             return scout.staff_id
         except Exception as e:
@@ -368,7 +465,9 @@ class MedicalReport:
                 medical_report.severity_of_injury
             ))
             last_id = cursor.lastrowid
+            counters.bump(cursor, counters.MEDICAL_REPORTS_TOTAL)
             conn.commit()
+            cache.invalidate_player(medical_report.player_id)
         except Exception as e:
             print(f"Error creating medical report: {e}")
             if conn:
@@ -382,6 +481,43 @@ class MedicalReport:
         return last_id
 
 
+PMS_COLUMNS = ('player_id', 'match_id', 'team_id', 'started', 'minutes', 'goals', 'assists', 'shots_total',
+               'tackles', 'dribbles_attempted', 'fouls_committed', 'offsides', 'yellow_cards', 'red_cards',
+               'passing_accuracy')
+
+
+class PlayerMatchStats:
+    @staticmethod
+    def create(stats: PlayerMatchStatsCreate) -> int:
+        conn = None
+        cursor = None
+        last_id = None
+        try:
+            conn = get_db_connection()
+            conn.start_transaction()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"""
+            INSERT INTO player_match_stats ({", ".join(PMS_COLUMNS)})
+            VALUES ({", ".join(["%s"] * len(PMS_COLUMNS))})
+            """, tuple(getattr(stats, c) for c in PMS_COLUMNS))
+            last_id = cursor.lastrowid
+            season_stats.apply_change(cursor, after=season_stats.fetch_stat_line(cursor, last_id))
+            conn.commit()
+            cache.invalidate_player(stats.player_id)
+            cache.invalidate_stats()
+        except Exception as e:
+            print(f"Error creating player match stats: {e}")
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+        return last_id
+
+
 class Formation:
     @staticmethod
     def create(f: FormationCreate) -> int:
@@ -415,50 +551,66 @@ class Formation:
         return formation_id
 
 
+def _diff_slots(stored: Dict[int, int], submitted: Dict[int, int]):
+    """Slot changes turning `stored` into `submitted` (both slot_no -> player_id).
+
+    Returns (slots to delete, [(slot_no, player_id)] to insert). A slot whose player changed
+    is deleted and re-inserted rather than updated: UPDATEs are checked against
+    uq_lineup_player row by row, so swapping two players between slots would collide.
+    """
+    changed = sorted(slot for slot, player in stored.items() if submitted.get(slot) != player)
+    inserts = sorted((slot, player) for slot, player in submitted.items() if stored.get(slot) != player)
+    return changed, inserts
+
+
 class Lineup:
     @staticmethod
     def create_with_slots(lc: LineupCreate) -> int:
-        conn = None
-        cursor = None
-        lineup_id = None
-        try:
-            conn = get_db_connection()
-            conn.start_transaction()
-            cursor = conn.cursor()
+        """Save a lineup, writing only the slots that differ from what is stored.
 
-            # Check if lineup exists for this match/team/formation
+        The lineup header and its slots are read with FOR UPDATE, so concurrent saves of the
+        same lineup queue up behind each other; a deadlock between them reruns the transaction.
+        """
+        def work(cursor):
             cursor.execute("""
                 SELECT lineup_id FROM match_lineup 
                 WHERE match_id = %s AND team_id = %s AND formation_id = %s 
                 AND is_starting = %s AND minute_applied = %s
+                FOR UPDATE
             """, (lc.match_id, lc.team_id, lc.formation_id, lc.is_starting, lc.minute_applied))
-            
             existing = cursor.fetchone()
-            
+
             if existing:
                 lineup_id = existing[0]
-                # Delete existing slots to replace them
-                cursor.execute("DELETE FROM match_lineup_slot WHERE lineup_id = %s", (lineup_id,))
+                cursor.execute(
+                    "SELECT slot_no, player_id FROM match_lineup_slot WHERE lineup_id = %s FOR UPDATE",
+                    (lineup_id,)
+                )
+                stored = dict(cursor.fetchall())
             else:
                 cursor.execute("""
                     INSERT INTO match_lineup (match_id, team_id, formation_id, is_starting, minute_applied)
                     VALUES (%s,%s,%s,%s,%s)
                 """, (lc.match_id, lc.team_id, lc.formation_id, lc.is_starting, lc.minute_applied))
                 lineup_id = cursor.lastrowid
-
-            for slot_no, player_id in lc.players.items():
-                cursor.execute("""
+                stored = {}
+
+            deletes, inserts = _diff_slots(stored, lc.players)
+            if deletes:
+                placeholders = ", ".join(["%s"] * len(deletes))
+                cursor.execute(
+                    f"DELETE FROM match_lineup_slot WHERE lineup_id = %s AND slot_no IN ({placeholders})",
+                    (lineup_id, *deletes)
+                )
+            if inserts:
+                cursor.executemany("""
                     INSERT INTO match_lineup_slot (lineup_id, slot_no, player_id)
                     VALUES (%s, %s, %s)
-                """, (lineup_id, slot_no, player_id))
-            conn.commit()
+                """, [(lineup_id, slot_no, player_id) for slot_no, player_id in inserts])
             return lineup_id
+
+        try:
+            return run_transaction(work)
         except Exception as e:
-            if conn:
-                conn.rollback()
+            print(f"Error saving lineup: {e}")
             raise
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
\ No newline at end of file
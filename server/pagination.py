@@ -0,0 +1,133 @@
+"""Keyset (cursor) pagination shared by the list endpoints.
+
+A page is requested with `limit` and the opaque `cursor` returned as `next_cursor` by the
+previous page. The cursor holds the sort-key values of the last row sent, and the next page
+starts strictly after them, so deep pages cost the same as the first one (no OFFSET scans).
+"""
+import base64
+import json
+from dataclasses import dataclass
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: str              # SQL expression, e.g. "st.last_name"
+    name: str = None         # key of the value in the result row; defaults to the bare column name
+    descending: bool = False
+    nullable: bool = False
+
+    @property
+    def row_key(self):
+        return self.name or self.column.rsplit('.', 1)[-1]
+
+
+def encode_cursor(values) -> str:
+    # Dates/times/decimals go out as strings, which MySQL compares correctly against their columns
+    raw = json.dumps(list(values), default=str, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str, keys) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor("Invalid cursor")
+    return values
+
+
+def order_by(keys) -> str:
+    return ", ".join(f"{k.column} {'DESC' if k.descending else 'ASC'}" for k in keys)
+
+
+def _after(key, value):
+    # "Comes after `value`" for one key, following MySQL's NULL ordering (first ASC, last DESC)
+    if value is None:
+        return (None, ()) if key.descending else (f"{key.column} IS NOT NULL", ())
+    if key.descending:
+        if key.nullable:
+            return f"({key.column} < %s OR {key.column} IS NULL)", (value,)
+        return f"{key.column} < %s", (value,)
+    return f"{key.column} > %s", (value,)
+
+
+def _equal(key, value):
+    if value is None:
+        return f"{key.column} IS NULL", ()
+    return f"{key.column} = %s", (value,)
+
+
+def keyset_predicate(keys, values):
+    """WHERE fragment (and params) selecting rows strictly after `values` in `keys` order"""
+    directions = {k.descending for k in keys}
+    if len(directions) == 1 and not any(k.nullable for k in keys):
+        # Uniform direction, no NULLs: a row constructor, which MySQL turns into a single index range
+        op = '<' if keys[0].descending else '>'
+        columns = ", ".join(k.column for k in keys)
+        placeholders = ", ".join(["%s"] * len(keys))
+        return f"({columns}) {op} ({placeholders})", tuple(values)
+
+    branches, params = [], []
+    for i, key in enumerate(keys):
+        after_sql, after_params = _after(key, values[i])
+        if after_sql is None:
+            continue
+        parts, part_params = [], []
+        for prev_key, prev_value in zip(keys[:i], values[:i]):
+            sql, p = _equal(prev_key, prev_value)
+            parts.append(sql)
+            part_params.extend(p)
+        parts.append(after_sql)
+        part_params.extend(after_params)
+        branches.append("(" + " AND ".join(parts) + ")")
+        params.extend(part_params)
+    if not branches:
+        return "FALSE", ()
+    return "(" + " OR ".join(branches) + ")", tuple(params)
+
+
+def build_page_query(select_sql: str, keys, where=(), params=(), cursor=None, limit=DEFAULT_LIMIT):
+    """Append WHERE / ORDER BY / LIMIT to `select_sql` (a SELECT ... FROM ... without them).
+
+    Fetches one row more than `limit` so split_page() can tell whether another page exists;
+    limit=None reads every row after the cursor (for streamed exports).
+    Raises InvalidCursor for a cursor that wasn't produced for these keys.
+    """
+    where, params = list(where), list(params)
+    if cursor:
+        sql, p = keyset_predicate(keys, decode_cursor(cursor, keys))
+        where.append(sql)
+        params.extend(p)
+    query = select_sql.rstrip()
+    if where:
+        query += "\nWHERE " + " AND ".join(where)
+    query += f"\nORDER BY {order_by(keys)}"
+    if limit is not None:
+        query += "\nLIMIT %s"
+        params.append(limit + 1)
+    return query, tuple(params)
+
+
+def split_page(rows, keys, limit):
+    """Return (rows, next_cursor); call before the rows are reshaped, while sort keys are intact"""
+    rows = list(rows or [])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last[k.row_key] for k in keys)
+
+
+def fetch_page(db_cursor, select_sql: str, keys, where=(), params=(), cursor=None, limit=DEFAULT_LIMIT):
+    query, query_params = build_page_query(select_sql, keys, where, params, cursor, limit)
+    db_cursor.execute(query, query_params)
+    return split_page(db_cursor.fetchall(), keys, limit)
@@ -0,0 +1,80 @@
+"""Helpers for serving player photos as binary with HTTP caching (ETag, Last-Modified, Range)"""
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from starlette.responses import FileResponse, Response
+
+# Long enough to be unique per photo, short enough to keep list payloads small
+PHOTO_VERSION_LENGTH = 16
+
+
+def photo_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def photo_url(player_id, digest=None):
+    url = f"/player/{player_id}/photo"
+    if digest:
+        url += f"?v={digest[:PHOTO_VERSION_LENGTH]}"
+    return url
+
+
+def add_photo_links(row: dict) -> dict:
+    # Replace the photo hash of a player row with a URL + version the client can cache on
+    digest = row.pop('photo_sha256', None)
+    row['photo_version'] = digest[:PHOTO_VERSION_LENGTH] if digest else None
+    row['photo_url'] = photo_url(row['player_id'], digest) if digest else None
+    return row
+
+
+def make_etag(digest: str) -> str:
+    return f'"{digest}"'
+
+
+def http_date(value) -> str:
+    # DATETIME columns come back naive; the server stores them in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(headers, etag: str, last_modified=None) -> bool:
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as required for If-None-Match
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def cache_headers(etag: str, last_modified=None, immutable: bool = False) -> dict:
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        # Versioned URLs (?v=<digest>) never change content, so they can be cached forever
+        "Cache-Control": "private, max-age=31536000, immutable" if immutable else "private, no-cache",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def blob_response(store, digest: str, media_type: str, headers: dict):
+    """Serve a blob from the photo store. Local blobs go out as a FileResponse, which uses
+    pathsend/sendfile where the server supports it and answers Range / If-Range itself.
+    Raises blob_store.BlobNotFound if the blob is missing."""
+    path = store.local_path(digest)
+    if path is not None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+    headers = {k: v for k, v in headers.items() if k != "Accept-Ranges"}
+    return Response(content=store.get(digest), media_type=media_type, headers=headers)
@@ -0,0 +1,314 @@
+"""SQL and row shaping shared by the sync handlers in main.py and the async ones in async_routes.py"""
+from datetime import timedelta
+
+import orjson
+
+import season_stats
+from fieldsets import FieldSet, plain_columns
+from json_response import FastJSONResponse
+from pagination import SortKey
+from photos import add_photo_links
+
+
+# List queries are bare SELECT ... FROM; pagination.build_page_query adds WHERE / ORDER BY / LIMIT
+# from the sort keys below. Each key list ends in the primary key so the order is total.
+# Resources that support ?fields= declare a FieldSet instead of a fixed SELECT.
+
+PLAYER_FIELDS = FieldSet(
+    "FROM player",
+    plain_columns('player_id', 'first_name', 'middle_name', 'last_name', 'salary', 'positions', 'is_active',
+                  'is_injured', 'transfer_value', 'contract_end_date', 'scouted_player', 'photo_sha256',
+                  'photo_content_type', 'photo_filename', 'photo_size', 'photo_uploaded_at'),
+    # Built by add_photo_links
+    virtual={'photo_version': ('photo_sha256',), 'photo_url': ('player_id', 'photo_sha256')},
+    hidden=('photo_sha256',),
+)
+PLAYERS_SORT = (SortKey('last_name'), SortKey('first_name'), SortKey('player_id'))
+
+MATCH_FIELDS = FieldSet(
+    "FROM match_table",
+    plain_columns('match_id', 'name', 'venue', 'match_time', 'opponent_team', 'match_date', 'result'),
+)
+FIXTURES_SORT = (SortKey('match_date', nullable=True), SortKey('match_time', nullable=True), SortKey('match_id'))
+# Same rows as fixtures, newest first
+MATCHES_SORT = tuple(SortKey(k.column, descending=True, nullable=k.nullable) for k in FIXTURES_SORT)
+
+STAFF_FIELDS = FieldSet(
+    "FROM staff",
+    plain_columns('staff_id', 'first_name', 'middle_name', 'last_name', 'email', 'salary', 'age', 'date_hired', 'staff_type'),
+)
+STAFF_SORT = (SortKey('last_name'), SortKey('first_name'), SortKey('staff_id'))
+
+SCOUTS_SQL = """
+    SELECT s.staff_id, st.first_name, st.middle_name, st.last_name, st.email, s.region, s.YOE
+    FROM scout s
+    JOIN staff st ON s.staff_id = st.staff_id
+"""
+COACHES_SQL = """
+    SELECT c.staff_id, st.first_name, st.middle_name, st.last_name, st.email, c.role, c.team_id
+    FROM coach c
+    JOIN staff st ON c.staff_id = st.staff_id
+"""
+STAFF_JOIN_SORT = (SortKey('st.last_name'), SortKey('st.first_name'), SortKey('st.staff_id'))
+
+LINEUP_FIELDS = FieldSet(
+    """
+    FROM match_lineup ml
+    JOIN formation f ON f.formation_id = ml.formation_id
+    LEFT JOIN match_table m ON m.match_id = ml.match_id
+    LEFT JOIN team t ON t.team_id = ml.team_id
+    """,
+    {
+        'lineup_id': 'ml.lineup_id',
+        'match_id': 'ml.match_id',
+        'team_id': 'ml.team_id',
+        'formation_id': 'ml.formation_id',
+        'is_starting': 'ml.is_starting',
+        'minute_applied': 'ml.minute_applied',
+        'formation_code': 'f.code AS formation_code',
+        'formation_name': 'f.name AS formation_name',
+        'match_name': 'm.name AS match_name',
+        'match_date': 'm.match_date',
+        'team_name': 't.name AS team_name',
+    },
+)
+LINEUPS_SORT = (SortKey('ml.lineup_id', descending=True),)
+
+# One row per report, its conditions nested by MySQL into a JSON array (decoded by
+# shape_medical_reports), instead of one wide row per condition regrouped in Python
+MEDICAL_REPORTS_SQL = """
+    SELECT
+        mr.med_report_id,
+        mr.player_id,
+        p.first_name AS player_first_name,
+        p.middle_name AS player_middle_name,
+        p.last_name AS player_last_name,
+        mr.summary,
+        mr.report_date,
+        mr.treatment,
+        mr.severity_of_injury,
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'condition_id', mc.condition_id,
+                'condition_name', mc.condition_name,
+                'description', mc.description,
+                'diagnosis_date', mc.diagnosis_date))
+            FROM medical_condition mc
+            WHERE mc.med_report_id = mr.med_report_id
+        ) AS conditions
+    FROM medical_report mr
+    JOIN player p ON mr.player_id = p.player_id
+"""
+MEDICAL_REPORTS_SORT = (SortKey('mr.report_date', descending=True), SortKey('mr.med_report_id', descending=True))
+
+PMS_FIELDS = FieldSet(
+    "FROM player_match_stats",
+    plain_columns('pms_id', 'player_id', 'match_id', 'team_id', 'started', 'minutes', 'goals', 'assists',
+                  'shots_total', 'tackles', 'dribbles_attempted', 'fouls_committed', 'offsides',
+                  'yellow_cards', 'red_cards', 'passing_accuracy'),
+)
+PMS_SORT = (SortKey('pms_id'),)
+
+# Season rows of the player_season_stats aggregate, summarized per season and for the career in
+# shape_player_profile (see season_stats.py)
+_SEASON_COLUMNS = ",\n                ".join(f"'{c}', s.{c}" for c in season_stats.AGGREGATE_COLUMNS)
+
+# The whole /player_details payload in one round trip: the player row, with reports, match stats
+# and season totals aggregated server-side into JSON columns (decoded by shape_player_profile).
+# JSON_ARRAYAGG doesn't guarantee element order, so the lists are sorted after decoding.
+PLAYER_PROFILE_SQL = f"""
+    SELECT
+        p.player_id,
+        p.first_name,
+        p.middle_name,
+        p.last_name,
+        p.salary,
+        p.positions,
+        p.is_active,
+        p.is_injured,
+        p.transfer_value,
+        p.contract_end_date,
+        p.scouted_player,
+        p.photo_sha256,
+        p.photo_content_type,
+        p.photo_filename,
+        p.photo_size,
+        p.photo_uploaded_at,
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'med_report_id', mr.med_report_id,
+                'summary', mr.summary,
+                'report_date', mr.report_date,
+                'treatment', mr.treatment,
+                'severity_of_injury', mr.severity_of_injury))
+            FROM medical_report mr
+            WHERE mr.player_id = p.player_id
+        ) AS medical_reports,
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'pms_id', pms.pms_id,
+                'player_id', pms.player_id,
+                'match_id', pms.match_id,
+                'match_name', m.name,
+                'match_date', m.match_date,
+                'match_time', CAST(m.match_time AS CHAR),
+                'team_id', pms.team_id,
+                'team_name', t.name,
+                'started', pms.started,
+                'tackles', pms.tackles,
+                'minutes', pms.minutes,
+                'shots_total', pms.shots_total,
+                'offsides', pms.offsides,
+                'red_cards', pms.red_cards,
+                'yellow_cards', pms.yellow_cards,
+                'fouls_committed', pms.fouls_committed,
+                'dribbles_attempted', pms.dribbles_attempted,
+                'assists', pms.assists,
+                'goals', pms.goals,
+                'passing_accuracy', pms.passing_accuracy))
+            FROM player_match_stats pms
+            LEFT JOIN match_table m ON pms.match_id = m.match_id
+            LEFT JOIN team t ON pms.team_id = t.team_id
+            WHERE pms.player_id = p.player_id
+        ) AS match_stats,
+        (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'season_start_year', s.season_start_year,
+                {_SEASON_COLUMNS}))
+            FROM player_season_stats s
+            WHERE s.player_id = p.player_id
+        ) AS season_totals
+    FROM player p
+    WHERE p.player_id = %s
+"""
+
+
+def _equals(where, params, column, value):
+    if value is not None:
+        where.append(f"{column} = %s")
+        params.append(value)
+
+
+def _date_range(where, params, column, date_from, date_to):
+    if date_from is not None:
+        where.append(f"{column} >= %s")
+        params.append(date_from)
+    if date_to is not None:
+        where.append(f"{column} <= %s")
+        params.append(date_to)
+
+
+def staff_filters(staff_type=None):
+    where, params = [], []
+    _equals(where, params, "staff_type", staff_type)
+    return where, params
+
+
+def scout_filters(region=None):
+    where, params = [], []
+    _equals(where, params, "s.region", region)
+    return where, params
+
+
+def coach_filters(team_id=None):
+    where, params = [], []
+    _equals(where, params, "c.team_id", team_id)
+    return where, params
+
+
+def player_filters(is_active=None, is_injured=None, position=None, scouted_player=None):
+    where, params = [], []
+    _equals(where, params, "is_active", is_active)
+    _equals(where, params, "is_injured", is_injured)
+    _equals(where, params, "scouted_player", scouted_player)
+    if position:
+        # positions is a comma-separated list such as "LB,RB"
+        where.append("FIND_IN_SET(%s, positions)")
+        params.append(position.strip().upper())
+    return where, params
+
+
+def match_filters(date_from=None, date_to=None):
+    where, params = [], []
+    _date_range(where, params, "match_date", date_from, date_to)
+    return where, params
+
+
+def lineup_filters(match_id=None, team_id=None, date_from=None, date_to=None):
+    where, params = [], []
+    _equals(where, params, "ml.match_id", match_id)
+    _equals(where, params, "ml.team_id", team_id)
+    _date_range(where, params, "m.match_date", date_from, date_to)
+    return where, params
+
+
+def medical_report_filters(player_id=None, severity=None, date_from=None, date_to=None):
+    where, params = [], []
+    _equals(where, params, "mr.player_id", player_id)
+    _equals(where, params, "mr.severity_of_injury", severity)
+    _date_range(where, params, "mr.report_date", date_from, date_to)
+    return where, params
+
+
+def pms_filters(player_id=None, match_id=None, team_id=None):
+    where, params = [], []
+    _equals(where, params, "player_id", player_id)
+    _equals(where, params, "match_id", match_id)
+    _equals(where, params, "team_id", team_id)
+    return where, params
+
+
+def page_response(rows, next_cursor):
+    # Rows go out as the cursor returned them; FastJSONResponse encodes dates, times and decimals
+    return FastJSONResponse({"status": "success", "count": len(rows), "data": rows, "next_cursor": next_cursor})
+
+
+def shape_players(rows):
+    # Photos are served by GET /player/{id}/photo; rows only carry its URL and version
+    return [add_photo_links(r) for r in rows or []]
+
+
+def _json_column(value, default):
+    return orjson.loads(value) if value is not None else default
+
+
+def _time_column(value):
+    # A TIME inside a JSON column arrives as text ("15:30:00"); as a timedelta, like a TIME column
+    # read directly, it's encoded the same way as on every other endpoint ("PT15H30M")
+    if value is None:
+        return None
+    sign = -1 if value.startswith('-') else 1
+    hours, minutes, seconds = value.lstrip('-').split(':')
+    return sign * timedelta(hours=int(hours), minutes=int(minutes), seconds=float(seconds))
+
+
+def shape_medical_reports(rows):
+    for row in rows:
+        conditions = _json_column(row['conditions'], [])
+        conditions.sort(key=lambda c: (c['diagnosis_date'] or '', c['condition_id']), reverse=True)
+        row['conditions'] = conditions
+    return rows
+
+
+def shape_player_profile(row):
+    """Decode the JSON columns of a PLAYER_PROFILE_SQL row into the /player_details payload"""
+    player = add_photo_links(row)
+    reports = _json_column(player.pop('medical_reports'), [])
+    reports.sort(key=lambda r: (r['report_date'] or '', r['med_report_id']), reverse=True)
+    match_stats = _json_column(player.pop('match_stats'), [])
+    # Newest match first, matches without a date last
+    match_stats.sort(key=lambda r: (r['match_date'] or '', r['match_time'] or '', r['pms_id']), reverse=True)
+    for line in match_stats:
+        line['match_time'] = _time_column(line['match_time'])
+    # Newest season first, matches without a date (season 0) last
+    seasons = _json_column(player.pop('season_totals'), [])
+    seasons.sort(key=lambda s: s['season_start_year'], reverse=True)
+
+    player['medical_reports'] = reports
+    player['match_stats'] = match_stats
+    player['season_totals'] = [
+        {'season': season_stats.season_label(s['season_start_year']), 'totals': season_stats.summarize(s)}
+        for s in seasons
+    ]
+    player['career_totals'] = season_stats.summarize(season_stats.career(seasons))
+    return player
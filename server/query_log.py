@@ -0,0 +1,245 @@
+"""Per-statement SQL statistics: fingerprints, latency histograms and the slow-query log.
+
+Every statement the instrumented cursors (db_instrumentation.py) run is reduced to a
+fingerprint, the SQL text with its literals and placeholders replaced by `?`, IN lists and
+multi-row VALUES collapsed, and whitespace normalised:
+
+    SELECT * FROM Player WHERE player_id IN (%s, %s, %s) AND is_active = 1
+    -> SELECT * FROM Player WHERE player_id IN (?+) AND is_active = ?
+
+Each fingerprint keeps a count, error count, total/max time and a latency histogram. A statement's
+time is its execute() plus the fetches that read its rows, so an unbuffered cursor's slow result
+set is counted against the query that produced it. The totals are served at `GET /health/queries`.
+
+A statement slower than SLOW_QUERY_MS is logged with its fingerprint and the shape of its
+parameters (type and length, never the values). With SLOW_QUERY_EXPLAIN=true, the first slow
+occurrence of each fingerprint is also EXPLAINed on a background thread with its own
+connection, so the request that hit it doesn't wait for the plan.
+"""
+import functools
+import logging
+import os
+import queue
+import re
+import threading
+
+import mysql.connector
+
+logger = logging.getLogger("SOMS_App")
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "false").strip().lower() in ("1", "true", "yes", "on")
+# Statements built with literal values inlined would otherwise grow the table without bound
+MAX_FINGERPRINTS = int(os.getenv("QUERY_LOG_MAX_FINGERPRINTS", "500"))
+OVERFLOW_FINGERPRINT = "<other>"
+
+# Upper bounds in seconds; a final implicit +Inf bucket catches the rest
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_COMMENT = re.compile(r"/\*.*?\*/|--[^\n]*|#[^\n]*", re.S)
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?")
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.I)
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_ROWS = re.compile(r"(\((?:\?|\?\+)\))(?:\s*,\s*\((?:\?|\?\+)\))+")
+_SPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("select", "with", "update", "delete")
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(sql) -> str:
+    """Normalise a statement so that runs differing only in values share one fingerprint"""
+    if isinstance(sql, (bytes, bytearray)):
+        sql = sql.decode("utf-8", "replace")
+    text = _STRING.sub("?", sql)
+    text = _COMMENT.sub(" ", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(?+)", text)
+    text = _REPEATED_ROWS.sub(r"\1", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def _shape(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes, bytearray)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact(params, many=False):
+    """Parameter types (and lengths for strings/bytes) in place of their values"""
+    if params is None:
+        return None
+    if many:
+        rows = params if isinstance(params, (list, tuple)) else None
+        if not rows:
+            return "<rows>"
+        return {"rows": len(rows), "first": redact(rows[0])}
+    if isinstance(params, dict):
+        return {key: _shape(value) for key, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [_shape(value) for value in params]
+    return _shape(params)
+
+
+class FingerprintStats:
+    __slots__ = ("count", "errors", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add(self, seconds, failed):
+        self.count += 1
+        self.errors += failed
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def as_dict(self, fingerprint_):
+        cumulative, histogram = 0, {}
+        for bound, n in zip(LATENCY_BUCKETS + ("+Inf",), self.buckets):
+            cumulative += n
+            histogram[str(bound)] = cumulative
+        return {
+            "fingerprint": fingerprint_,
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 1),
+            "mean_ms": round(self.total * 1000 / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 1),
+            "histogram": histogram,
+        }
+
+
+_stats = {}
+_lock = threading.Lock()
+
+
+def observe(operation, params, seconds, many=False, failed=False) -> None:
+    """Account one finished statement and log it if it was slow"""
+    key = fingerprint(operation)
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            if len(_stats) >= MAX_FINGERPRINTS:
+                key = OVERFLOW_FINGERPRINT
+                entry = _stats.get(key)
+            if entry is None:
+                entry = _stats[key] = FingerprintStats()
+        entry.add(seconds, failed)
+
+    if seconds * 1000 >= SLOW_QUERY_MS:
+        logger.warning(f"Slow query {seconds * 1000:.1f} ms: {key} params={redact(params, many)}",
+                       extra={"query": {"fingerprint": key, "ms": round(seconds * 1000, 1), "failed": failed}})
+        if SLOW_QUERY_EXPLAIN and not many and not failed:
+            _explainer.submit(key, operation, params)
+
+
+def snapshot(limit=None, sort="total"):
+    """Per-fingerprint stats, heaviest first by `sort` (total, count, max or mean)"""
+    with _lock:
+        rows = [entry.as_dict(key) for key, entry in _stats.items()]
+    order = {"total": "total_ms", "count": "count", "max": "max_ms", "mean": "mean_ms"}[sort]
+    rows.sort(key=lambda row: row[order], reverse=True)
+    return rows[:limit] if limit else rows
+
+
+def reset() -> None:
+    with _lock:
+        _stats.clear()
+    _explainer.forget()
+
+
+class Statement:
+    """The statement a cursor is currently reading; its fetch time is added until it's finished"""
+
+    __slots__ = ("operation", "params", "many", "seconds")
+
+    def __init__(self, operation, params, seconds, many=False):
+        self.operation = operation
+        self.params = params
+        self.many = many
+        self.seconds = seconds
+
+    def finish(self, failed=False) -> None:
+        observe(self.operation, self.params, self.seconds, self.many, failed)
+
+
+def statement_params(args, kwargs):
+    # Both cursor flavours take params second, under different keyword names
+    if args:
+        return args[0]
+    return kwargs.get("params", kwargs.get("seq_params"))
+
+
+class _Explainer:
+    """Runs EXPLAIN for the first slow occurrence of each fingerprint, off the request path"""
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=32)
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, key, operation, params):
+        if not operation.lstrip().lower().startswith(_EXPLAINABLE):
+            return
+        with self._lock:
+            if key in self._seen:
+                return
+            self._seen.add(key)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="slow-query-explain", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait((key, operation, params))
+        except queue.Full:
+            with self._lock:
+                self._seen.discard(key)
+
+    def forget(self):
+        with self._lock:
+            self._seen.clear()
+
+    def _run(self):
+        while True:
+            key, operation, params = self._queue.get()
+            try:
+                self._explain(key, operation, params)
+            except Exception as e:
+                logger.error(f"EXPLAIN failed for {key}: {e}")
+
+    def _explain(self, key, operation, params):
+        import db_connect_module  # imported here: db_connect_module imports this module
+
+        # A plain connection, so the EXPLAIN itself is neither pooled nor accounted
+        connection = mysql.connector.connect(**db_connect_module.connection_settings())
+        try:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                cursor.execute(f"EXPLAIN {operation}", params)
+                plan = cursor.fetchall()
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+        steps = "; ".join(
+            f"table={row.get('table')} type={row.get('type')} key={row.get('key')} "
+            f"rows={row.get('rows')} extra={row.get('Extra')}"
+            for row in plan
+        )
+        logger.warning(f"EXPLAIN {key}: {steps}", extra={"query": {"fingerprint": key, "plan": plan}})
+
+
+_explainer = _Explainer()
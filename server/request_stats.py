@@ -0,0 +1,88 @@
+"""Per-request accounting: handler time, time waiting for a DB connection, SQL statements, DB time
+and rows fetched.
+
+The log_requests middleware in main.py starts a RequestStats for each request in a context
+variable. The connection pools add their checkout wait and the instrumented cursors (see
+db_instrumentation.py) add each statement, from whichever thread or task serves the request:
+Starlette copies the context into the threadpool for sync handlers, and both see the same
+object. The totals go out as a Server-Timing header and in the access log line:
+
+    Server-Timing: app;dur=41.3, db;dur=12.8;desc="3 queries, 120 rows", db-wait;dur=0.2
+    GET /players 200 total_ms=41.3 db_wait_ms=0.2 db_ms=12.8 queries=3 rows=120
+
+Work done outside a request (scripts, the pool reaper) has no RequestStats and isn't counted.
+For a streamed response, queries made while the body streams come after the header is sent
+and aren't included.
+"""
+import contextvars
+import os
+import time
+
+# Requests that run more statements than this are logged as a warning (a likely N+1)
+QUERY_WARN_THRESHOLD = int(os.getenv("REQUEST_QUERY_WARN_THRESHOLD", "25"))
+
+
+class RequestStats:
+    __slots__ = ("started", "db_wait", "db_time", "queries", "rows")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_wait = 0.0
+        self.db_time = 0.0
+        self.queries = 0
+        self.rows = 0
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def fields(self, total) -> dict:
+        return {
+            "total_ms": round(total * 1000, 1),
+            "db_wait_ms": round(self.db_wait * 1000, 1),
+            "db_ms": round(self.db_time * 1000, 1),
+            "queries": self.queries,
+            "rows": self.rows,
+        }
+
+    def server_timing(self, total) -> str:
+        return (f'app;dur={total * 1000:.1f}, '
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries, {self.rows} rows", '
+                f'db-wait;dur={self.db_wait * 1000:.1f}')
+
+
+_current = contextvars.ContextVar("soms_request_stats", default=None)
+
+
+def begin():
+    """Start accounting for a request; returns (stats, token for end())"""
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end(token) -> None:
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+def record_wait(seconds) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.db_wait += seconds
+
+
+def record_query(seconds, rows=0, statements=1) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.db_time += seconds
+        stats.queries += statements
+        stats.rows += rows
+
+
+def record_fetch(seconds, rows) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.db_time += seconds
+        stats.rows += rows
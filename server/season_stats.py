@@ -0,0 +1,242 @@
+"""Per-player, per-season totals of player_match_stats, kept in player_season_stats.
+
+Every write to player_match_stats calls apply_change() (or remove_match() before a match is
+deleted) on its own cursor, inside its own transaction, so the totals commit or roll back
+together with the stat lines. Readers then get a player's season and career totals from a
+primary-key range instead of summing every match row.
+
+Seasons run August to July and are keyed by their starting year (2024 is 2024/25); stat lines
+of matches without a date are kept under season 0. Average passing accuracy is stored as a sum
+and a count of non-null values, so it can be adjusted row by row and still match AVG().
+
+rebuild() recomputes the table from player_match_stats (after seeding, or to repair drift after
+manual SQL edits) and check() reports where the two disagree:
+
+    python season_stats.py check
+    python season_stats.py rebuild
+"""
+UNDATED_SEASON = 0
+
+# Seasons run August to July and are labelled by their years, e.g. 2024/25
+SEASON_START_YEAR_SQL = "(YEAR(m.match_date) - (MONTH(m.match_date) < 8))"
+
+# player_match_stats columns summed as they are
+SUMMED_COLUMNS = ('minutes', 'goals', 'assists', 'shots_total', 'tackles', 'dribbles_attempted',
+                  'fouls_committed', 'offsides', 'yellow_cards', 'red_cards')
+AGGREGATE_COLUMNS = ('appearances', 'starts') + SUMMED_COLUMNS + ('passing_accuracy_sum', 'passing_accuracy_count')
+# Rates reported per 90 minutes played
+PER_90_COLUMNS = tuple(c for c in SUMMED_COLUMNS if c != 'minutes')
+
+_SEASON_SQL = f"COALESCE({SEASON_START_YEAR_SQL}, {UNDATED_SEASON})"
+
+# One stat line with the season it counts towards, locked for a read-modify-write
+STAT_LINE_SQL = f"""
+    SELECT pms.*, {_SEASON_SQL} AS season_start_year
+    FROM player_match_stats pms
+    LEFT JOIN match_table m ON m.match_id = pms.match_id
+    WHERE pms.pms_id = %s
+    FOR UPDATE OF pms
+"""
+
+_AGGREGATE_SELECT = """
+    SELECT
+        pms.player_id,
+        {season} AS season_start_year,
+        COUNT(*) AS appearances,
+        COALESCE(SUM(pms.started), 0) AS starts,
+        {sums},
+        COALESCE(SUM(pms.passing_accuracy), 0) AS passing_accuracy_sum,
+        COUNT(pms.passing_accuracy) AS passing_accuracy_count
+    FROM player_match_stats pms
+    LEFT JOIN match_table m ON m.match_id = pms.match_id
+    WHERE pms.player_id IS NOT NULL {where}
+    GROUP BY pms.player_id, season_start_year
+""".format(
+    season=_SEASON_SQL,
+    sums=",\n        ".join(f"COALESCE(SUM(pms.{c}), 0) AS {c}" for c in SUMMED_COLUMNS),
+    where="{where}",
+)
+
+
+def fetch_stat_line(cursor, pms_id):
+    """The locked stat line, as a dict, or None; `cursor` must be a dictionary cursor"""
+    cursor.execute(STAT_LINE_SQL, (pms_id,))
+    return cursor.fetchone()
+
+
+def contribution(line) -> dict:
+    """What one stat line adds to its season row"""
+    accuracy = line.get('passing_accuracy')
+    deltas = {'appearances': 1, 'starts': 1 if line.get('started') else 0}
+    for column in SUMMED_COLUMNS:
+        deltas[column] = line.get(column) or 0
+    deltas['passing_accuracy_sum'] = accuracy or 0
+    deltas['passing_accuracy_count'] = 0 if accuracy is None else 1
+    return deltas
+
+
+def apply_change(cursor, before=None, after=None) -> None:
+    """Move the season totals from stat line `before` to `after` (either may be None).
+
+    Each side is a STAT_LINE_SQL row, so the same call covers insert (None -> line),
+    delete (line -> None) and updates, including ones that move a line to another player.
+    """
+    changes = {}
+    for line, sign in ((before, -1), (after, 1)):
+        if line is None or line.get('player_id') is None:
+            continue
+        key = (line['player_id'], line['season_start_year'])
+        deltas = changes.setdefault(key, dict.fromkeys(AGGREGATE_COLUMNS, 0))
+        for column, value in contribution(line).items():
+            deltas[column] += sign * value
+    for (player_id, season), deltas in sorted(changes.items()):  # fixed order, so concurrent writers lock rows alike
+        if any(deltas.values()):
+            _upsert(cursor, player_id, season, deltas)
+
+
+def _upsert(cursor, player_id, season, deltas):
+    columns = ", ".join(AGGREGATE_COLUMNS)
+    placeholders = ", ".join(["%s"] * (len(AGGREGATE_COLUMNS) + 2))
+    updates = ", ".join(f"{c} = {c} + VALUES({c})" for c in AGGREGATE_COLUMNS)
+    cursor.execute(f"""
+        INSERT INTO player_season_stats (player_id, season_start_year, {columns})
+        VALUES ({placeholders})
+        ON DUPLICATE KEY UPDATE {updates}
+    """, (player_id, season, *(deltas[c] for c in AGGREGATE_COLUMNS)))
+    if deltas['appearances'] < 0:
+        cursor.execute("""
+            DELETE FROM player_season_stats
+            WHERE player_id = %s AND season_start_year = %s AND appearances <= 0
+        """, (player_id, season))
+
+
+def remove_match(cursor, match_id) -> None:
+    """Take a match's stat lines out of the totals; call before deleting the match"""
+    assignments = ",\n            ".join(f"s.{c} = s.{c} - d.{c}" for c in AGGREGATE_COLUMNS)
+    cursor.execute(f"""
+        UPDATE player_season_stats s
+        JOIN ({_AGGREGATE_SELECT.format(where="AND pms.match_id = %s")}) d
+          ON d.player_id = s.player_id AND d.season_start_year = s.season_start_year
+        SET {assignments}
+    """, (match_id,))
+    cursor.execute("""
+        DELETE s FROM player_season_stats s
+        JOIN player_match_stats pms ON pms.player_id = s.player_id
+        WHERE pms.match_id = %s AND s.appearances <= 0
+    """, (match_id,))
+
+
+def rebuild(cursor) -> None:
+    """Recompute the whole table from player_match_stats; run inside a transaction"""
+    cursor.execute("DELETE FROM player_season_stats")
+    cursor.execute(f"""
+        INSERT INTO player_season_stats (player_id, season_start_year, {", ".join(AGGREGATE_COLUMNS)})
+        {_AGGREGATE_SELECT.format(where="")}
+    """)
+
+
+def _keyed(rows):
+    keyed = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            row = dict(zip(('player_id', 'season_start_year') + AGGREGATE_COLUMNS, row))
+        keyed[(row['player_id'], row['season_start_year'])] = row
+    return keyed
+
+
+def check(cursor) -> list:
+    """Differences between player_season_stats and a fresh aggregate, as
+    [{player_id, season_start_year, column, stored, expected}]; empty when consistent"""
+    cursor.execute(f"SELECT player_id, season_start_year, {', '.join(AGGREGATE_COLUMNS)} FROM player_season_stats")
+    stored = _keyed(cursor.fetchall() or [])
+    cursor.execute(_AGGREGATE_SELECT.format(where=""))
+    expected = _keyed(cursor.fetchall() or [])
+
+    drift = []
+    for key in sorted(stored.keys() | expected.keys()):
+        have, want = stored.get(key), expected.get(key)
+        # A row on only one side is reported once, by its appearances
+        columns = AGGREGATE_COLUMNS if have and want else ('appearances',)
+        for column in columns:
+            have_value = have[column] if have else None
+            want_value = want[column] if want else None
+            if have_value != want_value:
+                drift.append({"player_id": key[0], "season_start_year": key[1], "column": column,
+                              "stored": have_value, "expected": want_value})
+    return drift
+
+
+def season_label(season_start_year):
+    if season_start_year == UNDATED_SEASON:
+        return None
+    return f"{season_start_year}/{(season_start_year + 1) % 100:02d}"
+
+
+def summarize(totals) -> dict:
+    """Totals plus average passing accuracy and per-90 rates, from a row of AGGREGATE_COLUMNS"""
+    summary = {c: int(totals[c]) for c in AGGREGATE_COLUMNS if not c.startswith('passing_accuracy')}
+    count = totals['passing_accuracy_count']
+    summary['avg_passing_accuracy'] = round(float(totals['passing_accuracy_sum']) / count, 2) if count else None
+    minutes = summary['minutes']
+    summary['per_90'] = {c: round(summary[c] * 90 / minutes, 2) if minutes else None for c in PER_90_COLUMNS}
+    return summary
+
+
+def read_player(cursor, player_id) -> list:
+    """A player's season rows, newest first, each summarized; `cursor` must be a dictionary cursor"""
+    cursor.execute(f"""
+        SELECT season_start_year, {", ".join(AGGREGATE_COLUMNS)}
+        FROM player_season_stats
+        WHERE player_id = %s
+        ORDER BY season_start_year DESC
+    """, (player_id,))
+    return cursor.fetchall() or []
+
+
+def career(rows) -> dict:
+    """AGGREGATE_COLUMNS summed over a player's season rows"""
+    totals = dict.fromkeys(AGGREGATE_COLUMNS, 0)
+    for row in rows:
+        for column in AGGREGATE_COLUMNS:
+            totals[column] += row[column]
+    return totals
+
+
+def player_summary(player_id, rows) -> dict:
+    """The /player_season_stats payload from read_player() rows"""
+    seasons = [{"season": season_label(row['season_start_year']), **summarize(row)} for row in rows]
+    return {"player_id": player_id, "seasons": seasons, "career": summarize(career(rows))}
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from db_connect_module import get_db_connection
+
+    parser = argparse.ArgumentParser(description="Maintain the player_season_stats aggregate")
+    parser.add_argument("command", choices=("check", "rebuild"))
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        if args.command == "rebuild":
+            conn.start_transaction()
+            rebuild(cursor)
+            conn.commit()
+            print("player_season_stats rebuilt")
+        else:
+            drift = check(cursor)
+            for d in drift:
+                print(f"player {d['player_id']} season {d['season_start_year']}: "
+                      f"{d['column']} is {d['stored']}, expected {d['expected']}")
+            print(f"{len(drift)} difference(s)")
+            if drift:
+                sys.exit(1)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,103 @@
+"""Batched seeding: one executemany per table, one transaction per phase, timed.
+
+mysql-connector rewrites an executemany of a plain INSERT ... VALUES into multi-row INSERTs,
+so a table of a few thousand rows goes in with a handful of round trips instead of one per row.
+Tables whose generated ids later rows refer to are the exception: they go in a row at a time
+(see Phase.insert), still inside the phase's one transaction.
+File reads and image processing run in a thread pool (I/O and Pillow both release the GIL).
+
+    with seed_engine.phase(conn, "players") as p:
+        ids = p.insert(PLAYER_SQL, rows, ids=True)
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+SEED_CHUNK_SIZE = 1000
+SEED_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class Phase:
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.rows = 0
+
+    def insert(self, sql, rows, ids=False, chunk_size=SEED_CHUNK_SIZE):
+        """executemany `sql` over `rows` in chunks; with ids=True returns the generated ids in row order.
+
+        ids=True inserts one row per statement and takes each id from lastrowid: a multi-row
+        INSERT's ids aren't guaranteed consecutive (innodb_autoinc_lock_mode=2 lets concurrent
+        inserts interleave), so they can't be derived from the first one. For
+        INSERT ... ON DUPLICATE KEY UPDATE use lookup_ids() instead.
+        """
+        rows = list(rows)
+        generated = []
+        if ids:
+            for row in rows:
+                self.cursor.execute(sql, row)
+                generated.append(self.cursor.lastrowid)
+        else:
+            for start in range(0, len(rows), chunk_size):
+                self.cursor.executemany(sql, rows[start:start + chunk_size])
+        self.rows += len(rows)
+        return generated if ids else None
+
+    def lookup_ids(self, table, id_column, key_column, keys):
+        """{key: id} for rows of `table` whose `key_column` is in `keys` (a unique column)"""
+        keys = list(keys)
+        found = {}
+        for start in range(0, len(keys), SEED_CHUNK_SIZE):
+            chunk = keys[start:start + SEED_CHUNK_SIZE]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            self.cursor.execute(f"SELECT {key_column}, {id_column} FROM {table} WHERE {key_column} IN ({placeholders})", chunk)
+            found.update((key, row_id) for key, row_id in self.cursor.fetchall())
+        return found
+
+
+@contextmanager
+def phase(conn, name):
+    """One seeding step in its own transaction; prints its row count and duration when it commits"""
+    started = time.perf_counter()
+    conn.start_transaction()
+    cursor = conn.cursor()
+    p = Phase(cursor)
+    try:
+        yield p
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    print(f"  {name:<24} {p.rows:>8} rows  {time.perf_counter() - started:6.2f}s")
+
+
+def parallel_map(fn, items, workers=SEED_WORKERS):
+    """list(map(fn, items)) on a thread pool, results in input order"""
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def _read_file(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_files(paths, workers=SEED_WORKERS):
+    """Contents of each path (None where the file is missing), read in parallel"""
+    return parallel_map(_read_file, paths, workers)
+
+
+@contextmanager
+def timed(name):
+    """Print how long a non-database step took (file reads, image processing)"""
+    started = time.perf_counter()
+    yield
+    print(f"  {name:<24} {'':>8}       {time.perf_counter() - started:6.2f}s")
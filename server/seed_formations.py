@@ -14,21 +14,14 @@ def seed_formations():
     cursor = conn.cursor()
     
     try:
-        for formation in formations:
-            # Check if formation already exists
-            cursor.execute("SELECT formation_id FROM formation WHERE code = %s", (formation['code'],))
-            existing = cursor.fetchone()
-            
-            if existing:
-                print(f"Formation {formation['code']} already exists (ID: {existing[0]})")
-            else:
-                cursor.execute(
-                    "INSERT INTO formation (code, name) VALUES (%s, %s)",
-                    (formation['code'], formation['name'])
-                )
-                print(f"Created formation {formation['code']} (ID: {cursor.lastrowid})")
-        
+        # One multi-row INSERT; formations that already exist (unique code) are skipped
+        cursor.executemany(
+            "INSERT IGNORE INTO formation (code, name) VALUES (%s, %s)",
+            [(formation['code'], formation['name']) for formation in formations]
+        )
+        created = cursor.rowcount
         conn.commit()
+        print(f"Created {created} formation(s), {len(formations) - created} already existed")
         print("\nFormations seeded successfully")
         
     except Exception as e:
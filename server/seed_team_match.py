@@ -10,20 +10,16 @@ def seed_team_and_match():
     cursor = conn.cursor()
     
     try:
-        # Create a default team
-        cursor.execute("SELECT team_id FROM team WHERE team_name = 'My Team'")
-        team = cursor.fetchone()
-        
-        if team:
-            team_id = team[0]
-            print(f"Team already exists (ID: {team_id})")
-        else:
-            cursor.execute(
-                "INSERT INTO team (team_name, league, stadium) VALUES (%s, %s, %s)",
-                ('My Team', 'Premier League', 'Home Stadium')
-            )
-            team_id = cursor.lastrowid
-            print(f"Created team 'My Team' (ID: {team_id})")
+        # Create a default team (team names are unique; an existing one keeps its id)
+        cursor.execute(
+            """
+            INSERT INTO team (name, level) VALUES (%s, %s)
+            ON DUPLICATE KEY UPDATE team_id = LAST_INSERT_ID(team_id)
+            """,
+            ('My Team', 'Professional')
+        )
+        team_id = cursor.lastrowid
+        print(f"{'Created' if cursor.rowcount == 1 else 'Using existing'} team 'My Team' (ID: {team_id})")
         
         # Create a default match
         cursor.execute("SELECT match_id FROM match_table WHERE name = 'Training Match'")
@@ -0,0 +1,162 @@
+"""Streamed list responses (?stream=ndjson or ?stream=json) for large exports.
+
+Rows are read from an unbuffered cursor in fetchmany() batches and written out as each batch
+arrives, so memory and time to first byte stay flat however many rows match:
+
+  ndjson  one JSON object per line (application/x-ndjson)
+  json    {"status": "success", "data": [...], "count": N}, sent in chunks
+
+The query runs before the response starts, so SQL errors still become a 500. An error after
+the first byte can only cut the stream short; it is logged. The response, not the body generator,
+hands the connection back, so a client that goes away before the first byte doesn't leak it.
+"""
+import logging
+
+import anyio
+import mysql.connector
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
+
+from db_async_module import get_async_pool
+from db_connect_module import discard_connection, get_db_connection
+from json_response import dumps
+from pagination import build_page_query
+
+STREAM_BATCH_SIZE = 500
+STREAM_FORMATS = ('ndjson', 'json')
+
+_MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'json': 'application/json'}
+
+logger = logging.getLogger("SOMS_App")
+
+
+class _Encoder:
+    """Frames batches of rows as NDJSON lines or as one JSON document"""
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        self.count = 0
+
+    def open(self) -> bytes:
+        return b'{"status":"success","data":[' if self.fmt == 'json' else b''
+
+    def batch(self, rows) -> bytes:
+        if self.fmt == 'ndjson':
+            chunk = b''.join(dumps(row) + b'\n' for row in rows)
+        else:
+            chunk = (b',' if self.count else b'') + b','.join(dumps(row) for row in rows)
+        self.count += len(rows)
+        return chunk
+
+    def close(self) -> bytes:
+        return b'],"count":%d}' % self.count if self.fmt == 'json' else b''
+
+
+class _QueryStreamingResponse(StreamingResponse):
+    """StreamingResponse that releases the connection its rows are read from once it's done.
+
+    Not left to the body generator's finally: when the client disconnects or the send is
+    cancelled before the first next(), the generator never started and closing it skips its body.
+    """
+
+    def __init__(self, content, fmt, release):
+        super().__init__(content, media_type=_MEDIA_TYPES[fmt])
+        self._release = release
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Shielded, so a cancelled response still gets its connection back to the pool
+            with anyio.CancelScope(shield=True):
+                await self._release()
+
+
+def stream_query(query, params, fmt, transform=None, batch_size=STREAM_BATCH_SIZE):
+    """StreamingResponse over `query`, with `transform` applied to each batch of row dicts"""
+    connection = get_db_connection()
+    try:
+        cursor = connection.cursor(dictionary=True)  # unbuffered: rows stay on the server until fetched
+        cursor.execute(query, params)
+    except mysql.connector.Error as err:
+        discard_connection(connection)
+        raise HTTPException(status_code=500, detail=str(err))
+
+    finished = False
+
+    def body():
+        nonlocal finished
+        encoder = _Encoder(fmt)
+        try:
+            yield encoder.open()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield encoder.batch(transform(rows) if transform else rows)
+            yield encoder.close()
+            finished = True
+        except mysql.connector.Error:
+            logger.exception("Streaming query failed after the response started")
+            raise
+
+    def release():
+        if finished:
+            cursor.close()
+            connection.close()
+        else:
+            # Client went away (or the query failed) with rows still unread
+            discard_connection(connection)
+
+    # A sync generator: Starlette runs each next() in the threadpool
+    return _QueryStreamingResponse(body(), fmt, lambda: run_in_threadpool(release))
+
+
+def stream_page(select_sql, keys, where, params, page_cursor, fmt, transform=None):
+    """Stream every row of a paginated list query from `page_cursor` on, in page order (no LIMIT)"""
+    query, query_params = build_page_query(select_sql, keys, where, params, page_cursor, limit=None)
+    return stream_query(query, query_params, fmt, transform)
+
+
+async def astream_query(query, params, fmt, transform=None, batch_size=STREAM_BATCH_SIZE):
+    """stream_query for the async data-access path (SOMS_DB_MODE=async)"""
+    connection = await get_async_pool().acquire()
+    try:
+        cursor = await connection.cursor(dictionary=True)
+        await cursor.execute(query, params)
+    except mysql.connector.Error as err:
+        await connection.discard()
+        raise HTTPException(status_code=500, detail=str(err))
+
+    finished = False
+
+    async def body():
+        nonlocal finished
+        encoder = _Encoder(fmt)
+        try:
+            yield encoder.open()
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield encoder.batch(transform(rows) if transform else rows)
+            yield encoder.close()
+            finished = True
+        except mysql.connector.Error:
+            logger.exception("Streaming query failed after the response started")
+            raise
+
+    async def release():
+        if finished:
+            await cursor.close()
+            await connection.close()
+        else:
+            await connection.discard()
+
+    return _QueryStreamingResponse(body(), fmt, release)
+
+
+async def astream_page(select_sql, keys, where, params, page_cursor, fmt, transform=None):
+    query, query_params = build_page_query(select_sql, keys, where, params, page_cursor, limit=None)
+    return await astream_query(query, query_params, fmt, transform)
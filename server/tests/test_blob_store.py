@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+import pytest
+
+from blob_store import BlobNotFound, LocalBlobStore
+
+
+def _files(root):
+    return sorted(os.path.relpath(os.path.join(d, f), root) for d, _, fs in os.walk(root) for f in fs)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalBlobStore(str(tmp_path / 'blobs'))
+
+
+def test_put_is_addressed_by_sha256(store):
+    digest = store.put(b'photo bytes')
+    assert digest == hashlib.sha256(b'photo bytes').hexdigest()
+    assert store.get(digest) == b'photo bytes'
+    assert store.exists(digest)
+    assert store.local_path(digest).endswith(os.path.join(digest[:2], digest[2:4], digest))
+
+
+def test_identical_bytes_are_stored_once(store):
+    assert store.put(b'same') == store.put(b'same')
+    assert len(_files(store.root)) == 1
+
+
+def test_put_file_adopts_and_dedups(store, tmp_path):
+    first = tmp_path / 'a'
+    first.write_bytes(b'same')
+    second = tmp_path / 'b'
+    second.write_bytes(b'same')
+    digest = hashlib.sha256(b'same').hexdigest()
+
+    assert store.put_file(str(first), digest) == digest
+    assert store.put_file(str(second), digest) == digest
+    # Both sources are consumed, and only one copy is kept
+    assert not first.exists() and not second.exists()
+    assert _files(store.root) == [os.path.join(digest[:2], digest[2:4], digest)]
+    assert store.get(digest) == b'same'
+
+
+def test_missing_and_malformed_digests(store):
+    missing = hashlib.sha256(b'never stored').hexdigest()
+    with pytest.raises(BlobNotFound):
+        store.get(missing)
+    assert not store.exists(missing)
+    assert store.local_path(missing) is None
+    store.delete(missing)
+    with pytest.raises(ValueError):
+        store.get('../../etc/passwd')
+
+
+def test_delete(store):
+    digest = store.put(b'x')
+    store.delete(digest)
+    assert not store.exists(digest)
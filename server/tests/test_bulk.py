@@ -0,0 +1,66 @@
+import mysql.connector
+from pydantic import BaseModel
+
+import bulk
+
+
+class Item(BaseModel):
+    name: str
+    age: int
+
+
+class FakeCursor:
+    """Assigns ids out of order, as interleaved concurrent inserts can"""
+
+    def __init__(self, ids):
+        self._ids = iter(ids)
+        self.lastrowid = None
+        self.executed = []
+
+    def execute(self, sql, params):
+        if params[0] == 'dup':
+            raise mysql.connector.IntegrityError("Duplicate entry 'dup'")
+        self.executed.append(params)
+        self.lastrowid = next(self._ids)
+
+
+def test_validate_items_records_failures():
+    result = bulk.BulkResult('item_id', 3)
+    valid = bulk.validate_items(Item, [{'name': 'a', 'age': 1}, {'name': 'b'}, {'name': 'c', 'age': 'x'}], result)
+    assert [index for index, _ in valid] == [0]
+    assert set(result.errors) == {1, 2}
+    assert result.errors[1] == [{'loc': ['age'], 'msg': 'Field required'}]
+
+
+def test_insert_rows_takes_each_rows_own_id():
+    result = bulk.BulkResult('item_id', 3)
+    cursor = FakeCursor([10, 14, 12])
+    bulk.insert_rows(cursor, "INSERT", [(0, ('a',)), (1, ('b',)), (2, ('c',))], result)
+    assert result.ids == {0: 10, 1: 14, 2: 12}
+    assert result.ok
+
+
+def test_insert_rows_reports_row_errors_and_carries_on():
+    result = bulk.BulkResult('item_id', 3)
+    bulk.insert_rows(FakeCursor([10, 11]), "INSERT", [(0, ('a',)), (1, ('dup',)), (2, ('c',))], result)
+    assert result.ids == {0: 10, 2: 11}
+    assert "Duplicate entry" in result.errors[1]
+
+
+def test_response_statuses():
+    result = bulk.BulkResult('item_id', 2)
+    result.ids = {0: 5, 1: 6}
+    assert result.to_response(bulk.ATOMIC) == {
+        'status': 'success', 'mode': 'atomic', 'created': 2, 'failed': 0,
+        'results': [{'index': 0, 'status': 'created', 'item_id': 5},
+                    {'index': 1, 'status': 'created', 'item_id': 6}],
+    }
+
+    result.errors = {1: 'bad'}
+    del result.ids[1]
+    assert result.to_response(bulk.PARTIAL)['status'] == 'partial'
+
+    result.rolled_back()
+    response = result.to_response(bulk.ATOMIC)
+    assert response['status'] == 'failed'
+    assert response['results'][0] == {'index': 0, 'status': 'not_created'}
@@ -0,0 +1,72 @@
+import pytest
+
+import cache
+from cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_get_after_set(clock):
+    c = TTLCache(maxsize=4, ttl=60)
+    assert c.get('k') is None
+    assert c.set('k', b'v', c.begin('k'))
+    assert c.get('k') == b'v'
+    assert (c.hits, c.misses) == (1, 1)
+
+
+def test_entries_expire_after_ttl(clock):
+    c = TTLCache(maxsize=4, ttl=60)
+    c.set('k', b'v', c.begin('k'))
+    clock[0] += 59.9
+    assert c.get('k') == b'v'
+    clock[0] += 0.1
+    assert c.get('k') is None
+    assert c.stats()['size'] == 0
+
+
+def test_least_recently_used_is_evicted(clock):
+    c = TTLCache(maxsize=2, ttl=60)
+    for key in ('a', 'b'):
+        c.set(key, key, c.begin(key))
+    c.get('a')
+    c.set('c', 'c', c.begin('c'))
+    assert c.get('b') is None
+    assert c.get('a') == 'a' and c.get('c') == 'c'
+
+
+def test_invalidate_drops_entry(clock):
+    c = TTLCache()
+    c.set('k', b'v', c.begin('k'))
+    c.invalidate('k')
+    assert c.get('k') is None
+
+
+def test_value_read_before_an_invalidation_is_not_cached(clock):
+    c = TTLCache()
+    token = c.begin('k')      # reader starts its query
+    c.invalidate('k')         # a writer commits meanwhile
+    assert not c.set('k', b'stale', token)
+    assert c.get('k') is None
+    assert c.set('k', b'fresh', c.begin('k'))
+
+
+def test_invalidation_is_per_key(clock):
+    c = TTLCache()
+    token = c.begin('a')
+    c.invalidate('b')
+    assert c.set('a', b'v', token)
+
+
+def test_clear_invalidates_tokens_taken_before_it(clock):
+    c = TTLCache()
+    c.set('a', b'v', c.begin('a'))
+    token = c.begin('b')
+    c.clear()
+    assert c.get('a') is None
+    assert not c.set('b', b'stale', token)
+    assert c.set('b', b'fresh', c.begin('b'))
@@ -0,0 +1,85 @@
+import counters
+
+
+class RecordingCursor:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((' '.join(sql.split()), params))
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_bump_many_is_one_statement_in_name_order():
+    cursor = RecordingCursor()
+    counters.bump_many(cursor, {'players_total': 1, 'players_active': -1, 'staff_total': 2})
+    [(sql, params)] = cursor.executed
+    assert sql.startswith("INSERT INTO dashboard_counter (name, value) VALUES (%s, %s), (%s, %s), (%s, %s)")
+    assert "ON DUPLICATE KEY UPDATE value = value + VALUES(value)" in sql
+    # Sorted by name, so concurrent bumps take the row locks in the same order
+    assert params == ['players_active', -1, 'players_total', 1, 'staff_total', 2]
+
+
+def test_bump_many_skips_zero_deltas():
+    cursor = RecordingCursor()
+    counters.bump_many(cursor, {'players_total': 0})
+    assert cursor.executed == []
+    counters.bump_many(cursor, {'players_total': 0, 'players_injured': 1})
+    assert cursor.executed[0][1] == ['players_injured', 1]
+
+
+def test_bump():
+    cursor = RecordingCursor()
+    counters.bump(cursor, counters.MEDICAL_REPORTS_TOTAL)
+    assert cursor.executed[0][1] == ['medical_reports_total', 1]
+
+
+def test_player_deltas():
+    active = {'is_active': 1, 'is_injured': 0}
+    injured = {'is_active': 1, 'is_injured': 1}
+    assert counters.player_deltas(None, active) == {'players_total': 1, 'players_active': 1}
+    assert counters.player_deltas(injured, None) == {'players_total': -1, 'players_active': -1,
+                                                     'players_injured': -1}
+    # A status change nets out the total
+    assert counters.player_deltas(active, injured) == {'players_total': 0, 'players_active': 0,
+                                                       'players_injured': 1}
+
+
+def test_staff_deltas():
+    assert counters.staff_deltas(None, 'Coach') == {'staff_total': 1, 'staff_type:Coach': 1}
+    assert counters.staff_deltas('Coach', 'Physio') == {'staff_total': 0, 'staff_type:Coach': -1,
+                                                        'staff_type:Physio': 1}
+    assert counters.staff_deltas('Coach', 'Coach') == {'staff_total': 0, 'staff_type:Coach': 0}
+
+
+def test_read_summary_shapes_the_counters():
+    cursor = RecordingCursor([
+        {'name': 'staff_total', 'value': 5}, {'name': 'scouts_total', 'value': 2},
+        {'name': 'staff_type:Physio', 'value': 1}, {'name': 'staff_type:Coach', 'value': 4},
+        {'name': 'staff_type:Analyst', 'value': 0},
+        {'name': 'players_total', 'value': 30}, {'name': 'players_active', 'value': 28},
+        {'name': 'medical_reports_total', 'value': 7}, {'name': 'upcoming_fixtures', 'value': 3},
+    ])
+    assert counters.read_summary(cursor) == {
+        'total_users': 7,
+        'staff': {'total': 5, 'by_type': {'Coach': 4, 'Physio': 1}},
+        'players': {'total': 30, 'active': 28, 'injured': 0},
+        'upcoming_fixtures': 3,
+        'medical_reports': {'total': 7},
+    }
+    assert cursor.executed[0][1] == ('upcoming_fixtures',)
+
+
+def test_read_summary_before_any_counters():
+    summary = counters.read_summary(RecordingCursor([('upcoming_fixtures', 0)]))
+    assert summary['total_users'] == 0
+    assert summary['staff'] == {'total': 0, 'by_type': {}}
+
+
+def test_read_counters_defaults_to_zero():
+    cursor = RecordingCursor([('players_total', 4)])
+    assert counters.read_counters(cursor, 'players_total', 'players_injured') == {
+        'players_total': 4, 'players_injured': 0}
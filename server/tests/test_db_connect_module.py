@@ -0,0 +1,91 @@
+import pytest
+from mysql.connector import errors
+
+import db_connect_module
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def close(self):
+        self.log.append('cursor closed')
+
+
+class FakeConnection:
+    def __init__(self):
+        self.log = []
+
+    def start_transaction(self):
+        self.log.append('begin')
+
+    def cursor(self):
+        return FakeCursor(self.log)
+
+    def commit(self):
+        self.log.append('commit')
+
+    def rollback(self):
+        self.log.append('rollback')
+
+    def close(self):
+        self.log.append('close')
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(db_connect_module, 'get_db_connection', lambda: conn)
+    monkeypatch.setattr(db_connect_module.time, 'sleep', lambda seconds: None)
+    return conn
+
+
+def _failing(errno, times):
+    calls = []
+
+    def work(cursor):
+        calls.append(cursor)
+        if len(calls) <= times:
+            raise errors.DatabaseError(msg='lock', errno=errno)
+        return 'done'
+    return work, calls
+
+
+def test_commits_and_returns_the_result(connection):
+    assert db_connect_module.run_transaction(lambda cursor: 42) == 42
+    assert connection.log == ['begin', 'commit', 'cursor closed', 'close']
+
+
+def test_deadlock_victim_is_rerun(connection):
+    work, calls = _failing(db_connect_module.ER_LOCK_DEADLOCK, 2)
+    assert db_connect_module.run_transaction(work, attempts=3) == 'done'
+    assert len(calls) == 3
+    assert connection.log.count('rollback') == 2
+    assert connection.log.count('commit') == 1
+
+
+def test_deadlock_gives_up_after_the_last_attempt(connection):
+    work, calls = _failing(db_connect_module.ER_LOCK_DEADLOCK, 5)
+    with pytest.raises(errors.DatabaseError):
+        db_connect_module.run_transaction(work, attempts=3)
+    assert len(calls) == 3
+    assert 'commit' not in connection.log
+    assert connection.log[-1] == 'close'
+
+
+@pytest.mark.parametrize('errno', [1205, 1062])
+def test_other_errors_are_not_retried(connection, errno):
+    # 1205 (lock wait timeout) has already waited innodb_lock_wait_timeout
+    work, calls = _failing(errno, 1)
+    with pytest.raises(errors.DatabaseError):
+        db_connect_module.run_transaction(work)
+    assert len(calls) == 1
+    assert connection.log == ['begin', 'rollback', 'cursor closed', 'close']
+
+
+def test_non_database_errors_roll_back(connection):
+    def work(cursor):
+        raise ValueError('bad lineup')
+    with pytest.raises(ValueError):
+        db_connect_module.run_transaction(work)
+    assert connection.log == ['begin', 'rollback', 'cursor closed', 'close']
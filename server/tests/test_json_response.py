@@ -0,0 +1,49 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from json_response import FastJSONResponse, dumps
+
+
+@pytest.mark.parametrize('value, encoded', [
+    # DECIMAL columns keep their scale, as strings
+    (Decimal('125000.00'), '"125000.00"'),
+    (Decimal('-0.50'), '"-0.50"'),
+    # TIME columns (mysql-connector returns timedelta) as ISO 8601 durations
+    (timedelta(hours=15, minutes=30), '"PT15H30M"'),
+    (timedelta(hours=15), '"PT15H"'),
+    # DATE / DATETIME as str(), space-separated like the old per-row date pass
+    (date(2025, 1, 2), '"2025-01-02"'),
+    (datetime(2025, 1, 2, 3, 4, 5), '"2025-01-02 03:04:05"'),
+    (datetime(2025, 1, 2, 3, 4, 5, 120), '"2025-01-02 03:04:05.000120"'),
+    (time(15, 30), '"15:30:00"'),
+])
+def test_column_types(value, encoded):
+    assert dumps(value).decode() == encoded
+
+
+def test_row_passes_through_unchanged():
+    row = {'player_id': 1, 'first_name': 'Ann', 'middle_name': None, 'is_injured': False,
+           'salary': Decimal('125000.00'), 'contract_end_date': date(2027, 6, 30),
+           'photo_uploaded_at': datetime(2025, 1, 2, 3, 4, 5)}
+    assert orjson.loads(dumps({'data': [row]})) == {'data': [{
+        'player_id': 1, 'first_name': 'Ann', 'middle_name': None, 'is_injured': False,
+        'salary': '125000.00', 'contract_end_date': '2027-06-30', 'photo_uploaded_at': '2025-01-02 03:04:05',
+    }]}
+
+
+def test_non_string_keys():
+    assert dumps({1: 'a'}) == b'{"1":"a"}'
+
+
+def test_unknown_types_are_rejected():
+    with pytest.raises(TypeError):
+        dumps({'x': object()})
+
+
+def test_response_body():
+    response = FastJSONResponse({'when': datetime(2025, 1, 2, 3, 4, 5)})
+    assert response.body == b'{"when":"2025-01-02 03:04:05"}'
+    assert response.media_type == 'application/json'
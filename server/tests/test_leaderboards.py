@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+import leaderboards
+from season_stats import AGGREGATE_COLUMNS
+
+
+def _normalised(query):
+    return ' '.join(query.split())
+
+
+@pytest.mark.parametrize('filters', [{}, {'season': 2024}])
+def test_career_and_season_boards_read_the_season_totals(filters):
+    query, params = leaderboards.build_query('goals', **filters)
+    assert 'FROM player_season_stats s' in query
+    assert 'player_match_stats' not in query
+    assert params == (*filters.values(), 0, leaderboards.DEFAULT_LIMIT)
+
+
+@pytest.mark.parametrize('filters, condition', [
+    ({'date_from': '2024-08-01'}, 'm.match_date >= %s'),
+    ({'date_to': '2025-05-31'}, 'm.match_date <= %s'),
+    ({'team_id': 3}, 'pms.team_id = %s'),
+])
+def test_date_and_team_filters_aggregate_the_match_lines(filters, condition):
+    query, params = leaderboards.build_query('goals', min_minutes=90, limit=5, **filters)
+    assert 'FROM player_match_stats pms' in query
+    assert 'player_season_stats' not in query
+    assert condition in query
+    assert params == (*filters.values(), 90, 5)
+
+
+def test_season_with_a_match_filter_uses_the_match_date():
+    query, params = leaderboards.build_query('goals', team_id=3, season=2024)
+    assert 'pms.team_id = %s AND (YEAR(m.match_date) - (MONTH(m.match_date) < 8)) = %s' in _normalised(query)
+    assert params == (3, 2024, 0, leaderboards.DEFAULT_LIMIT)
+
+
+@pytest.mark.parametrize('metric, rate, value', [
+    ('goals', leaderboards.TOTAL, 't.goals AS value'),
+    ('goals', leaderboards.PER_90, 'ROUND(t.goals * 90 / NULLIF(t.minutes, 0), 2) AS value'),
+    ('passing_accuracy', leaderboards.TOTAL,
+     'ROUND(t.passing_accuracy_sum / NULLIF(t.passing_accuracy_count, 0), 2) AS value'),
+])
+def test_value_expression(metric, rate, value):
+    query, _ = leaderboards.build_query(metric, rate)
+    assert value in _normalised(query)
+    assert 'ORDER BY value DESC, p.player_id LIMIT %s' in _normalised(query)
+
+
+@pytest.fixture
+def db():
+    # REAL columns so that SQLite divides like MySQL instead of truncating
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE player (player_id INTEGER PRIMARY KEY, first_name TEXT, last_name TEXT)")
+    conn.execute(f"CREATE TABLE player_season_stats (player_id INTEGER, season_start_year INTEGER, "
+                 f"{', '.join(c + ' REAL' for c in AGGREGATE_COLUMNS)})")
+    for player_id, name in ((1, 'Ann'), (2, 'Bea'), (3, 'Cy'), (4, 'Di')):
+        conn.execute("INSERT INTO player VALUES (?, ?, 'X')", (player_id, name))
+    # player, season, appearances, minutes, goals, passing accuracy sum and count
+    for player_id, season, apps, minutes, goals, acc_sum, acc_count in (
+            (1, 2023, 10, 900, 4, 800, 10), (1, 2024, 5, 450, 3, 0, 0),
+            (2, 2024, 4, 180, 3, 300, 4),
+            (3, 2024, 10, 900, 3, 900, 10),
+            (4, 2024, 1, 0, 0, 0, 0)):
+        row = dict.fromkeys(AGGREGATE_COLUMNS, 0)
+        row.update(appearances=apps, minutes=minutes, goals=goals,
+                   passing_accuracy_sum=acc_sum, passing_accuracy_count=acc_count)
+        conn.execute(f"INSERT INTO player_season_stats VALUES (?, ?, {', '.join('?' * len(AGGREGATE_COLUMNS))})",
+                     (player_id, season, *row.values()))
+    yield conn
+    conn.close()
+
+
+def _board(db, metric, rate=leaderboards.TOTAL, **filters):
+    query, params = leaderboards.build_query(metric, rate, **filters)
+    # SQLite rejects HAVING without GROUP BY but, unlike MySQL, takes the alias in WHERE
+    query = query.replace('%s', '?').replace('HAVING value', 'AND value')
+    rows = [dict(r) for r in db.execute(query, params)]
+    return [(row['rank'], row['player_id'], row['value']) for row in leaderboards.shape(rows, metric, rate)]
+
+
+def test_ranking(db):
+    assert _board(db, 'goals') == [(1, 1, 7), (2, 2, 3), (3, 3, 3), (4, 4, 0)]
+    assert _board(db, 'goals', season=2024) == [(1, 1, 3), (2, 2, 3), (3, 3, 3), (4, 4, 0)]
+    # Players without minutes have no rate and are left out
+    assert _board(db, 'goals', leaderboards.PER_90, season=2024) == [(1, 2, 1.5), (2, 1, 0.6), (3, 3, 0.3)]
+    assert _board(db, 'passing_accuracy') == [(1, 3, 90.0), (2, 1, 80.0), (3, 2, 75.0)]
+    assert _board(db, 'goals', min_minutes=450, limit=2) == [(1, 1, 7), (2, 3, 3)]
@@ -0,0 +1,111 @@
+import pytest
+
+import migrations
+from migrations import Migration
+
+
+class FakeCursor:
+    def __init__(self, applied=(), lock=1):
+        self.applied = set(applied)
+        self.lock = lock
+        self.statements = []
+        self._result = None
+
+    def execute(self, sql, params=()):
+        sql = ' '.join(sql.split())
+        self.statements.append(sql)
+        if sql.startswith('SELECT GET_LOCK'):
+            self._result = [(self.lock,)]
+        elif sql == 'SELECT version FROM schema_migrations':
+            self._result = [(v,) for v in self.applied]
+        elif sql.startswith('INSERT INTO schema_migrations'):
+            self.applied.add(params[0])
+        else:
+            self._result = []
+
+    def fetchone(self):
+        return self._result[0]
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def test_registered_versions_are_strictly_increasing():
+    versions = [m.version for m in migrations.MIGRATIONS]
+    assert versions == sorted(set(versions))
+
+
+def test_out_of_order_registration_is_rejected(monkeypatch):
+    monkeypatch.setattr(migrations, 'MIGRATIONS', [])
+    migrations.migration(2, 'two')(lambda cursor: None)
+    for version in (1, 2):
+        with pytest.raises(ValueError):
+            migrations.migration(version, 'late')(lambda cursor: None)
+
+
+@pytest.fixture
+def steps(monkeypatch):
+    ran = []
+
+    def step(version, fail=False):
+        def apply(cursor):
+            if fail:
+                raise RuntimeError('DDL failed')
+            ran.append(version)
+        return Migration(version, f'step {version}', apply)
+    return ran, lambda *specs: monkeypatch.setattr(migrations, 'MIGRATIONS', [step(*spec) for spec in specs])
+
+
+def test_only_pending_migrations_run_in_version_order(steps):
+    ran, register = steps
+    register((1,), (2,), (3,), (4,))
+    cursor = FakeCursor(applied={1, 3})
+    conn = FakeConnection(cursor)
+    assert migrations.migrate(conn, verbose=False) == [2, 4]
+    assert ran == [2, 4]
+    # Each one is recorded and committed on its own
+    assert cursor.applied == {1, 2, 3, 4}
+    assert conn.commits == 2
+    assert cursor.statements[-1] == 'SELECT RELEASE_LOCK(%s)'
+
+    assert migrations.migrate(conn, verbose=False) == []
+
+
+def test_failure_stops_later_migrations_and_releases_the_lock(steps):
+    ran, register = steps
+    register((1,), (2, True), (3,))
+    cursor = FakeCursor()
+    conn = FakeConnection(cursor)
+    with pytest.raises(RuntimeError):
+        migrations.migrate(conn, verbose=False)
+    assert ran == [1]
+    assert cursor.applied == {1}
+    assert conn.rollbacks == 1
+    assert cursor.statements[-1] == 'SELECT RELEASE_LOCK(%s)'
+
+
+def test_lock_timeout(steps):
+    ran, register = steps
+    register((1,))
+    with pytest.raises(RuntimeError, match='Timed out'):
+        migrations.migrate(FakeConnection(FakeCursor(lock=0)), verbose=False)
+    assert ran == []
@@ -0,0 +1,31 @@
+import pytest
+
+from models import _diff_slots
+
+
+def _apply(stored, deletes, inserts):
+    slots = {slot: player for slot, player in stored.items() if slot not in deletes}
+    for slot, player in inserts:
+        assert slot not in slots
+        slots[slot] = player
+    return slots
+
+
+@pytest.mark.parametrize('stored, submitted, deletes, inserts', [
+    ({}, {1: 10, 2: 20}, [], [(1, 10), (2, 20)]),
+    ({1: 10, 2: 20}, {1: 10, 2: 20}, [], []),
+    ({1: 10, 2: 20, 3: 30}, {1: 10, 2: 20}, [3], []),
+    ({1: 10, 2: 20}, {1: 10, 2: 25}, [2], [(2, 25)]),
+    # A swap deletes both slots first, so the re-inserts can't collide on uq_lineup_player
+    ({1: 10, 2: 20, 3: 30}, {1: 20, 2: 10, 3: 30}, [1, 2], [(1, 20), (2, 10)]),
+    ({1: 10}, {}, [1], []),
+])
+def test_diff_slots(stored, submitted, deletes, inserts):
+    assert _diff_slots(stored, submitted) == (deletes, inserts)
+    assert _apply(stored, deletes, inserts) == submitted
+
+
+def test_diff_slots_is_sorted_for_lock_order():
+    deletes, inserts = _diff_slots({5: 1, 3: 2, 9: 3}, {9: 4, 5: 5, 3: 6})
+    assert deletes == [3, 5, 9]
+    assert [slot for slot, _ in inserts] == [3, 5, 9]
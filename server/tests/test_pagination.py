@@ -0,0 +1,103 @@
+import sqlite3
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from pagination import (InvalidCursor, SortKey, build_page_query, decode_cursor, encode_cursor,
+                        keyset_predicate, order_by, split_page)
+
+ID = SortKey('id')
+
+
+def test_cursor_round_trip():
+    keys = (SortKey('last_name'), SortKey('salary'), SortKey('contract_end_date', nullable=True), ID)
+    token = encode_cursor(['Smith', Decimal('125000.00'), None, 42])
+    assert '=' not in token
+    # Dates and decimals come back as strings, which MySQL compares correctly against their columns
+    assert decode_cursor(token, keys) == ['Smith', '125000.00', None, 42]
+    assert decode_cursor(encode_cursor([date(2025, 1, 2), 7]), (SortKey('d'), ID)) == ['2025-01-02', 7]
+
+
+@pytest.mark.parametrize('token', ['not base64 at all!', 'e30', encode_cursor([1, 2, 3]), ''])
+def test_decode_rejects_foreign_cursors(token):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, (SortKey('a'), ID))
+
+
+def test_uniform_direction_uses_row_constructor():
+    assert keyset_predicate((SortKey('a'), ID), ['x', 3]) == ("(a, id) > (%s, %s)", ('x', 3))
+    desc = (SortKey('a', descending=True), SortKey('id', descending=True))
+    assert keyset_predicate(desc, ['x', 3]) == ("(a, id) < (%s, %s)", ('x', 3))
+
+
+def test_nullable_ascending():
+    keys = (SortKey('d', nullable=True), ID)
+    # NULLs sort first ascending: after a NULL comes every non-NULL value
+    assert keyset_predicate(keys, [None, 3]) == (
+        "((d IS NOT NULL) OR (d IS NULL AND id > %s))", (3,))
+    assert keyset_predicate(keys, ['2025-01-02', 3]) == (
+        "((d > %s) OR (d = %s AND id > %s))", ('2025-01-02', '2025-01-02', 3))
+
+
+def test_nullable_descending():
+    keys = (SortKey('d', descending=True, nullable=True), SortKey('id', descending=True))
+    # NULLs sort last descending: they come after every non-NULL value, and nothing comes after them
+    assert keyset_predicate(keys, ['2025-01-02', 3]) == (
+        "(((d < %s OR d IS NULL)) OR (d = %s AND id < %s))", ('2025-01-02', '2025-01-02', 3))
+    assert keyset_predicate(keys, [None, 3]) == ("((d IS NULL AND id < %s))", (3,))
+
+
+def test_mixed_directions():
+    keys = (SortKey('d', descending=True), ID)
+    assert keyset_predicate(keys, ['2025-01-02', 3]) == (
+        "((d < %s) OR (d = %s AND id > %s))", ('2025-01-02', '2025-01-02', 3))
+
+
+def test_split_page():
+    rows = [{'id': i} for i in range(1, 5)]
+    assert split_page(rows[:3], (ID,), 3) == (rows[:3], None)
+    page, next_cursor = split_page(rows, (ID,), 3)
+    assert page == rows[:3]
+    assert decode_cursor(next_cursor, (ID,)) == [3]
+
+
+ROWS = [(1, 'b', None), (2, 'a', '2025-03-01'), (3, 'a', None), (4, 'c', '2025-01-01'),
+        (5, 'b', '2025-03-01'), (6, 'a', '2024-12-31'), (7, 'c', None), (8, 'b', '2025-01-01')]
+
+
+@pytest.fixture
+def db():
+    # SQLite orders NULLs like MySQL (first ascending, last descending), so a walk over its pages
+    # checks that the predicates neither skip nor repeat rows
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT NOT NULL, d TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?)", ROWS)
+    yield conn
+    conn.close()
+
+
+def _walk(db, keys, limit):
+    ids, cursor = [], None
+    while True:
+        query, params = build_page_query("SELECT * FROM t", keys, cursor=cursor, limit=limit)
+        rows = [dict(r) for r in db.execute(query.replace('%s', '?'), params)]
+        page, cursor = split_page(rows, keys, limit)
+        ids.extend(r['id'] for r in page)
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize('keys', [
+    (SortKey('name'), ID),
+    (SortKey('name', descending=True), SortKey('id', descending=True)),
+    (SortKey('d', nullable=True), ID),
+    (SortKey('d', descending=True, nullable=True), SortKey('id', descending=True)),
+    (SortKey('d', descending=True, nullable=True), ID),
+    (SortKey('name'), SortKey('d', descending=True, nullable=True), ID),
+])
+@pytest.mark.parametrize('limit', [1, 2, 3, 100])
+def test_pages_cover_every_row_once(db, keys, limit):
+    expected = [r['id'] for r in db.execute(f"SELECT id FROM t ORDER BY {order_by(keys)}")]
+    assert _walk(db, keys, limit) == expected
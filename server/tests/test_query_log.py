@@ -0,0 +1,81 @@
+import pytest
+
+import query_log
+from query_log import fingerprint, redact
+
+
+@pytest.mark.parametrize('sql, expected', [
+    ("SELECT * FROM Player WHERE player_id IN (%s, %s, %s) AND is_active = 1",
+     "SELECT * FROM Player WHERE player_id IN (?+) AND is_active = ?"),
+    ("SELECT * FROM player WHERE last_name = 'O''Neil' AND team_id = 12",
+     "SELECT * FROM player WHERE last_name = ? AND team_id = ?"),
+    ('SELECT * FROM player WHERE first_name = "Ann"', "SELECT * FROM player WHERE first_name = ?"),
+    ("SELECT salary * 1.5e3 FROM player WHERE player_id = %(id)s",
+     "SELECT salary * ? FROM player WHERE player_id = ?"),
+    # Multi-row VALUES collapse to one row, however many there are
+    ("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)", "INSERT INTO t (a, b) VALUES (?+)"),
+    ("INSERT INTO t (a) VALUES (%s), (%s)", "INSERT INTO t (a) VALUES (?)"),
+    # Comments and layout don't matter
+    ("SELECT a /* hint */\n  FROM t -- trailing\n WHERE b = ?", "SELECT a FROM t WHERE b = ?"),
+    # Digits inside identifiers are kept
+    ("SELECT col2 FROM t1 WHERE x = 2", "SELECT col2 FROM t1 WHERE x = ?"),
+    (b"SELECT 1", "SELECT ?"),
+])
+def test_fingerprint(sql, expected):
+    assert fingerprint(sql) == expected
+
+
+def test_same_statement_with_other_values_shares_a_fingerprint():
+    assert (fingerprint("SELECT * FROM t WHERE id IN (1, 2) AND name = 'a'")
+            == fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s, %s)  AND name = %s"))
+
+
+def test_redact_keeps_only_types_and_lengths():
+    assert redact(('secret@example.com', 42, None, b'\x00\x01', 1.5)) == [
+        '<str:18>', '<int>', None, '<bytes:2>', '<float>']
+    assert redact({'email': 'a@b.c', 'id': 7}) == {'email': '<str:5>', 'id': '<int>'}
+    assert redact(None) is None
+    assert redact('x') == '<str:1>'
+
+
+def test_redact_many_summarises_the_rows():
+    assert redact([('alice', 1), ('bob', 2)], many=True) == {'rows': 2, 'first': ['<str:5>', '<int>']}
+    assert redact([], many=True) == '<rows>'
+    assert redact(iter([('a',)]), many=True) == '<rows>'
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    monkeypatch.setattr(query_log, 'SLOW_QUERY_MS', 1e9)
+    query_log.reset()
+    yield
+    query_log.reset()
+
+
+def test_observe_groups_by_fingerprint(stats):
+    query_log.observe("SELECT * FROM t WHERE id = %s", (1,), 0.002)
+    query_log.observe("SELECT * FROM t WHERE id = 5", None, 0.3, failed=True)
+    [row] = query_log.snapshot()
+    assert row['fingerprint'] == "SELECT * FROM t WHERE id = ?"
+    assert (row['count'], row['errors'], row['max_ms']) == (2, 1, 300.0)
+    assert row['histogram']['0.005'] == 1
+    assert row['histogram']['0.5'] == 2
+    assert row['histogram']['+Inf'] == 2
+
+
+def test_fingerprints_past_the_cap_share_one_entry(stats, monkeypatch):
+    monkeypatch.setattr(query_log, 'MAX_FINGERPRINTS', 2)
+    for table in ('a', 'b', 'c', 'd'):
+        query_log.observe(f"SELECT * FROM {table}", None, 0.001)
+    counts = {row['fingerprint']: row['count'] for row in query_log.snapshot()}
+    assert counts == {'SELECT * FROM a': 1, 'SELECT * FROM b': 1, query_log.OVERFLOW_FINGERPRINT: 2}
+
+
+def test_slow_queries_are_logged_without_values(stats, monkeypatch, caplog):
+    monkeypatch.setattr(query_log, 'SLOW_QUERY_MS', 100)
+    with caplog.at_level('WARNING', logger='SOMS_App'):
+        query_log.observe("SELECT * FROM staff WHERE email = %s", ('secret@example.com',), 0.25)
+    [record] = caplog.records
+    assert 'SELECT * FROM staff WHERE email = ?' in record.getMessage()
+    assert "['<str:18>']" in record.getMessage()
+    assert 'secret' not in record.getMessage()
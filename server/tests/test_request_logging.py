@@ -0,0 +1,47 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import metrics
+import request_stats
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def ended(monkeypatch):
+    tokens = []
+    end = request_stats.end
+
+    def spy(token):
+        tokens.append(token)
+        end(token)
+    monkeypatch.setattr(request_stats, 'end', spy)
+    return tokens
+
+
+def _in_flight():
+    return metrics.HTTP_IN_FLIGHT.labels('GET').value
+
+
+def test_request_is_timed_and_accounted(client, ended):
+    before = metrics.HTTP_REQUESTS.labels('GET', '/health', '200').value
+    response = client.get('/health')
+    assert response.status_code == 200
+    assert response.headers['Server-Timing'].startswith('app;dur=')
+    assert metrics.HTTP_REQUESTS.labels('GET', '/health', '200').value == before + 1
+    assert _in_flight() == 0
+    assert len(ended) == 1
+
+
+def test_failing_accounting_still_releases_the_request(client, ended, monkeypatch):
+    def broken(scope):
+        raise RuntimeError('labelling failed')
+    monkeypatch.setattr(metrics, 'route_label', broken)
+    with pytest.raises(RuntimeError):
+        client.get('/health')
+    assert _in_flight() == 0
+    assert len(ended) == 1
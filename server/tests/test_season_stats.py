@@ -0,0 +1,110 @@
+import season_stats
+from season_stats import AGGREGATE_COLUMNS
+
+
+class SeasonTableCursor:
+    """Applies the upserts and deletes apply_change() issues to an in-memory player_season_stats"""
+
+    def __init__(self):
+        self.table = {}
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        sql = ' '.join(sql.split())
+        self.statements.append((sql, params))
+        if sql.startswith("INSERT INTO player_season_stats"):
+            player_id, season, *values = params
+            row = self.table.setdefault((player_id, season), dict.fromkeys(AGGREGATE_COLUMNS, 0))
+            for column, value in zip(AGGREGATE_COLUMNS, values):
+                row[column] += value
+        elif sql.startswith("DELETE FROM player_season_stats"):
+            if self.table[params]['appearances'] <= 0:
+                del self.table[params]
+
+
+def _line(player_id, season, **stats):
+    return {'player_id': player_id, 'season_start_year': season, 'started': 1, 'minutes': 90,
+            'passing_accuracy': None, **stats}
+
+
+def test_insert_update_delete_keep_the_totals():
+    cursor = SeasonTableCursor()
+    first = _line(7, 2024, goals=1, passing_accuracy=80)
+    second = _line(7, 2024, goals=2, started=0, minutes=30)
+    season_stats.apply_change(cursor, None, first)
+    season_stats.apply_change(cursor, None, second)
+
+    row = cursor.table[(7, 2024)]
+    assert (row['appearances'], row['starts'], row['minutes'], row['goals']) == (2, 1, 120, 3)
+    # Only the non-null accuracy counts, as AVG() would
+    assert (row['passing_accuracy_sum'], row['passing_accuracy_count']) == (80, 1)
+
+    corrected = dict(second, goals=0, passing_accuracy=70)
+    season_stats.apply_change(cursor, second, corrected)
+    assert cursor.table[(7, 2024)]['goals'] == 1
+    assert cursor.table[(7, 2024)]['passing_accuracy_count'] == 2
+
+    season_stats.apply_change(cursor, first, None)
+    season_stats.apply_change(cursor, corrected, None)
+    # The last appearance going removes the row
+    assert cursor.table == {}
+
+
+def test_moving_a_line_to_another_player_or_season():
+    cursor = SeasonTableCursor()
+    line = _line(7, 2024, goals=1)
+    season_stats.apply_change(cursor, None, line)
+    moved = dict(line, player_id=8, season_start_year=2025)
+    season_stats.apply_change(cursor, line, moved)
+    assert list(cursor.table) == [(8, 2025)]
+    assert cursor.table[(8, 2025)]['goals'] == 1
+
+
+def test_unchanged_line_writes_nothing():
+    cursor = SeasonTableCursor()
+    line = _line(7, 2024, goals=1)
+    season_stats.apply_change(cursor, line, dict(line))
+    assert cursor.statements == []
+
+
+def test_lines_without_a_player_are_ignored():
+    cursor = SeasonTableCursor()
+    season_stats.apply_change(cursor, None, _line(None, 2024))
+    assert cursor.statements == []
+
+
+def test_rows_are_written_in_key_order():
+    cursor = SeasonTableCursor()
+    season_stats.apply_change(cursor, _line(9, 2024), _line(3, 2025))
+    assert [params[:2] for sql, params in cursor.statements if sql.startswith('INSERT')] == [(3, 2025), (9, 2024)]
+
+
+def test_remove_match_subtracts_that_match_only():
+    cursor = SeasonTableCursor()
+    season_stats.remove_match(cursor, 42)
+    (update, update_params), (delete, delete_params) = cursor.statements
+    assert update.startswith("UPDATE player_season_stats s JOIN ( SELECT pms.player_id,")
+    assert "WHERE pms.player_id IS NOT NULL AND pms.match_id = %s" in update
+    for column in AGGREGATE_COLUMNS:
+        assert f"s.{column} = s.{column} - d.{column}" in update
+    assert update_params == (42,)
+    assert delete.startswith("DELETE s FROM player_season_stats s")
+    assert "s.appearances <= 0" in delete
+    assert delete_params == (42,)
+
+
+def test_summaries():
+    row = dict.fromkeys(AGGREGATE_COLUMNS, 0)
+    row.update(appearances=2, minutes=180, goals=3, passing_accuracy_sum=150, passing_accuracy_count=2)
+    summary = season_stats.summarize(row)
+    assert summary['avg_passing_accuracy'] == 75.0
+    assert summary['per_90']['goals'] == 1.5
+    assert 'passing_accuracy_sum' not in summary
+
+    empty = season_stats.summarize(dict.fromkeys(AGGREGATE_COLUMNS, 0))
+    assert empty['avg_passing_accuracy'] is None and empty['per_90']['goals'] is None
+
+    assert season_stats.career([row, row])['goals'] == 6
+    assert season_stats.season_label(2024) == '2024/25'
+    assert season_stats.season_label(1999) == '1999/00'
+    assert season_stats.season_label(season_stats.UNDATED_SEASON) is None
@@ -0,0 +1,150 @@
+import asyncio
+
+import mysql.connector
+import orjson
+import pytest
+from fastapi import HTTPException
+
+import streaming
+
+ROWS = [{'id': i} for i in range(5)]
+
+
+class FakeCursor:
+    def __init__(self, rows, fail=False):
+        self.rows = list(rows)
+        self.fail = fail
+
+    def execute(self, query, params):
+        if self.fail:
+            raise mysql.connector.ProgrammingError(msg='bad query')
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, rows=ROWS, fail=False):
+        self._cursor = FakeCursor(rows, fail)
+        self.released = None
+
+    def cursor(self, dictionary=False):
+        return self._cursor
+
+    def close(self):
+        self.released = self.released or 'closed'
+
+    def discard(self):
+        self.released = self.released or 'discarded'
+
+
+class FakeAsyncCursor(FakeCursor):
+    async def execute(self, query, params):
+        FakeCursor.execute(self, query, params)
+
+    async def fetchmany(self, size):
+        return FakeCursor.fetchmany(self, size)
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncConnection(FakeConnection):
+    def __init__(self, rows=ROWS, fail=False):
+        super().__init__()
+        self._cursor = FakeAsyncCursor(rows, fail)
+
+    async def cursor(self, dictionary=False):
+        return self._cursor
+
+    async def close(self):
+        FakeConnection.close(self)
+
+    async def discard(self):
+        FakeConnection.discard(self)
+
+
+class FakeAsyncPool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def acquire(self):
+        return self.connection
+
+
+@pytest.fixture(params=['sync', 'async'])
+def open_stream(request, monkeypatch):
+    """Returns (connection, make_response) for either data-access path"""
+    def make(fmt='ndjson', **kwargs):
+        if request.param == 'sync':
+            connection = FakeConnection(**kwargs)
+            monkeypatch.setattr(streaming, 'get_db_connection', lambda: connection)
+            monkeypatch.setattr(streaming, 'discard_connection', lambda conn: conn.discard())
+            return connection, lambda: streaming.stream_query("SELECT", (), fmt, batch_size=2)
+        connection = FakeAsyncConnection(**kwargs)
+        monkeypatch.setattr(streaming, 'get_async_pool', lambda: FakeAsyncPool(connection))
+        return connection, lambda: streaming.astream_query("SELECT", (), fmt, batch_size=2)
+    return make
+
+
+async def _build(factory):
+    response = factory()
+    return await response if asyncio.iscoroutine(response) else response
+
+
+def _run(factory, receive, send):
+    async def main():
+        response = await _build(factory)
+        await response({'type': 'http'}, receive, send)
+    asyncio.run(main())
+
+
+def _collect(factory):
+    chunks = []
+
+    async def receive():
+        await asyncio.sleep(10)
+
+    async def send(message):
+        if message['type'] == 'http.response.body':
+            chunks.append(message['body'])
+    _run(factory, receive, send)
+    return b''.join(chunks)
+
+
+def test_finished_stream_returns_the_connection(open_stream):
+    connection, factory = open_stream('ndjson')
+    body = _collect(factory)
+    assert [orjson.loads(line) for line in body.splitlines()] == ROWS
+    assert connection.released == 'closed'
+
+
+def test_json_format(open_stream):
+    connection, factory = open_stream('json')
+    assert orjson.loads(_collect(factory)) == {'status': 'success', 'data': ROWS, 'count': 5}
+
+
+def test_disconnect_before_the_first_chunk_discards_the_connection(open_stream):
+    connection, factory = open_stream()
+
+    async def receive():
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        # Slow enough that the disconnect cancels the response before the body starts
+        await asyncio.sleep(1)
+
+    _run(factory, receive, send)
+    assert connection.released == 'discarded'
+
+
+def test_query_error_is_a_500_and_discards_the_connection(open_stream):
+    connection, factory = open_stream(fail=True)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(_build(factory))
+    assert exc.value.status_code == 500
+    assert connection.released == 'discarded'
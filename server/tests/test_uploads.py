@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import uploads
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+
+
+def test_spool_upload_hashes_and_sniffs(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, 'UPLOAD_CHUNK_SIZE', 16)    # several chunks
+    upload = uploads.spool_upload(io.BytesIO(PNG), max_bytes=1024, directory=str(tmp_path))
+    assert upload.sha256 == hashlib.sha256(PNG).hexdigest()
+    assert upload.size == len(PNG)
+    assert upload.content_type == 'image/png'
+    with open(upload.path, 'rb') as f:
+        assert f.read() == PNG
+    upload.discard()
+    assert not os.path.exists(upload.path)
+    upload.discard()    # already gone
+
+
+def test_spool_upload_rejects_oversized_bodies(tmp_path):
+    with pytest.raises(uploads.UploadTooLarge):
+        uploads.spool_upload(io.BytesIO(PNG), max_bytes=50, directory=str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize('head, content_type', [
+    (b'\xff\xd8\xff\xe0', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'RIFF\x00\x00\x00\x00WEBPVP8 ', 'image/webp'),
+    (b'RIFF\x00\x00\x00\x00WAVE', None),
+    (b'<svg xmlns=', None),
+])
+def test_sniff_image_type(head, content_type):
+    assert uploads.sniff_image_type(head) == content_type
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.post('/upload')
+    async def upload(request: Request):
+        return {'size': len(await request.body())}
+
+    @app.post('/other')
+    async def other(request: Request):
+        return {'size': len(await request.body())}
+
+    app.add_middleware(uploads.UploadLimitMiddleware, paths=['/upload'], max_body_bytes=100)
+    return TestClient(app)
+
+
+def test_body_within_limit_passes(client):
+    response = client.post('/upload', content=b'x' * 100)
+    assert response.status_code == 200
+    assert response.json() == {'size': 100}
+
+
+def test_declared_length_over_limit_is_rejected_up_front(client):
+    response = client.post('/upload', content=b'x' * 101)
+    assert response.status_code == 413
+
+
+def test_chunked_body_is_cut_off_while_streaming(client):
+    # No Content-Length, so only the running count can catch it
+    response = client.post('/upload', content=iter([b'x' * 60, b'x' * 60]))
+    assert response.status_code == 413
+
+
+def test_other_paths_are_not_limited(client):
+    assert client.post('/other', content=b'x' * 500).status_code == 200
+
+
+def _scope(path='/upload'):
+    return {'type': 'http', 'method': 'POST', 'path': path, 'headers': []}
+
+
+def test_concurrent_uploads_over_the_cap_get_503():
+    release = asyncio.Event()
+    statuses = []
+
+    async def app(scope, receive, send):
+        await release.wait()
+        await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            statuses.append(message['status'])
+
+    async def main():
+        middleware = uploads.UploadLimitMiddleware(app, ['/upload'], max_concurrent=1)
+        first = asyncio.ensure_future(middleware(_scope(), receive, send))
+        await asyncio.sleep(0)
+        assert middleware._active == 1
+        await middleware(_scope(), receive, send)
+        assert statuses == [503]
+        release.set()
+        await first
+        assert middleware._active == 0
+        # The slot is free again
+        await middleware(_scope(), receive, send)
+
+    asyncio.run(main())
+    assert statuses == [503, 200, 200]
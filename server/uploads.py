@@ -0,0 +1,135 @@
+"""Bounded, streaming handling of photo uploads: spooling, type sniffing and per-process limits"""
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+
+PHOTO_MAX_BYTES = int(os.getenv('PHOTO_MAX_BYTES') or 10 * 1024 * 1024)
+MAX_CONCURRENT_UPLOADS = int(os.getenv('MAX_CONCURRENT_UPLOADS') or 4)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Room for the multipart boundaries and the other form fields on top of the photo itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Magic bytes -> content type; the client-supplied Content-Type is never trusted
+_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    for magic, content_type in _SIGNATURES:
+        if head.startswith(magic):
+            return content_type
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+@dataclass
+class SpooledUpload:
+    path: str
+    sha256: str
+    size: int
+    content_type: Optional[str]
+
+    def discard(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def spool_upload(src, max_bytes: int = PHOTO_MAX_BYTES, directory: Optional[str] = None) -> SpooledUpload:
+    """Copy a file-like object to a temp file in chunks, hashing and sniffing as it goes.
+
+    Raises UploadTooLarge as soon as more than `max_bytes` have been read, so memory use stays
+    at one chunk no matter what the client sends. Blocking; run it in the threadpool.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    head = b''
+    fd, path = tempfile.mkstemp(dir=directory, prefix='upload-')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = src.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"File too large. Maximum size is {max_bytes} bytes.")
+                if len(head) < 16:
+                    head += chunk[:16 - len(head)]
+                hasher.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return SpooledUpload(path, hasher.hexdigest(), size, sniff_image_type(head))
+
+
+class UploadLimitMiddleware:
+    """ASGI middleware for the upload endpoints.
+
+    Rejects bodies over `max_body_bytes` (up front from Content-Length, and while streaming for
+    chunked requests) and caps concurrent uploads per process, answering 503 instead of queueing.
+    """
+
+    def __init__(self, app, paths, max_body_bytes: int = PHOTO_MAX_BYTES + MULTIPART_OVERHEAD_BYTES,
+                 max_concurrent: int = MAX_CONCURRENT_UPLOADS):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_body_bytes = max_body_bytes
+        self.max_concurrent = max_concurrent
+        self._active = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['path'] not in self.paths or scope['method'] != 'POST':
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope['headers']).get(b'content-length')
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            await JSONResponse(status_code=413, content={"detail": "Request body too large"})(scope, receive, send)
+            return
+
+        # The event loop is single-threaded, so a plain counter is enough here
+        if self._active >= self.max_concurrent:
+            response = JSONResponse(status_code=503, content={"detail": "Too many concurrent uploads, try again shortly"},
+                                    headers={"Retry-After": "1"})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > self.max_body_bytes:
+                    raise HTTPException(status_code=413, detail="Request body too large")
+            return message
+
+        self._active += 1
+        try:
+            await self.app(scope, limited_receive, send)
+        finally:
+            self._active -= 1
+
+
+async def read_upload(file, store, max_bytes: int = PHOTO_MAX_BYTES) -> SpooledUpload:
+    # Starlette has already spooled the part to a SpooledTemporaryFile; one threadpool hop copies it
+    return await run_in_threadpool(spool_upload, file.file, max_bytes, store.staging_dir())